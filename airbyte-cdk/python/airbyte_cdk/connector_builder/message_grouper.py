@@ -20,6 +20,7 @@ from airbyte_cdk.connector_builder.models import (
 )
 from airbyte_cdk.entrypoint import AirbyteEntrypoint
 from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
+from airbyte_cdk.sources.message import StructuredLogMessage
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils import AirbyteTracedException
@@ -256,6 +257,9 @@ class MessageGrouper:
         # TODO: As a temporary stopgap, the CDK emits request/response data as a log message string. Ideally this should come in the
         # form of a custom message object defined in the Airbyte protocol, but this unblocks us in the immediate while the
         # protocol change is worked on.
+        if isinstance(log_message, StructuredLogMessage):
+            # Messages from the message repository keep their content so that full response bodies are not parsed back
+            return log_message.content
         try:
             json_object: JsonType = json.loads(log_message.message)
             return json_object
@@ -3,5 +3,6 @@
 #
 
 from .destination import Destination
+from .record_buffer import RecordBuffer
 
-__all__ = ["Destination"]
+__all__ = ["Destination", "RecordBuffer"]
@@ -4,6 +4,7 @@
 
 import argparse
 import io
+import json
 import logging
 import sys
 from abc import ABC, abstractmethod
@@ -11,7 +12,7 @@ from typing import Any, Iterable, List, Mapping
 
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pydantic import ValidationError
@@ -21,6 +22,9 @@ logger = logging.getLogger("airbyte")
 
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
+    # configure whether the record messages read from stdin are validated against the Airbyte protocol models. Destinations receiving
+    # large volumes of records can disable it to hand records to `write()` without validating each of them
+    validate_input_records: bool = True
 
     @abstractmethod
     def write(
@@ -36,10 +40,20 @@ class Destination(Connector, ABC):
         """Reads from stdin, converting to Airbyte messages"""
         for line in input_stream:
             try:
-                yield AirbyteMessage.parse_raw(line)
-            except ValidationError:
+                yield self._parse_input_message(line)
+            except (ValidationError, ValueError):
                 logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
 
+    def _parse_input_message(self, line: str) -> AirbyteMessage:
+        if self.validate_input_records:
+            return AirbyteMessage.parse_raw(line)
+
+        message = json.loads(line)
+        if isinstance(message, dict) and message.get("type") == Type.RECORD.value and isinstance(message.get("record"), dict):
+            # Records are the bulk of the input so they are built without validation. Their data is the decoded JSON as is
+            return AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(**message["record"]))
+        return AirbyteMessage.parse_obj(message)
+
     def _run_write(
         self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
     ) -> Iterable[AirbyteMessage]:
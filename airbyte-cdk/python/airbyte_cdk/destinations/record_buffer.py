@@ -0,0 +1,42 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+# The buffered records are flushed once either limit is reached, even if no state message was received
+BUFFER_MAX_ROWS = 50_000
+BUFFER_MAX_BYTES = 64 * 1024 * 1024
+
+Row = Tuple[Any, ...]
+
+
+class RecordBuffer:
+    """
+    Buffers the rows to insert per stream and reports when it is full, so that sources emitting state messages rarely don't make the
+    destination run out of memory. The size of a row is approximated by the length of its string values, e.g. its serialized data.
+    """
+
+    def __init__(self, max_rows: int = BUFFER_MAX_ROWS, max_bytes: int = BUFFER_MAX_BYTES):
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._rows: Dict[str, List[Row]] = defaultdict(list)
+        self._row_count = 0
+        self._byte_count = 0
+
+    def add(self, stream_name: str, row: Row) -> None:
+        self._rows[stream_name].append(row)
+        self._row_count += 1
+        self._byte_count += sum(len(value) for value in row if isinstance(value, (str, bytes)))
+
+    @property
+    def is_full(self) -> bool:
+        return self._row_count >= self._max_rows or self._byte_count >= self._max_bytes
+
+    def pop_all(self) -> Dict[str, List[Row]]:
+        rows = self._rows
+        self._rows = defaultdict(list)
+        self._row_count = 0
+        self._byte_count = 0
+        return rows
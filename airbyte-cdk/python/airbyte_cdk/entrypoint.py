@@ -5,6 +5,7 @@
 import argparse
 import importlib
 import ipaddress
+import json
 import logging
 import os.path
 import socket
@@ -26,12 +27,14 @@ from airbyte_cdk.utils import is_cloud_environment
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+from pydantic import BaseModel
 from requests import PreparedRequest, Response, Session
 
 logger = init_logger("airbyte")
 
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
+_RECORD_MESSAGE_FIELDS = {"type", "record"}
 
 
 class AirbyteEntrypoint(object):
@@ -106,14 +109,14 @@ class AirbyteEntrypoint(object):
                     config = self.source.configure(raw_config, temp_dir)
 
                     if cmd == "check":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.check(source_spec, config))
+                        yield from map(self.airbyte_message_to_string, self.check(source_spec, config))
                     elif cmd == "discover":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.discover(source_spec, config))
+                        yield from map(self.airbyte_message_to_string, self.discover(source_spec, config))
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state))
+                        yield from map(self.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state))
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
@@ -174,6 +177,8 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> Any:
+        if airbyte_message.type == Type.RECORD and airbyte_message.__fields_set__ == _RECORD_MESSAGE_FIELDS:
+            return _record_message_to_string(airbyte_message)
         return airbyte_message.json(exclude_unset=True)
 
     @classmethod
@@ -206,8 +211,28 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
+    # Messages are written to sys.stdout rather than to a separate buffer so they stay ordered with the log and trace messages
+    # printed by the logger
+    write = sys.stdout.write
     for message in source_entrypoint.run(parsed_args):
-        print(message)
+        write(f"{message}\n")
+
+
+def _record_message_to_string(airbyte_message: AirbyteMessage) -> str:
+    """
+    Serialize a record message without going through pydantic's `dict()` and `json()`, which copy the whole record before dumping it.
+    The output is the same as `airbyte_message.json(exclude_unset=True)`.
+    """
+    record = airbyte_message.record
+    record_fields = {field: value for field, value in record.__dict__.items() if field in record.__fields_set__}
+    return f'{{"type": "RECORD", "record": {json.dumps(record_fields, default=_pydantic_json_default)}}}'
+
+
+def _pydantic_json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        # pydantic's json() propagates exclude_unset to the models nested in a message
+        return value.dict(exclude_unset=True)
+    return AirbyteMessage.__json_encoder__(value)
 
 
 def _init_internal_request_filter() -> None:
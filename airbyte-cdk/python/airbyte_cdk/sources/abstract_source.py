@@ -3,6 +3,7 @@
 #
 
 import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
@@ -16,6 +17,7 @@ from airbyte_cdk.models import (
     ConfiguredAirbyteStream,
     Status,
     SyncMode,
+    TraceType,
 )
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
@@ -27,7 +29,8 @@ from airbyte_cdk.sources.streams.http.http import HttpStream
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.utils.concurrent_iterators import iterate_concurrently
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -62,6 +65,12 @@ class AbstractSource(Source, ABC):
     # Stream name to instance map for applying output object transformation
     _stream_to_instance_map: Dict[str, Stream] = {}
     _slice_logger: SliceLogger = DebugSliceLogger()
+    # Guards the state manager as the state of every stream is read to create legacy state messages. Created per source on first use.
+    _state_lock: Optional[threading.Lock] = None
+    # Guards the creation of the state lock of the sources
+    _state_lock_creation_lock = threading.Lock()
+
+    MAX_BUFFERED_MESSAGES = 10_000
 
     @property
     def name(self) -> str:
@@ -100,50 +109,15 @@ class AbstractSource(Source, ABC):
         state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
         self._stream_to_instance_map = stream_instances
         with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    if not self.raise_exception_on_missing_stream:
-                        continue
-                    raise KeyError(
-                        f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
-                        f"Refresh the schema in replication settings and remove this stream from future sync attempts."
-                    )
-
-                try:
-                    self._apply_log_level_to_stream_logger(logger, stream_instance)
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    stream_is_available, reason = stream_instance.check_availability(logger, self)
-                    if not stream_is_available:
-                        logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
-                        continue
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
-                except AirbyteTracedException as e:
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    raise e
-                except Exception as e:
-                    yield from self._emit_queued_messages()
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
+            if self.n_concurrent_stream_reads > 1:
+                yield from self._read_streams_concurrently(logger, catalog, stream_instances, state_manager, internal_config)
+            else:
+                for configured_stream in catalog.streams:
+                    stream_instance = self._get_stream_instance(configured_stream, stream_instances)
+                    if stream_instance:
+                        yield from self._read_configured_stream(
+                            logger, configured_stream, stream_instance, state_manager, internal_config, timer
+                        )
 
         logger.info(f"Finished syncing {self.name}")
 
@@ -155,6 +129,133 @@ class AbstractSource(Source, ABC):
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def n_concurrent_stream_reads(self) -> int:
+        """
+        The number of configured streams read at once. Override to read independent streams concurrently: the messages of each stream keep
+        their order but the messages of different streams are interleaved.
+
+        The streams share the message repository of the source: its queued messages are emitted by whichever stream drains it first, so
+        a log or control message can be emitted among the messages of another stream than the one it was queued by.
+        """
+        return 1
+
+    def _get_stream_instance(self, configured_stream: ConfiguredAirbyteStream, stream_instances: Mapping[str, Stream]) -> Optional[Stream]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance and self.raise_exception_on_missing_stream:
+            raise KeyError(
+                f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
+                f"Refresh the schema in replication settings and remove this stream from future sync attempts."
+            )
+        return stream_instance
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instance: Stream,
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        try:
+            self._apply_log_level_to_stream_logger(logger, stream_instance)
+            timer.start_event(f"Syncing stream {configured_stream.stream.name}")
+            stream_is_available, reason = stream_instance.check_availability(logger, self)
+            if not stream_is_available:
+                logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
+                return
+            logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
+        except AirbyteTracedException as e:
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            raise e
+        except Exception as e:
+            yield from self._emit_queued_messages()
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event()
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Read up to `n_concurrent_stream_reads` streams at once and yield their messages as they are produced.
+
+        The workers share one bounded queue so a slow consumer pauses them instead of accumulating records in memory. The first stream
+        failing stops the other reads and its exception is raised once the messages produced before it were yielded, as in a sequential
+        read. The streams stopped that way are marked as INCOMPLETE.
+        """
+        streams_to_read = [
+            (configured_stream, stream_instance)
+            for configured_stream in catalog.streams
+            if (stream_instance := self._get_stream_instance(configured_stream, stream_instances))
+        ]
+        messages = iterate_concurrently(
+            (
+                self._read_configured_stream_with_timer(logger, configured_stream, stream_instance, state_manager, internal_config)
+                for configured_stream, stream_instance in streams_to_read
+            ),
+            n_workers=self.n_concurrent_stream_reads,
+            max_buffered_items=self.MAX_BUFFERED_MESSAGES,
+            preserve_order=False,
+            thread_name_prefix="stream_reader",
+        )
+        configured_streams = {
+            (configured_stream.stream.name, configured_stream.stream.namespace): configured_stream for configured_stream, _ in streams_to_read
+        }
+        streams_in_progress: Dict[Tuple[str, Optional[str]], ConfiguredAirbyteStream] = {}
+        try:
+            for message in messages:
+                if message.type == MessageType.TRACE and message.trace.type == TraceType.STREAM_STATUS:
+                    stream_descriptor = message.trace.stream_status.stream_descriptor
+                    stream_key = (stream_descriptor.name, stream_descriptor.namespace)
+                    if message.trace.stream_status.status == AirbyteStreamStatus.STARTED:
+                        streams_in_progress[stream_key] = configured_streams[stream_key]
+                    elif message.trace.stream_status.status in (AirbyteStreamStatus.COMPLETE, AirbyteStreamStatus.INCOMPLETE):
+                        streams_in_progress.pop(stream_key, None)
+                yield message
+        except Exception:
+            # the reads of the other streams were stopped before they could emit a terminal status
+            for configured_stream in streams_in_progress.values():
+                logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+                yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            raise
+
+    def _read_configured_stream_with_timer(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instance: Stream,
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+    ) -> Iterator[AirbyteMessage]:
+        # Each stream has its own timer as events are nested in the order they are started
+        with create_timer(self.name) as timer:
+            yield from self._read_configured_stream(logger, configured_stream, stream_instance, state_manager, internal_config, timer)
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -297,16 +398,25 @@ class AbstractSource(Source, ABC):
                 if internal_config.is_limit_reached(total_records_counter):
                     return
 
+    def _get_state_lock(self) -> threading.Lock:
+        # The lock is created lazily as subclasses are not required to call the constructor of AbstractSource
+        if self._state_lock is None:
+            with AbstractSource._state_lock_creation_lock:
+                if self._state_lock is None:
+                    self._state_lock = threading.Lock()
+        return self._state_lock
+
     def _checkpoint_state(self, stream: Stream, stream_state: Mapping[str, Any], state_manager: ConnectorStateManager) -> AirbyteMessage:
         # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
         # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
         # instance's deprecated get_updated_state() method.
-        try:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream.state)  # type: ignore # we know the field might not exist...
+        with self._get_state_lock():
+            try:
+                state_manager.update_state_for_stream(stream.name, stream.namespace, stream.state)  # type: ignore # we know the field might not exist...
 
-        except AttributeError:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream_state)
-        return state_manager.create_state_message(stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled)
+            except AttributeError:
+                state_manager.update_state_for_stream(stream.name, stream.namespace, stream_state)
+            return state_manager.create_state_message(stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled)
 
     @staticmethod
     def _apply_log_level_to_stream_logger(logger: logging.Logger, stream_instance: Stream) -> None:
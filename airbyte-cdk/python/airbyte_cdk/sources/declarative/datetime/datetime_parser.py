@@ -3,7 +3,24 @@
 #
 
 import datetime
-from typing import Union
+import re
+from functools import lru_cache
+from typing import Callable, Optional, Union
+
+# Patterns used by strptime for the directives that can be parsed without it
+_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "f": r"(?P<f>[0-9]{1,6})",
+    "z": r"(?P<z>[+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|(?-i:Z))",
+    "%": "%",
+}
+_REGEX_CHARACTERS = re.compile(r"([\\.^$*+?\(\){}\[\]|])")
+_WHITESPACES = re.compile(r"\s+")
 
 
 class DatetimeParser:
@@ -14,26 +31,17 @@ class DatetimeParser:
 
     %s is part of the list of format codes required by  the 1989 C standard, but it is unreliable because it always return a datetime in the system's timezone.
     Instead of using the directive directly, we can use datetime.fromtimestamp and dt.timestamp()
+
+    Cursors parse the cursor value of every record so the dates parsed most recently are cached, and formats made only of numeric
+    directives (e.g. ISO-8601 formats) are parsed with a precompiled parser instead of strptime.
     """
 
     _UNIX_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
 
     def parse(self, date: Union[str, int], format: str) -> datetime.datetime:
-        # "%s" is a valid (but unreliable) directive for formatting, but not for parsing
-        # It is defined as
-        # The number of seconds since the Epoch, 1970-01-01 00:00:00+0000 (UTC). https://man7.org/linux/man-pages/man3/strptime.3.html
-        #
-        # The recommended way to parse a date from its timestamp representation is to use datetime.fromtimestamp
-        # See https://stackoverflow.com/a/4974930
-        if format == "%s":
-            return datetime.datetime.fromtimestamp(int(date), tz=datetime.timezone.utc)
-        elif format == "%ms":
-            return self._UNIX_EPOCH + datetime.timedelta(milliseconds=int(date))
-
-        parsed_datetime = datetime.datetime.strptime(str(date), format)
-        if self._is_naive(parsed_datetime):
-            return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
-        return parsed_datetime
+        if isinstance(date, (str, int)):
+            return _parse_cached(date, format)
+        return _parse(date, format)
 
     def format(self, dt: datetime.datetime, format: str) -> str:
         # strftime("%s") is unreliable because it ignores the time zone information and assumes the time zone of the system it's running on
@@ -48,4 +56,98 @@ class DatetimeParser:
             return dt.strftime(format)
 
     def _is_naive(self, dt: datetime.datetime) -> bool:
-        return dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None
+        return _is_naive(dt)
+
+
+def _parse(date: Union[str, int], format: str) -> datetime.datetime:
+    # "%s" is a valid (but unreliable) directive for formatting, but not for parsing
+    # It is defined as
+    # The number of seconds since the Epoch, 1970-01-01 00:00:00+0000 (UTC). https://man7.org/linux/man-pages/man3/strptime.3.html
+    #
+    # The recommended way to parse a date from its timestamp representation is to use datetime.fromtimestamp
+    # See https://stackoverflow.com/a/4974930
+    if format == "%s":
+        return datetime.datetime.fromtimestamp(int(date), tz=datetime.timezone.utc)
+    elif format == "%ms":
+        return DatetimeParser._UNIX_EPOCH + datetime.timedelta(milliseconds=int(date))
+
+    compiled_parser = _compile_parser(format)
+    if compiled_parser:
+        return compiled_parser(str(date))
+    parsed_datetime = datetime.datetime.strptime(str(date), format)
+    if _is_naive(parsed_datetime):
+        return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+    return parsed_datetime
+
+
+_parse_cached = lru_cache(maxsize=1024, typed=True)(_parse)
+
+
+def _is_naive(dt: datetime.datetime) -> bool:
+    return dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None
+
+
+@lru_cache(maxsize=128)
+def _compile_parser(format: str) -> Optional[Callable[[str], datetime.datetime]]:
+    """
+    Return a parser equivalent to strptime followed by setting naive datetimes to UTC, or None if the format has directives this parser
+    does not handle. The format is turned into a regular expression the same way strptime does it.
+    """
+    pattern = _WHITESPACES.sub(r"\\s+", _REGEX_CHARACTERS.sub(r"\\\1", format))
+    parts = pattern.split("%")
+    processed_pattern = parts[0]
+    directives = set()
+    index = 1
+    while index < len(parts):
+        part = parts[index]
+        if part == "" and index + 1 < len(parts):
+            # "%%" is a literal percent sign
+            processed_pattern += "%" + parts[index + 1]
+            index += 2
+            continue
+        if not part or part[0] not in _DIRECTIVE_PATTERNS or part[0] in directives:
+            return None
+        directives.add(part[0])
+        processed_pattern += _DIRECTIVE_PATTERNS[part[0]] + part[1:]
+        index += 1
+    if not {"Y", "m", "d"}.issubset(directives):
+        return None
+    regex = re.compile(processed_pattern, re.IGNORECASE)
+
+    def parse(date: str) -> datetime.datetime:
+        found = regex.match(date)
+        if not found:
+            raise ValueError(f"time data {date!r} does not match format {format!r}")
+        if len(date) != found.end():
+            raise ValueError(f"unconverted data remains: {date[found.end():]}")
+        fraction = found["f"] if "f" in directives else None
+        return datetime.datetime(
+            int(found["Y"]),
+            int(found["m"]),
+            int(found["d"]),
+            int(found["H"]) if "H" in directives else 0,
+            int(found["M"]) if "M" in directives else 0,
+            int(found["S"]) if "S" in directives else 0,
+            int(fraction + "0" * (6 - len(fraction))) if fraction else 0,
+            _parse_utc_offset(found["z"]) if "z" in directives else datetime.timezone.utc,
+        )
+
+    return parse
+
+
+def _parse_utc_offset(z: str) -> datetime.timezone:
+    if z == "Z":
+        return datetime.timezone(datetime.timedelta(0))
+    offset = z
+    if z[3] == ":":
+        offset = z[:3] + z[4:]
+        if len(offset) > 5:
+            if offset[5] != ":":
+                raise ValueError(f"Inconsistent use of : in {z}")
+            offset = offset[:5] + offset[6:]
+    seconds = int(offset[1:3]) * 60 * 60 + int(offset[3:5]) * 60 + int(offset[5:7] or 0)
+    remainder = offset[8:]
+    microseconds = int(remainder + "0" * (6 - len(remainder)))
+    if offset.startswith("-"):
+        seconds, microseconds = -seconds, -microseconds
+    return datetime.timezone(datetime.timedelta(seconds=seconds, microseconds=microseconds))
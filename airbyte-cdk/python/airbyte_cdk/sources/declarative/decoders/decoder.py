@@ -3,6 +3,7 @@
 #
 
 from abc import abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, List, Mapping, Union
 
@@ -23,3 +24,41 @@ class Decoder:
         :return: Mapping or array describing the response
         """
         pass
+
+    def decode_items(self, response: requests.Response, path: List[str]) -> List[Any]:
+        """
+        Decodes the value found under a path of keys and list indexes.
+
+        If the value is an array, its items are returned.
+        If the value is an object or a scalar, it is returned wrapped as an array.
+        If the value is empty or does not exist, an empty array is returned.
+
+        Decoders that can find the value without decoding the whole response override this method.
+        :param response: the response to decode
+        :param path: the keys and list indexes leading to the value to decode
+        :return: the items of the value
+        """
+        value = _get_path_value(self.decode(response), path)
+        if isinstance(value, list):
+            return value
+        return [value] if value else []
+
+
+def _get_path_value(obj: Any, path: List[str]) -> Any:
+    """
+    Equivalent of `dpath.util.get` for a path without glob characters. dpath walks the whole object to find the paths matching the glob
+    while a path without glob can only match the value found by following its segments.
+    """
+    for segment in path:
+        if isinstance(obj, Mapping):
+            if segment not in obj:
+                return None
+            obj = obj[segment]
+        elif isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+            # dpath matches list indexes against the string representation of the segments
+            if not segment.isdecimal() or str(int(segment)) != segment or int(segment) >= len(obj):
+                return None
+            obj = obj[int(segment)]
+        else:
+            return None
+    return obj
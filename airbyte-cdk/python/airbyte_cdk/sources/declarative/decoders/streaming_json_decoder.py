@@ -0,0 +1,204 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import re
+from dataclasses import InitVar, dataclass
+from json.scanner import make_scanner
+from typing import Any, Iterable, Iterator, List, Mapping
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+_ARRAY_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+_SCAN_ONCE = make_scanner(_JSON_DECODER)  # type: ignore  # the scanner is built from the settings of a JSONDecoder
+
+
+@dataclass
+class StreamingJsonDecoder(JsonDecoder):
+    """
+    Decoder strategy that parses the json-encoded content of a response incrementally.
+
+    The items found under a path are decoded while the body of the response is read one chunk at a time, so neither the whole text nor the
+    whole document are held in memory at once. The values next to the path are skipped without being kept. For a response requested with
+    `stream=True`, the body is read from the connection as it is decoded and the memory used is bounded by the chunk size and the items;
+    such a body can only be read once. Decoding the whole response, for example to read the next page token, behaves like the JsonDecoder.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    parameters: InitVar[Mapping[str, Any]]
+
+    def decode_items(self, response: requests.Response, path: List[str]) -> List[Any]:
+        """
+        Decodes the value found under a path of keys and list indexes.
+
+        If the value is an array, its items are returned.
+        If the value is an object or a scalar, it is returned wrapped as an array.
+        If the value is empty, does not exist or the response is not valid json, an empty array is returned.
+
+        :param response: the response to decode
+        :param path: the keys and list indexes leading to the value to decode
+        :return: the items of the value
+        """
+        reader = _JsonReader(_decode_chunks(response.iter_content(chunk_size=self.CHUNK_SIZE), response.encoding or "utf-8"))
+        try:
+            if not reader.seek(path):
+                return []
+            if reader.peek() == "[":
+                return list(reader.read_array_items())
+            value = reader.read_value()
+            return [value] if value else []
+        except json.JSONDecodeError:
+            return []
+
+
+def _decode_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+class _JsonReader:
+    """
+    Reads json values from chunks of text, keeping in memory only the text that was not read yet
+    """
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def seek(self, path: List[str]) -> bool:
+        """
+        Moves the reader to the value found under the path. Returns False if the path does not exist.
+        """
+        for segment in path:
+            next_character = self.peek()
+            if next_character == "{":
+                if not self._seek_key(segment):
+                    return False
+            elif next_character == "[":
+                if not self._seek_index(segment):
+                    return False
+            else:
+                return False
+        return True
+
+    def read_array_items(self) -> Iterable[Any]:
+        self._expect("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        while True:
+            # Fast path: the item and its separator are already buffered so the item is complete
+            try:
+                value, end = _SCAN_ONCE(self._buffer, self._position)
+                separator = _ARRAY_SEPARATOR.match(self._buffer, end)
+            except (StopIteration, json.JSONDecodeError):
+                separator = None
+            if separator:
+                self._position = separator.end()
+                yield value
+                if separator.group(1) == "]":
+                    return
+                continue
+
+            yield self.read_value()
+            if self._next_separator("]"):
+                return
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._position)
+                # A value ending with the buffer might continue in the next chunk (e.g. a number)
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            self._read_more()
+
+    def peek(self) -> str:
+        """
+        Returns the next character that is not a whitespace without consuming it, or an empty string if there is nothing left to read
+        """
+        while True:
+            non_whitespace = _NON_WHITESPACE.search(self._buffer, self._position)
+            if non_whitespace:
+                self._position = non_whitespace.start()
+                return self._buffer[self._position]
+            self._position = len(self._buffer)
+            if not self._read_more():
+                return ""
+
+    def _seek_key(self, key: str) -> bool:
+        self._expect("{")
+        if self.peek() == "}":
+            return False
+        while True:
+            current_key = self.read_value()
+            self._expect(":")
+            if current_key == key:
+                return True
+            self.read_value()
+            if self._next_separator("}"):
+                return False
+
+    def _seek_index(self, segment: str) -> bool:
+        if not segment.isdecimal() or str(int(segment)) != segment:
+            return False
+        self._expect("[")
+        if self.peek() == "]":
+            return False
+        for _ in range(int(segment)):
+            self.read_value()
+            if self._next_separator("]"):
+                return False
+        return True
+
+    def _next_separator(self, closing_character: str) -> bool:
+        """
+        Consumes the separator following a value in a container. Returns True if the container is closed.
+        """
+        next_character = self.peek()
+        if next_character == closing_character:
+            self._position += 1
+            return True
+        self._expect(",")
+        return False
+
+    def _expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise json.JSONDecodeError(f"Expecting '{character}'", self._buffer, self._position)
+        self._position += 1
+
+    def _read_more(self) -> bool:
+        """
+        Drops the text already read and appends chunks until the text left to read at least doubles so that values spanning many chunks
+        are not decoded more than a few times. Returns False if there was nothing left to read.
+        """
+        if self._exhausted:
+            return False
+        parts = [self._buffer[self._position :]]
+        self._position = 0
+        length = len(parts[0])
+        target_length = max(2 * length, 1)
+        for chunk in self._chunks:
+            parts.append(chunk)
+            length += len(chunk)
+            if length >= target_length:
+                self._buffer = "".join(parts)
+                return True
+        self._exhausted = True
+        self._buffer = "".join(parts)
+        return length > len(parts[0])
@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, List, Mapping, Optional, Union
 
 import dpath.util
 import requests
@@ -13,6 +13,8 @@ from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordEx
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config
 
+_GLOB_CHARACTERS = frozenset("*?[")
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -62,20 +64,27 @@ class DpathExtractor(RecordExtractor):
         for path_index in range(len(self.field_path)):
             if isinstance(self.field_path[path_index], str):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
+        # A path without interpolation evaluates to the same value for every response so it is only evaluated once
+        self._static_path: Optional[List[Any]] = None
+        if all(isinstance(path, InterpolatedString) and "{" not in path.string for path in self.field_path):
+            self._static_path = self._eval_path()
 
     def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+        path = self._static_path if self._static_path is not None else self._eval_path()
+        if not any(_GLOB_CHARACTERS.intersection(str(segment)) for segment in path):
+            return self.decoder.decode_items(response, [str(segment) for segment in path])
+
         response_body = self.decoder.decode(response)
-        if len(self.field_path) == 0:
-            extracted = response_body
+        if "*" in path:
+            extracted = dpath.util.values(response_body, path)
         else:
-            path = [path.eval(self.config) for path in self.field_path]
-            if "*" in path:
-                extracted = dpath.util.values(response_body, path)
-            else:
-                extracted = dpath.util.get(response_body, path, default=[])
+            extracted = dpath.util.get(response_body, path, default=[])
         if isinstance(extracted, list):
             return extracted
         elif extracted:
             return [extracted]
         else:
             return []
+
+    def _eval_path(self) -> List[Any]:
+        return [path.eval(self.config) for path in self.field_path]
@@ -3,7 +3,8 @@
 #
 
 import json
-from typing import Any, Callable, Iterable, Mapping, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Set
 
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
@@ -87,10 +88,10 @@ class PerPartitionStreamSlice(StreamSlice):
 
 
 class CursorFactory:
-    def __init__(self, create_function: Callable[[], StreamSlicer]):
+    def __init__(self, create_function: Callable[[], Cursor]):
         self._create_function = create_function
 
-    def create(self) -> StreamSlicer:
+    def create(self) -> Cursor:
         return self._create_function()
 
 
@@ -113,26 +114,48 @@ class PerPartitionCursor(Cursor):
     Between record #3 and #4 | Duplication | #1, #2
 
     Therefore, we need to manage state per partition.
+
+    Streams can have hundreds of thousands of partitions so only the cursors of the partitions being read are kept in memory. The other
+    partitions are kept as the state entries that are returned by `get_stream_state`, and these entries are only updated when a slice of
+    their partition is closed.
+
+    If `max_partitions_in_state` is set, the partitions whose state was updated the least recently are removed from the state once there are
+    more partitions than that. The lowest of their cursor states is kept under the `state` key and partitions without a state of their own,
+    including new partitions, start from it. The cursor created by the cursor factory needs to compare states as records with
+    `is_greater_than_or_equal`, which is the case of the DatetimeBasedCursor.
     """
 
     _NO_STATE = {}
     _NO_CURSOR_STATE = {}
     _KEY = 0
     _VALUE = 1
+    _MAX_CURSORS_IN_MEMORY = 1_000
 
-    def __init__(self, cursor_factory: CursorFactory, partition_router: StreamSlicer):
+    def __init__(self, cursor_factory: CursorFactory, partition_router: StreamSlicer, max_partitions_in_state: Optional[int] = None):
+        if max_partitions_in_state is not None and max_partitions_in_state < 1:
+            raise ValueError(f"max_partitions_in_state should be at least 1, got {max_partitions_in_state}")
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
-        self._cursor_per_partition = {}
+        self._max_partitions_in_state = max_partitions_in_state
+        # Cursors of the partitions read the most recently. The others are created again from their state when needed
+        self._cursor_per_partition: "OrderedDict[str, Cursor]" = OrderedDict()
+        # State entries of the partitions having a cursor state, from the least to the most recently updated
+        self._state_per_partition: "OrderedDict[str, Mapping[str, Any]]" = OrderedDict()
+        self._partitions_without_state: Set[str] = set()
+        self._lower_bound_state: Optional[StreamState] = None
+        self._comparison_cursor: Optional[Cursor] = None
         self._partition_serializer = PerPartitionKeySerializer()
 
     def stream_slices(self) -> Iterable[PerPartitionStreamSlice]:
         slices = self._partition_router.stream_slices()
         for partition in slices:
-            cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
-            if not cursor:
-                cursor = self._create_cursor(self._NO_CURSOR_STATE)
-                self._cursor_per_partition[self._to_partition_key(partition)] = cursor
+            partition_key = self._to_partition_key(partition)
+            try:
+                cursor = self._get_cursor_for_partition(partition_key)
+            except KeyError:
+                cursor = self._create_cursor(self._lower_bound_state or self._NO_CURSOR_STATE)
+                self._add_cursor(partition_key, cursor)
+                self._update_state(partition_key, cursor)
 
             for cursor_slice in cursor.stream_slices():
                 yield PerPartitionStreamSlice(partition, cursor_slice)
@@ -142,16 +165,23 @@ class PerPartitionCursor(Cursor):
             return
 
         for state in stream_state["states"]:
-            self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(state["cursor"])
+            partition_key = self._to_partition_key(state["partition"])
+            if state["cursor"]:
+                self._state_per_partition[partition_key] = {"partition": state["partition"], "cursor": state["cursor"]}
+            else:
+                self._partitions_without_state.add(partition_key)
+        self._lower_bound_state = stream_state.get("state") or None
+        self._remove_partitions_over_limit()
 
     def close_slice(self, stream_slice: StreamSlice, most_recent_record: Optional[Record]) -> None:
         try:
             cursor_most_recent_record = (
                 Record(most_recent_record.data, stream_slice.cursor_slice) if most_recent_record else most_recent_record
             )
-            self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].close_slice(
-                stream_slice.cursor_slice, cursor_most_recent_record
-            )
+            partition_key = self._to_partition_key(stream_slice.partition)
+            cursor = self._get_cursor_for_partition(partition_key)
+            cursor.close_slice(stream_slice.cursor_slice, cursor_most_recent_record)
+            self._update_state(partition_key, cursor)
         except KeyError as exception:
             raise ValueError(
                 f"Partition {str(exception)} could not be found in current state based on the record. This is unexpected because "
@@ -159,22 +189,20 @@ class PerPartitionCursor(Cursor):
             )
 
     def get_stream_state(self) -> StreamState:
-        states = []
-        for partition_tuple, cursor in self._cursor_per_partition.items():
-            cursor_state = cursor.get_stream_state()
-            if cursor_state:
-                states.append(
-                    {
-                        "partition": self._to_dict(partition_tuple),
-                        "cursor": cursor_state,
-                    }
-                )
-        return {"states": states}
+        stream_state: Dict[str, Any] = {"states": list(self._state_per_partition.values())}
+        if self._lower_bound_state:
+            stream_state["state"] = self._lower_bound_state
+        return stream_state
 
     def _get_state_for_partition(self, partition: Mapping[str, Any]) -> Optional[StreamState]:
-        cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
+        partition_key = self._to_partition_key(partition)
+        cursor = self._cursor_per_partition.get(partition_key)
         if cursor:
             return cursor.get_stream_state()
+        if partition_key in self._state_per_partition:
+            return self._state_per_partition[partition_key]["cursor"]
+        if partition_key in self._partitions_without_state:
+            return self._NO_CURSOR_STATE
 
         return None
 
@@ -182,10 +210,10 @@ class PerPartitionCursor(Cursor):
     def _is_new_state(stream_state):
         return not bool(stream_state)
 
-    def _to_partition_key(self, partition) -> tuple:
+    def _to_partition_key(self, partition: Mapping[str, Any]) -> str:
         return self._partition_serializer.to_partition_key(partition)
 
-    def _to_dict(self, partition_key: tuple) -> StreamSlice:
+    def _to_dict(self, partition_key: str) -> StreamSlice:
         return self._partition_serializer.to_partition(partition_key)
 
     def select_state(self, stream_slice: Optional[PerPartitionStreamSlice] = None) -> Optional[StreamState]:
@@ -197,11 +225,63 @@ class PerPartitionCursor(Cursor):
 
         return self._get_state_for_partition(stream_slice.partition)
 
-    def _create_cursor(self, cursor_state: Any) -> StreamSlicer:
+    def _create_cursor(self, cursor_state: Any) -> Cursor:
         cursor = self._cursor_factory.create()
         cursor.set_initial_state(cursor_state)
         return cursor
 
+    def _get_cursor_for_partition(self, partition_key: str) -> Cursor:
+        """
+        Return the cursor of a known partition, creating it from the state of the partition if it is not in memory. Raise KeyError if the
+        partition is unknown.
+        """
+        cursor = self._cursor_per_partition.get(partition_key)
+        if cursor:
+            self._cursor_per_partition.move_to_end(partition_key)
+            return cursor
+        if partition_key in self._state_per_partition:
+            cursor = self._create_cursor(self._state_per_partition[partition_key]["cursor"])
+        elif partition_key in self._partitions_without_state:
+            cursor = self._create_cursor(self._lower_bound_state or self._NO_CURSOR_STATE)
+        else:
+            raise KeyError(partition_key)
+        self._add_cursor(partition_key, cursor)
+        return cursor
+
+    def _add_cursor(self, partition_key: str, cursor: Cursor) -> None:
+        self._cursor_per_partition[partition_key] = cursor
+        if len(self._cursor_per_partition) > self._MAX_CURSORS_IN_MEMORY:
+            # The state of the cursor was saved when it was created or when its last slice was closed
+            self._cursor_per_partition.popitem(last=False)
+
+    def _update_state(self, partition_key: str, cursor: Cursor) -> None:
+        cursor_state = cursor.get_stream_state()
+        if cursor_state:
+            self._state_per_partition.pop(partition_key, None)
+            self._state_per_partition[partition_key] = {"partition": self._to_dict(partition_key), "cursor": cursor_state}
+            self._partitions_without_state.discard(partition_key)
+            self._remove_partitions_over_limit()
+        elif partition_key not in self._state_per_partition:
+            self._partitions_without_state.add(partition_key)
+
+    def _remove_partitions_over_limit(self) -> None:
+        if self._max_partitions_in_state is None:
+            return
+        while len(self._state_per_partition) > self._max_partitions_in_state:
+            partition_key, state = self._state_per_partition.popitem(last=False)
+            self._cursor_per_partition.pop(partition_key, None)
+            self._partitions_without_state.add(partition_key)
+            self._lower_bound_state = self._lowest_state(self._lower_bound_state, state["cursor"])
+
+    def _lowest_state(self, first: Optional[StreamState], second: StreamState) -> StreamState:
+        if not first:
+            return second
+        comparison_cursor = self._comparison_cursor
+        if comparison_cursor is None:
+            comparison_cursor = self._comparison_cursor = self._cursor_factory.create()
+        # The partitions are not compared, only the cursor values of the states
+        return second if comparison_cursor.is_greater_than_or_equal(Record(first, {}), Record(second, {})) else first
+
     def get_request_params(
         self,
         *,
@@ -209,11 +289,14 @@ class PerPartitionCursor(Cursor):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._partition_router.get_request_params(
-            stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_params(
-            stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
-        )
+        return {
+            **self._partition_router.get_request_params(
+                stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
+            ),
+            **self._get_cursor_for_partition(self._to_partition_key(stream_slice.partition)).get_request_params(
+                stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
+            ),
+        }
 
     def get_request_headers(
         self,
@@ -222,11 +305,14 @@ class PerPartitionCursor(Cursor):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._partition_router.get_request_headers(
-            stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_headers(
-            stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
-        )
+        return {
+            **self._partition_router.get_request_headers(
+                stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
+            ),
+            **self._get_cursor_for_partition(self._to_partition_key(stream_slice.partition)).get_request_headers(
+                stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
+            ),
+        }
 
     def get_request_body_data(
         self,
@@ -235,11 +321,15 @@ class PerPartitionCursor(Cursor):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._partition_router.get_request_body_data(
+        partition_options = self._partition_router.get_request_body_data(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_data(
+        )
+        cursor_options = self._get_cursor_for_partition(self._to_partition_key(stream_slice.partition)).get_request_body_data(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
+        if isinstance(partition_options, str) or isinstance(cursor_options, str):
+            raise ValueError("Cannot combine the body data of a partition with the one of its cursor if one of them is a string")
+        return {**(partition_options or {}), **(cursor_options or {})}
 
     def get_request_body_json(
         self,
@@ -248,11 +338,13 @@ class PerPartitionCursor(Cursor):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._partition_router.get_request_body_json(
+        partition_options = self._partition_router.get_request_body_json(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_json(
+        )
+        cursor_options = self._get_cursor_for_partition(self._to_partition_key(stream_slice.partition)).get_request_body_json(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
+        return {**(partition_options or {}), **(cursor_options or {})}
 
     def should_be_synced(self, record: Record) -> bool:
         return self._get_cursor(record).should_be_synced(self._convert_record_to_cursor_record(record))
@@ -273,7 +365,7 @@ class PerPartitionCursor(Cursor):
 
     def _get_cursor(self, record: Record) -> Cursor:
         partition_key = self._to_partition_key(record.associated_slice.partition)
-        if partition_key not in self._cursor_per_partition:
+        try:
+            return self._get_cursor_for_partition(partition_key)
+        except KeyError:
             raise ValueError("Invalid state as stream slices that are emitted should refer to an existing cursor")
-        cursor = self._cursor_per_partition[partition_key]
-        return cursor
@@ -3,13 +3,14 @@
 #
 
 import ast
-from typing import Any, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Any, Optional, Set, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta, nodes
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
@@ -49,14 +50,7 @@ class JinjaInterpolation(Interpolation):
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
     def __init__(self):
-        self._environment = Environment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
-
-        for extension in self.RESTRICTED_EXTENSIONS:
-            self._environment.extensions.pop(extension, None)
-        for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
-            self._environment.globals.pop(builtin, None)
+        self._environment = _ENVIRONMENT
 
     def eval(
         self,
@@ -100,14 +94,64 @@ class JinjaInterpolation(Interpolation):
         return result
 
     def _eval(self, s: str, context):
+        if not isinstance(s, str):
+            # The value is not a jinja template
+            # It can be returned as is
+            return s
         try:
-            ast = self._environment.parse(s)
-            undeclared = meta.find_undeclared_variables(ast)
+            static_value = _static_value(s)
+            if static_value is not None:
+                return static_value
+            undeclared = _find_undeclared_variables(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)
+            return _compile(s).render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+
+def _create_environment() -> Environment:
+    environment = Environment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+
+    for extension in JinjaInterpolation.RESTRICTED_EXTENSIONS:
+        environment.extensions.pop(extension, None)
+    for builtin in JinjaInterpolation.RESTRICTED_BUILTIN_FUNCTIONS:
+        environment.globals.pop(builtin, None)
+    return environment
+
+
+# The environment is the same for every interpolation, so it is shared along with the parsed and compiled forms of the templates.
+# Templates are evaluated for every request and record, the caches are keyed by the template string.
+_ENVIRONMENT = _create_environment()
+MAX_CACHED_TEMPLATES = 10_000
+
+
+@lru_cache(maxsize=MAX_CACHED_TEMPLATES)
+def _static_value(s: str) -> Optional[str]:
+    """
+    Return the rendered value of the template if it only contains text, None otherwise
+    """
+    texts = []
+    for node in _ENVIRONMENT.parse(s).body:
+        if not isinstance(node, nodes.Output):
+            return None
+        for child in node.nodes:
+            if not isinstance(child, nodes.TemplateData):
+                return None
+            texts.append(child.data)
+    return "".join(texts)
+
+
+@lru_cache(maxsize=MAX_CACHED_TEMPLATES)
+def _find_undeclared_variables(s: str) -> Set[str]:
+    return meta.find_undeclared_variables(_ENVIRONMENT.parse(s))
+
+
+@lru_cache(maxsize=MAX_CACHED_TEMPLATES)
+def _compile(s: str) -> Template:
+    return _ENVIRONMENT.from_string(s)
@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import pkgutil
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from typing import Any, Optional
+
+from airbyte_cdk.utils.constants import ENV_MANIFEST_CACHE_PATH
+
+
+class ManifestCache:
+    """
+    Keeps json documents derived from a manifest, like the parsed YAML or the resolved and validated manifest, in a directory on disk so
+    that the connector processes started for each spec/check/discover/read do not compute them again.
+
+    Entries are keyed by a hash of their content along with the CDK version and declarative component schema they were produced with,
+    so upgrading the CDK or changing the manifest never returns a stale entry. Only documents that survive a json round trip are stored
+    and a missing or unreadable entry is treated as a cache miss.
+    """
+
+    def __init__(self, directory: str, logger: Optional[logging.Logger] = None):
+        self._directory = directory
+        self._logger = logger or logging.getLogger("airbyte")
+
+    @classmethod
+    def from_environment(cls, logger: Optional[logging.Logger] = None) -> Optional["ManifestCache"]:
+        """
+        Returns a cache in the directory set by the MANIFEST_CACHE_PATH environment variable, or None if it is not set
+        """
+        directory = os.getenv(ENV_MANIFEST_CACHE_PATH)
+        return cls(directory, logger) if directory else None
+
+    def get(self, kind: str, content: str) -> Optional[Any]:
+        path = self._path(kind, content)
+        try:
+            with open(path) as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            self._logger.warning(f"Ignoring the manifest cache entry at {path} as it could not be read: {exc}")
+            return None
+
+    def set(self, kind: str, content: str, value: Any) -> None:
+        """
+        Writes the value to disk if it can be read back unchanged. The entry is replaced atomically so that a concurrent process never
+        reads a partially written entry.
+        """
+        try:
+            serialized_value = json.dumps(value)
+            if json.loads(serialized_value) != value:
+                return
+        except (TypeError, ValueError):
+            return
+        path = self._path(kind, content)
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=self._directory, delete=False, suffix=".tmp") as temporary_file:
+                temporary_file.write(serialized_value)
+            os.replace(temporary_file.name, path)
+        except OSError as exc:
+            self._logger.warning(f"Could not write the manifest cache entry to {path}: {exc}")
+
+    def _path(self, kind: str, content: str) -> str:
+        content_hash = hashlib.sha256(f"{_cdk_fingerprint()}:{kind}:{content}".encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, f"{kind}-{content_hash}.json")
+
+
+@lru_cache(maxsize=1)
+def _cdk_fingerprint() -> str:
+    raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml") or b""
+    return f"{metadata.version('airbyte_cdk')}:{hashlib.sha256(raw_component_schema).hexdigest()}"
@@ -6,6 +6,7 @@ import json
 import logging
 import pkgutil
 import re
+from functools import lru_cache
 from importlib import metadata
 from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
@@ -19,6 +20,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.checks.connection_checker import ConnectionChecker
 from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
+from airbyte_cdk.sources.declarative.manifest_cache import ManifestCache
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
@@ -29,8 +31,8 @@ from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.core import Stream
 from airbyte_cdk.sources.utils.slice_logger import AlwaysLogSliceLogger, DebugSliceLogger, SliceLogger
-from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.validators import validator_for
 
 
 class ManifestDeclarativeSource(DeclarativeSource):
@@ -52,22 +54,14 @@ class ManifestDeclarativeSource(DeclarativeSource):
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
-        # For ease of use we don't require the type to be specified at the top level manifest, but it should be included during processing
-        manifest = dict(source_config)
-        if "type" not in manifest:
-            manifest["type"] = "DeclarativeSource"
-
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
+        self._manifest_cache = ManifestCache.from_environment(self.logger)
+        self._source_config = self._preprocess_manifest(source_config)
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
 
-        self._validate_source()
-
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
         return self._source_config
@@ -144,31 +138,51 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if self._debug:
             logger.setLevel(logging.DEBUG)
 
-    def _validate_source(self) -> None:
+    def _preprocess_manifest(self, source_config: ConnectionDefinition) -> Dict[str, Any]:
+        """
+        Resolves the references of the manifest, propagates the types and parameters of its components and validates it. If a manifest
+        cache is configured, the validated manifest is stored on disk so that the following processes skip these steps.
+        """
+        cache_content = None
+        if self._manifest_cache:
+            try:
+                cache_content = json.dumps(source_config, sort_keys=True)
+            except (TypeError, ValueError):
+                # Manifests that can't be serialized to json (e.g. with YAML dates) are not cached
+                cache_content = None
+            if cache_content is not None:
+                cached_source_config = self._manifest_cache.get("manifest", cache_content)
+                if isinstance(cached_source_config, dict):
+                    return cached_source_config
+
+        # For ease of use we don't require the type to be specified at the top level manifest, but it should be included during processing
+        manifest = dict(source_config)
+        if "type" not in manifest:
+            manifest["type"] = "DeclarativeSource"
+
+        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
+        self._validate_source(propagated_source_config)
+
+        if self._manifest_cache and cache_content is not None:
+            self._manifest_cache.set("manifest", cache_content, propagated_source_config)
+        return dict(propagated_source_config)
+
+    def _validate_source(self, source_config: Mapping[str, Any]) -> None:
         """
         Validates the connector manifest against the declarative component schema
         """
-        try:
-            raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
-            if raw_component_schema is not None:
-                declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
-            else:
-                raise RuntimeError("Failed to read manifest component json schema required for validation")
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
-
-        streams = self._source_config.get("streams")
+        streams = source_config.get("streams")
         if not streams:
             raise ValidationError(f"A valid manifest should have at least one stream defined. Got {streams}")
 
-        try:
-            validate(self._source_config, declarative_component_schema)
-        except ValidationError as e:
-            raise ValidationError("Validation against json schema defined in declarative_component_schema.yaml schema failed") from e
+        error = best_match(_get_declarative_component_schema_validator().iter_errors(source_config))
+        if error is not None:
+            raise ValidationError("Validation against json schema defined in declarative_component_schema.yaml schema failed") from error
 
         cdk_version = metadata.version("airbyte_cdk")
         cdk_major, cdk_minor, cdk_patch = self._get_version_parts(cdk_version, "airbyte-cdk")
-        manifest_version = self._source_config.get("version")
+        manifest_version = source_config.get("version")
         if manifest_version is None:
             raise RuntimeError(
                 "Manifest version is not defined in the manifest. This is unexpected since it should be a required field. Please contact support."
@@ -207,3 +221,23 @@ class ManifestDeclarativeSource(DeclarativeSource):
 
     def _emit_manifest_debug_message(self, extra_args: dict[str, Any]) -> None:
         self.logger.debug("declarative source created from manifest", extra=extra_args)
+
+
+@lru_cache(maxsize=1)
+def _get_declarative_component_schema_validator() -> Any:
+    """
+    Loads the declarative component schema and checks it the first time a manifest is validated. The validator is then shared by all the
+    sources of the process.
+    """
+    try:
+        raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
+        if raw_component_schema is not None:
+            declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
+        else:
+            raise RuntimeError("Failed to read manifest component json schema required for validation")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
+
+    validator_class = validator_for(declarative_component_schema)
+    validator_class.check_schema(declarative_component_schema)
+    return validator_class(declarative_component_schema)
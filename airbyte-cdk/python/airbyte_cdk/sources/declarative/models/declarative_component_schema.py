@@ -383,6 +383,29 @@ class Action(Enum):
     IGNORE = 'IGNORE'
 
 
+class HttpRequestMatcher(BaseModel):
+    type: Literal['HttpRequestMatcher']
+    method: Optional[str] = Field(
+        None,
+        description='The HTTP method of the requests to match.',
+        examples=['GET', 'POST'],
+        title='HTTP Method',
+    )
+    host: Optional[str] = Field(
+        None,
+        description='The host of the requests to match.',
+        examples=['api.github.com'],
+        title='Host',
+    )
+    path_pattern: Optional[str] = Field(
+        None,
+        description='A regular expression searched in the path of the requests to match.',
+        examples=['^/v3/marketing/lists', '/issues$'],
+        title='Path Pattern',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class HttpResponseFilter(BaseModel):
     type: Literal['HttpResponseFilter']
     action: Action = Field(
@@ -694,6 +717,10 @@ class LegacySessionTokenAuthenticator(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal['StreamingJsonDecoder']
+
+
 class WaitTimeFromHeader(BaseModel):
     type: Literal['WaitTimeFromHeader']
     header: str = Field(
@@ -734,6 +761,70 @@ class WaitUntilTimeFromHeader(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class SlidingWindowRatePolicy(BaseModel):
+    type: Literal['SlidingWindowRatePolicy']
+    max_calls: int = Field(
+        ...,
+        description='The number of calls allowed per window.',
+        examples=[100],
+        title='Max Calls',
+    )
+    period_in_seconds: float = Field(
+        ...,
+        description='The duration of the window in seconds.',
+        examples=[60],
+        title='Period',
+    )
+    matchers: Optional[List[HttpRequestMatcher]] = Field(
+        None,
+        description='The requests this policy applies to. The policy applies to every request if no matcher is defined.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
+class TokenBucketRatePolicy(BaseModel):
+    type: Literal['TokenBucketRatePolicy']
+    max_calls: int = Field(
+        ...,
+        description='The number of calls allowed per period, which is also the largest burst of calls.',
+        examples=[10],
+        title='Max Calls',
+    )
+    period_in_seconds: float = Field(
+        ...,
+        description='The duration of the period in seconds.',
+        examples=[1],
+        title='Period',
+    )
+    matchers: Optional[List[HttpRequestMatcher]] = Field(
+        None,
+        description='The requests this policy applies to. The policy applies to every request if no matcher is defined.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
+class RateLimiter(BaseModel):
+    type: Literal['RateLimiter']
+    policies: List[Union[SlidingWindowRatePolicy, TokenBucketRatePolicy]] = Field(
+        ...,
+        description='The rate limit policies. A request is scheduled by the first policy matching it.',
+        title='Policies',
+    )
+    remaining_header: Optional[str] = Field(
+        'X-RateLimit-Remaining',
+        description='The response header holding the number of calls remaining in the current rate limit window.',
+        title='Remaining Calls Header',
+    )
+    reset_header: Optional[str] = Field(
+        'X-RateLimit-Reset',
+        description='The response header holding when the rate limit window resets, either as a number of seconds or as a unix timestamp.',
+        title='Reset Header',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class ApiKeyAuthenticator(BaseModel):
     type: Literal['ApiKeyAuthenticator']
     api_token: Optional[str] = Field(
@@ -956,7 +1047,7 @@ class DpathExtractor(BaseModel):
         ],
         title='Field Path',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -1223,6 +1314,17 @@ class HttpRequester(BaseModel):
         ],
         title='Query Parameters',
     )
+    rate_limiter: Optional[RateLimiter] = Field(
+        None,
+        description='Schedules the requests so that the rate limit of the API is respected before it is hit. Requesters using the same rate limiter definition share its budget of calls.',
+        title='Rate Limiter',
+    )
+    max_connections: Optional[int] = Field(
+        None,
+        description='The number of connections kept alive per host. Should be at least the number of requests sent at once, e.g. the concurrency of the parent streams, so that the connections are reused instead of being closed after each request.',
+        examples=[10, 32],
+        title='Max Connections',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -1248,6 +1350,17 @@ class ParentStreamConfig(BaseModel):
         description='A request option describing where the parent key value should be injected into and under what field name if applicable.',
         title='Request Option',
     )
+    concurrency: Optional[int] = Field(
+        1,
+        description='The number of slices of the parent stream that are read at once. The partitions are emitted in the same order whatever the concurrency. Parent streams that are themselves incremental substreams are read one slice at a time.',
+        examples=[1, 4],
+        title='Concurrency',
+    )
+    cache_records: Optional[bool] = Field(
+        False,
+        description='Keep the records of the parent stream in memory during the sync so that other child streams using the same parent stream definition do not read it again.',
+        title='Cache Records',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -40,11 +40,15 @@ DEFAULT_MODEL_TYPES: Mapping[str, str] = {
     "DpathExtractor.decoder": "JsonDecoder",
     # HttpRequester
     "HttpRequester.error_handler": "DefaultErrorHandler",
+    "HttpRequester.rate_limiter": "RateLimiter",
     # ListPartitionRouter
     "ListPartitionRouter.request_option": "RequestOption",
     # ParentStreamConfig
     "ParentStreamConfig.request_option": "RequestOption",
     "ParentStreamConfig.stream": "DeclarativeStream",
+    # RateLimiter policies
+    "SlidingWindowRatePolicy.matchers": "HttpRequestMatcher",
+    "TokenBucketRatePolicy.matchers": "HttpRequestMatcher",
     # RecordSelector
     "RecordSelector.extractor": "DpathExtractor",
     "RecordSelector.record_filter": "RecordFilter",
@@ -4,10 +4,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import inspect
+import json
 import re
-from typing import Any, Callable, List, Mapping, Optional, Type, Union, get_args, get_origin, get_type_hints
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type, Union, get_args, get_origin, get_type_hints
 
 from airbyte_cdk.models import Level
 from airbyte_cdk.sources.declarative.auth import DeclarativeOauth2Authenticator
@@ -23,7 +25,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import InterpolatedStri
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import Cursor, CursorFactory, DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -56,6 +58,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
     ExponentialBackoffStrategy as ExponentialBackoffStrategyModel,
 )
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpRequester as HttpRequesterModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpRequestMatcher as HttpRequestMatcherModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpResponseFilter as HttpResponseFilterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import InlineSchemaLoader as InlineSchemaLoaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import JsonDecoder as JsonDecoderModel
@@ -71,6 +74,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import OffsetIncrement as OffsetIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import PageIncrement as PageIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ParentStreamConfig as ParentStreamConfigModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import RateLimiter as RateLimiterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordFilter as RecordFilterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordSelector as RecordSelectorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RemoveFields as RemoveFieldsModel
@@ -78,12 +82,15 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RequestPath as RequestPathModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SessionTokenAuthenticator as SessionTokenAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import SlidingWindowRatePolicy as SlidingWindowRatePolicyModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import TokenBucketRatePolicy as TokenBucketRatePolicyModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitUntilTimeFromHeader as WaitUntilTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter
-from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
+from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentRecordsCache, ParentStreamConfig
 from airbyte_cdk.sources.declarative.requesters import HttpRequester, RequestOption
 from airbyte_cdk.sources.declarative.requesters.error_handlers import CompositeErrorHandler, DefaultErrorHandler, HttpResponseFilter
 from airbyte_cdk.sources.declarative.requesters.error_handlers.backoff_strategies import (
@@ -112,6 +119,7 @@ from airbyte_cdk.sources.declarative.transformations import AddFields, RecordTra
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.types import Config
 from airbyte_cdk.sources.message import InMemoryMessageRepository, LogAppenderMessageRepositoryDecorator, MessageRepository
+from airbyte_cdk.sources.streams.http.rate_limiter import HttpRequestMatcher, RateLimiter, SlidingWindowRatePolicy, TokenBucketRatePolicy
 from isodate import parse_duration
 from pydantic import BaseModel
 
@@ -135,6 +143,11 @@ class ModelToComponentFactory:
         self._limit_slices_fetched = limit_slices_fetched
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._disable_retries = disable_retries
+        # Shared with the factories creating parent streams so that a parent stream is cached once for all the child streams
+        self._parent_records_cache = ParentRecordsCache()
+        # Requesters with the same rate limiter definition, including those of parent streams, share one instance so that they share
+        # the budget of calls of the API
+        self._rate_limiters: Dict[str, RateLimiter] = {}
         self._message_repository = message_repository or InMemoryMessageRepository(  # type: ignore
             self._evaluate_log_level(emit_connector_builder_messages)
         )
@@ -168,6 +181,7 @@ class ModelToComponentFactory:
             ExponentialBackoffStrategyModel: self.create_exponential_backoff_strategy,
             SessionTokenAuthenticatorModel: self.create_session_token_authenticator,
             HttpRequesterModel: self.create_http_requester,
+            HttpRequestMatcherModel: self.create_http_request_matcher,
             HttpResponseFilterModel: self.create_http_response_filter,
             InlineSchemaLoaderModel: self.create_inline_schema_loader,
             JsonDecoderModel: self.create_json_decoder,
@@ -180,6 +194,7 @@ class ModelToComponentFactory:
             OffsetIncrementModel: self.create_offset_increment,
             PageIncrementModel: self.create_page_increment,
             ParentStreamConfigModel: self.create_parent_stream_config,
+            RateLimiterModel: self.create_rate_limiter,
             RecordFilterModel: self.create_record_filter,
             RecordSelectorModel: self.create_record_selector,
             RemoveFieldsModel: self.create_remove_fields,
@@ -187,8 +202,11 @@ class ModelToComponentFactory:
             RequestOptionModel: self.create_request_option,
             LegacySessionTokenAuthenticatorModel: self.create_legacy_session_token_authenticator,
             SimpleRetrieverModel: self.create_simple_retriever,
+            SlidingWindowRatePolicyModel: self.create_sliding_window_rate_policy,
             SpecModel: self.create_spec,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             SubstreamPartitionRouterModel: self.create_substream_partition_router,
+            TokenBucketRatePolicyModel: self.create_token_bucket_rate_policy,
             WaitTimeFromHeaderModel: self.create_wait_time_from_header,
             WaitUntilTimeFromHeaderModel: self.create_wait_until_time_from_header,
         }
@@ -673,6 +691,7 @@ class ModelToComponentFactory:
             if model.error_handler
             else DefaultErrorHandler(backoff_strategies=[], response_filters=[], config=config, parameters=model.parameters or {})
         )
+        rate_limiter = self._create_component_from_model(model=model.rate_limiter, config=config) if model.rate_limiter else None
 
         request_options_provider = InterpolatedRequestOptionsProvider(
             request_body_data=model.request_body_data,
@@ -699,8 +718,14 @@ class ModelToComponentFactory:
             disable_retries=self._disable_retries,
             parameters=model.parameters or {},
             message_repository=self._message_repository,
+            rate_limiter=rate_limiter,
+            max_connections=model.max_connections,
         )
 
+    @staticmethod
+    def create_http_request_matcher(model: HttpRequestMatcherModel, config: Config, **kwargs: Any) -> HttpRequestMatcher:
+        return HttpRequestMatcher(method=model.method, host=model.host, path_pattern=model.path_pattern)
+
     @staticmethod
     def create_http_response_filter(model: HttpResponseFilterModel, config: Config, **kwargs: Any) -> HttpResponseFilter:
         action = ResponseAction(model.action.value)
@@ -821,6 +846,10 @@ class ModelToComponentFactory:
     def create_parent_stream_config(self, model: ParentStreamConfigModel, config: Config, **kwargs: Any) -> ParentStreamConfig:
         declarative_stream = self._create_component_from_model(model.stream, config=config)
         request_option = self._create_component_from_model(model.request_option, config=config) if model.request_option else None
+        # A parent stream using a PerPartitionCursor can only close the slices it generated itself so its slices are read by one instance.
+        # The Connector Builder groups the requests by slice so they are not read concurrently either.
+        uses_per_partition_cursor = model.stream.incremental_sync and getattr(model.stream.retriever, "partition_router", None)
+        can_read_slices_concurrently = not uses_per_partition_cursor and not self._emit_connector_builder_messages
         return ParentStreamConfig(
             parent_key=model.parent_key,
             request_option=request_option,
@@ -828,8 +857,34 @@ class ModelToComponentFactory:
             partition_field=model.partition_field,
             config=config,
             parameters=model.parameters or {},
+            concurrency=model.concurrency or 1,
+            stream_factory=self._create_parent_stream_factory(model.stream, config) if can_read_slices_concurrently else None,
+            records_cache=self._parent_records_cache if model.cache_records else None,
+            cache_key=self._get_parent_records_cache_key(model.stream, config) if model.cache_records else None,
         )
 
+    def _create_parent_stream_factory(self, model: DeclarativeStreamModel, config: Config) -> Callable[[], DeclarativeStream]:
+        return lambda: self._create_component_from_model(model, config=config)  # type: ignore
+
+    @staticmethod
+    def _get_parent_records_cache_key(model: DeclarativeStreamModel, config: Config) -> str:
+        definition = json.dumps({"stream": model.dict(), "config": config}, sort_keys=True, default=str)
+        return hashlib.sha256(definition.encode("utf-8")).hexdigest()
+
+    def create_rate_limiter(self, model: RateLimiterModel, config: Config, **kwargs: Any) -> RateLimiter:
+        # $parameters are propagated from the stream and are not used by the rate limiter so they are not part of its definition
+        definition = model.json(
+            exclude={"parameters": True, "policies": {"__all__": {"parameters": True, "matchers": {"__all__": {"parameters"}}}}},
+            sort_keys=True,
+        )
+        if definition not in self._rate_limiters:
+            self._rate_limiters[definition] = RateLimiter(
+                policies=[self._create_component_from_model(model=policy, config=config) for policy in model.policies],
+                remaining_header=model.remaining_header,
+                reset_header=model.reset_header,
+            )
+        return self._rate_limiters[definition]
+
     @staticmethod
     def create_record_filter(model: RecordFilterModel, config: Config, **kwargs: Any) -> RecordFilter:
         return RecordFilter(condition=model.condition or "", config=config, parameters=model.parameters or {})
@@ -929,6 +984,15 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
+    def create_sliding_window_rate_policy(
+        self, model: SlidingWindowRatePolicyModel, config: Config, **kwargs: Any
+    ) -> SlidingWindowRatePolicy:
+        return SlidingWindowRatePolicy(
+            max_calls=model.max_calls,
+            period_in_seconds=model.period_in_seconds,
+            matchers=[self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []],
+        )
+
     @staticmethod
     def create_spec(model: SpecModel, config: Config, **kwargs: Any) -> Spec:
         return Spec(
@@ -938,6 +1002,10 @@ class ModelToComponentFactory:
             parameters={},
         )
 
+    @staticmethod
+    def create_streaming_json_decoder(model: StreamingJsonDecoderModel, config: Config, **kwargs: Any) -> StreamingJsonDecoder:
+        return StreamingJsonDecoder(parameters={})
+
     def create_substream_partition_router(
         self, model: SubstreamPartitionRouterModel, config: Config, **kwargs: Any
     ) -> SubstreamPartitionRouter:
@@ -964,8 +1032,17 @@ class ModelToComponentFactory:
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
         )
+        substream_factory._parent_records_cache = self._parent_records_cache
+        substream_factory._rate_limiters = self._rate_limiters
         return substream_factory._create_component_from_model(model=model, config=config)
 
+    def create_token_bucket_rate_policy(self, model: TokenBucketRatePolicyModel, config: Config, **kwargs: Any) -> TokenBucketRatePolicy:
+        return TokenBucketRatePolicy(
+            max_calls=model.max_calls,
+            period_in_seconds=model.period_in_seconds,
+            matchers=[self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []],
+        )
+
     @staticmethod
     def create_wait_time_from_header(model: WaitTimeFromHeaderModel, config: Config, **kwargs: Any) -> WaitTimeFromHeaderBackoffStrategy:
         return WaitTimeFromHeaderBackoffStrategy(header=model.header, parameters=model.parameters or {}, config=config, regex=model.regex)
@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 from dataclasses import InitVar, dataclass
-from typing import Any, Iterable, List, Mapping, Optional, Union
+from queue import Empty, Queue
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import dpath.util
 from airbyte_cdk.models import AirbyteMessage, SyncMode, Type
@@ -12,6 +14,28 @@ from airbyte_cdk.sources.declarative.requesters.request_option import RequestOpt
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.utils.concurrent_iterators import iterate_concurrently
+
+
+class ParentRecordsCache:
+    """
+    Keeps the records read from parent streams so that child streams sharing a parent stream do not read it again.
+
+    A parent stream is only added once all of its slices were read. The records are kept as long as the cache is referenced, which is the
+    lifetime of the source for the caches created by the ModelToComponentFactory.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: Dict[str, List[Tuple[Optional[StreamSlice], Mapping[str, Any]]]] = {}
+
+    def get(self, key: str) -> Optional[List[Tuple[Optional[StreamSlice], Mapping[str, Any]]]]:
+        with self._lock:
+            return self._records.get(key)
+
+    def set(self, key: str, records: List[Tuple[Optional[StreamSlice], Mapping[str, Any]]]) -> None:
+        with self._lock:
+            self._records[key] = records
 
 
 @dataclass
@@ -23,6 +47,11 @@ class ParentStreamConfig:
     parent_key: The key of the parent stream's records that will be the stream slice key
     partition_field: The partition key
     request_option: How to inject the slice value on an outgoing HTTP request
+    concurrency: The number of slices of the parent stream read at once
+    stream_factory: Creates other instances of the parent stream. Slices of the parent stream can only be read concurrently when it is set
+      because a stream keeps the pagination state of the slice it is reading
+    records_cache: Where the records of the parent stream are kept once read so other child streams do not read it again
+    cache_key: Identifies the parent stream definition in the records cache
     """
 
     stream: Stream
@@ -31,8 +60,14 @@ class ParentStreamConfig:
     config: Config
     parameters: InitVar[Mapping[str, Any]]
     request_option: Optional[RequestOption] = None
+    concurrency: int = 1
+    stream_factory: Optional[Callable[[], Stream]] = None
+    records_cache: Optional[ParentRecordsCache] = None
+    cache_key: Optional[str] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]):
+        if self.concurrency < 1:
+            raise ValueError(f"The concurrency of a parent stream should be at least 1, got {self.concurrency}")
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
         self.partition_field = InterpolatedString.create(self.partition_field, parameters=parameters)
 
@@ -47,6 +82,8 @@ class SubstreamPartitionRouter(StreamSlicer):
         parent_stream_configs (List[ParentStreamConfig]): parent streams to iterate over and their config
     """
 
+    MAX_BUFFERED_RECORDS_PER_PARENT_SLICE = 1_000
+
     parent_stream_configs: List[ParentStreamConfig]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
@@ -122,33 +159,89 @@ class SubstreamPartitionRouter(StreamSlicer):
             yield from []
         else:
             for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
                 parent_field = parent_stream_config.parent_key.eval(self.config)
                 stream_state_field = parent_stream_config.partition_field.eval(self.config)
-                for parent_stream_slice in parent_stream.stream_slices(
-                    sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None
-                ):
-                    empty_parent_slice = True
-                    parent_slice = parent_stream_slice
-
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
-                        # Skip non-records (eg AirbyteLogMessage)
-                        if isinstance(parent_record, AirbyteMessage):
-                            if parent_record.type == Type.RECORD:
-                                parent_record = parent_record.record.data
-                            else:
-                                continue
-                        elif isinstance(parent_record, Record):
-                            parent_record = parent_record.data
-                        try:
-                            stream_state_value = dpath.util.get(parent_record, parent_field)
-                        except KeyError:
-                            pass
-                        else:
-                            empty_parent_slice = False
-                            yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
-                    # If the parent slice contains no records,
-                    if empty_parent_slice:
-                        yield from []
+                for parent_slice, parent_record in self._read_parent_records(parent_stream_config):
+                    try:
+                        stream_state_value = dpath.util.get(parent_record, parent_field)
+                    except KeyError:
+                        pass
+                    else:
+                        yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
+
+    def _read_parent_records(self, parent_stream_config: ParentStreamConfig) -> Iterable[Tuple[Optional[StreamSlice], Mapping[str, Any]]]:
+        """
+        Yield the records of the parent stream with the slice they were read from, from the cache if the parent stream was already read
+        """
+        records_cache, cache_key = parent_stream_config.records_cache, parent_stream_config.cache_key
+        if records_cache is not None and cache_key is not None:
+            cached_records = records_cache.get(cache_key)
+            if cached_records is not None:
+                yield from cached_records
+                return
+
+        if parent_stream_config.concurrency > 1 and parent_stream_config.stream_factory:
+            parent_records = self._read_parent_slices_concurrently(
+                parent_stream_config.stream, parent_stream_config.stream_factory, parent_stream_config.concurrency
+            )
+        else:
+            parent_records = self._read_parent_slices(parent_stream_config.stream)
+
+        if records_cache is None or cache_key is None:
+            yield from parent_records
+            return
+        records_to_cache = []
+        for parent_slice_and_record in parent_records:
+            records_to_cache.append(parent_slice_and_record)
+            yield parent_slice_and_record
+        records_cache.set(cache_key, records_to_cache)
+
+    def _read_parent_slices(self, parent_stream: Stream) -> Iterable[Tuple[Optional[StreamSlice], Mapping[str, Any]]]:
+        for parent_slice in parent_stream.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None):
+            for parent_record in self._read_parent_slice(parent_stream, parent_slice):
+                yield parent_slice, parent_record
+
+    def _read_parent_slice(self, parent_stream: Stream, parent_slice: Optional[StreamSlice]) -> Iterable[Mapping[str, Any]]:
+        for parent_record in parent_stream.read_records(
+            sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_slice, stream_state=None
+        ):
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                if parent_record.type == Type.RECORD:
+                    yield parent_record.record.data
+            elif isinstance(parent_record, Record):
+                yield parent_record.data
+            else:
+                yield parent_record
+
+    def _read_parent_slices_concurrently(
+        self, parent_stream: Stream, stream_factory: Callable[[], Stream], concurrency: int
+    ) -> Iterable[Tuple[Optional[StreamSlice], Mapping[str, Any]]]:
+        """
+        Read up to `concurrency` slices of the parent stream at once and yield their records slice after slice.
+
+        The parent stream only generates the slices. Each slice is read by an instance created by the stream factory that is not reading
+        another slice. Each worker buffers a bounded number of records so a slow consumer pauses the workers instead of accumulating records
+        in memory.
+        """
+        idle_parent_streams: "Queue[Stream]" = Queue()
+        yield from iterate_concurrently(
+            (
+                self._read_parent_slice_with_idle_stream(stream_factory, idle_parent_streams, parent_slice)
+                for parent_slice in parent_stream.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None)
+            ),
+            n_workers=concurrency,
+            max_buffered_items=self.MAX_BUFFERED_RECORDS_PER_PARENT_SLICE,
+            thread_name_prefix="parent_stream_reader",
+        )
+
+    def _read_parent_slice_with_idle_stream(
+        self, stream_factory: Callable[[], Stream], idle_parent_streams: "Queue[Stream]", parent_slice: Optional[StreamSlice]
+    ) -> Iterator[Tuple[Optional[StreamSlice], Mapping[str, Any]]]:
+        try:
+            parent_stream = idle_parent_streams.get_nowait()
+        except Empty:
+            parent_stream = stream_factory()
+        for parent_record in self._read_parent_slice(parent_stream, parent_slice):
+            yield parent_slice, parent_record
+        idle_parent_streams.put(parent_stream)
@@ -26,7 +26,8 @@ from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod, Req
 from airbyte_cdk.sources.declarative.types import Config, StreamSlice, StreamState
 from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
-from airbyte_cdk.sources.streams.http.http import BODY_REQUEST_METHODS
+from airbyte_cdk.sources.streams.http.http import BODY_REQUEST_METHODS, mount_connection_pool
+from airbyte_cdk.sources.streams.http.rate_limiter import RateLimiter
 from airbyte_cdk.sources.streams.http.rate_limiting import default_backoff_handler, user_defined_backoff_handler
 from airbyte_cdk.utils.mapping_helpers import combine_mappings
 from requests.auth import AuthBase
@@ -46,6 +47,8 @@ class HttpRequester(Requester):
         authenticator (DeclarativeAuthenticator): Authenticator defining how to authenticate to the source
         error_handler (Optional[ErrorHandler]): Error handler defining how to detect and handle errors
         config (Config): The user-provided configuration as specified by the source's spec
+        rate_limiter (Optional[RateLimiter]): Schedules the requests to respect the rate limit of the API
+        max_connections (Optional[int]): Number of connections kept alive per host, defaults to the one of requests
     """
 
     name: str
@@ -59,6 +62,8 @@ class HttpRequester(Requester):
     error_handler: Optional[ErrorHandler] = None
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
+    rate_limiter: Optional[RateLimiter] = None
+    max_connections: Optional[int] = None
 
     _DEFAULT_MAX_RETRY = 5
     _DEFAULT_RETRY_FACTOR = 5
@@ -78,6 +83,8 @@ class HttpRequester(Requester):
         self._parameters = parameters
         self.decoder = JsonDecoder(parameters={})
         self._session = requests.Session()
+        if self.max_connections:
+            mount_connection_pool(self._session, self.max_connections)
 
         if isinstance(self._authenticator, AuthBase):
             self._session.auth = self._authenticator
@@ -461,7 +468,11 @@ class HttpRequester(Requester):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
+        if self.rate_limiter:
+            self.rate_limiter.acquire(request)
         response: requests.Response = self._session.send(request)
+        if self.rate_limiter:
+            self.rate_limiter.update_from_response(request, response)
         self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
         if log_formatter:
             formatter = log_formatter
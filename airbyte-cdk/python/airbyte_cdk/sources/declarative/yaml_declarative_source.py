@@ -5,6 +5,7 @@
 import pkgutil
 
 import yaml
+from airbyte_cdk.sources.declarative.manifest_cache import ManifestCache
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 
@@ -25,7 +26,15 @@ class YamlDeclarativeSource(ManifestDeclarativeSource):
 
         yaml_config = pkgutil.get_data(package, path_to_yaml_file)
         decoded_yaml = yaml_config.decode()
-        return self._parse(decoded_yaml)
+        manifest_cache = ManifestCache.from_environment()
+        if manifest_cache is None:
+            return self._parse(decoded_yaml)
+
+        source_config = manifest_cache.get("yaml", decoded_yaml)
+        if not isinstance(source_config, dict):
+            source_config = self._parse(decoded_yaml)
+            manifest_cache.set("yaml", decoded_yaml, source_config)
+        return source_config
 
     def _emit_manifest_debug_message(self, extra_args: dict):
         extra_args["path_to_yaml"] = self._path_to_yaml
@@ -14,6 +14,11 @@ class InferenceType(Enum):
     PRIMITIVE_TYPES_ONLY = "Primitive Types Only"
 
 
+class CsvParsingEngine(Enum):
+    PYTHON = "Python"
+    PYARROW = "PyArrow"
+
+
 class CsvHeaderDefinitionType(Enum):
     FROM_CSV = "From CSV"
     AUTOGENERATED = "Autogenerated"
@@ -142,6 +147,12 @@ class CsvFormat(BaseModel):
         description="How to infer the types of the columns. If none, inference default to strings.",
         airbyte_hidden=True,
     )
+    parsing_engine: CsvParsingEngine = Field(
+        title="Parsing Engine",
+        default=CsvParsingEngine.PYTHON,
+        description="The library used to parse the CSV files. PyArrow parses blocks of rows at once, which is faster on large files, and emits the same records as Python.",
+        airbyte_hidden=True,
+    )
 
     @validator("delimiter")
     def validate_delimiter(cls, v: str) -> str:
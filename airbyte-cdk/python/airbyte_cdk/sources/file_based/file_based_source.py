@@ -17,10 +17,12 @@ from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, Fil
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types import default_parsers
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
 from airbyte_cdk.sources.file_based.schema_validation_policies import DEFAULT_SCHEMA_VALIDATION_POLICIES, AbstractSchemaValidationPolicy
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream, DefaultFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.stream.cursor.default_file_based_cursor import DefaultFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.default_file_based_stream import DEFAULT_N_CONCURRENT_FILE_READS
 from airbyte_cdk.sources.streams import Stream
 from pydantic.error_wrappers import ValidationError
 
@@ -36,6 +38,8 @@ class FileBasedSource(AbstractSource, ABC):
         parsers: Mapping[Type[Any], FileTypeParser] = default_parsers,
         validation_policies: Mapping[ValidationPolicy, AbstractSchemaValidationPolicy] = DEFAULT_SCHEMA_VALIDATION_POLICIES,
         cursor_cls: Type[AbstractFileBasedCursor] = DefaultFileBasedCursor,
+        n_concurrent_file_reads: int = DEFAULT_N_CONCURRENT_FILE_READS,
+        schema_inference_cache: Optional[SchemaInferenceCache] = None,
     ):
         self.stream_reader = stream_reader
         self.spec_class = spec_class
@@ -46,6 +50,8 @@ class FileBasedSource(AbstractSource, ABC):
         catalog = self.read_catalog(catalog_path) if catalog_path else None
         self.stream_schemas = {s.stream.name: s.stream.json_schema for s in catalog.streams} if catalog else {}
         self.cursor_cls = cursor_cls
+        self.n_concurrent_file_reads = n_concurrent_file_reads
+        self.schema_inference_cache = schema_inference_cache
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
@@ -104,6 +110,8 @@ class FileBasedSource(AbstractSource, ABC):
                         parsers=self.parsers,
                         validation_policy=self._validate_and_get_validation_policy(stream_config),
                         cursor=self.cursor_cls(stream_config),
+                        n_concurrent_file_reads=self.n_concurrent_file_reads,
+                        schema_inference_cache=self.schema_inference_cache,
                     )
                 )
             return streams
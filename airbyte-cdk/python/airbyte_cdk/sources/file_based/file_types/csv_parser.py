@@ -3,16 +3,26 @@
 #
 
 import csv
+import io
+import itertools
 import json
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from functools import partial
 from io import IOBase
-from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set
+from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple, Type
 
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
-from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
+from airbyte_cdk.sources.file_based.config.csv_format import (
+    CsvFormat,
+    CsvHeaderAutogenerated,
+    CsvHeaderUserProvided,
+    CsvParsingEngine,
+    InferenceType,
+)
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
@@ -21,8 +31,6 @@ from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING, SchemaType
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
-DIALECT_NAME = "_config_dialect"
-
 
 class _CsvReader:
     def read_data(
@@ -36,20 +44,9 @@ class _CsvReader:
         config_format = _extract_format(config)
         lineno = 0
 
-        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
-        # We don't unregister the dialect because we are lazily parsing each csv file to generate records
-        # This will potentially be a problem if we ever process multiple streams concurrently
-        dialect_name = config.name + DIALECT_NAME
-        csv.register_dialect(
-            dialect_name,
-            delimiter=config_format.delimiter,
-            quotechar=config_format.quote_char,
-            escapechar=config_format.escape_char,
-            doublequote=config_format.double_quote,
-            quoting=csv.QUOTE_MINIMAL,
-        )
+        dialect = _get_dialect(config_format)
         with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
-            headers = self._get_headers(fp, config_format, dialect_name)
+            headers = self._get_headers(fp, config_format, dialect)
 
             rows_to_skip = (
                 config_format.skip_rows_before_header
@@ -59,52 +56,47 @@ class _CsvReader:
             self._skip_rows(fp, rows_to_skip)
             lineno += rows_to_skip
 
-            reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
-            try:
-                for row in reader:
-                    lineno += 1
-
-                    # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
-                    # than headers or more headers dans columns
-                    if None in row:
-                        raise RecordParseError(
-                            FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS,
-                            filename=file.uri,
-                            lineno=lineno,
-                        )
-                    if None in row.values():
-                        raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS, filename=file.uri, lineno=lineno)
-                    yield row
-            finally:
-                # due to RecordParseError or GeneratorExit
-                csv.unregister_dialect(dialect_name)
-
-    def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
+            reader = csv.DictReader(fp, dialect=dialect, fieldnames=headers)  # type: ignore
+            for row in reader:
+                lineno += 1
+
+                # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
+                # than headers or more headers dans columns
+                if None in row:
+                    raise RecordParseError(
+                        FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS,
+                        filename=file.uri,
+                        lineno=lineno,
+                    )
+                if None in row.values():
+                    raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS, filename=file.uri, lineno=lineno)
+                yield row
+
+    def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect: Type[csv.Dialect]) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
         """
-        # Note that this method assumes the dialect has already been registered if we're parsing the headers
         if isinstance(config_format.header_definition, CsvHeaderUserProvided):
             return config_format.header_definition.column_names  # type: ignore  # should be CsvHeaderUserProvided given the type
 
         if isinstance(config_format.header_definition, CsvHeaderAutogenerated):
             self._skip_rows(fp, config_format.skip_rows_before_header + config_format.skip_rows_after_header)
-            headers = self._auto_generate_headers(fp, dialect_name)
+            headers = self._auto_generate_headers(fp, dialect)
         else:
             # Then read the header
             self._skip_rows(fp, config_format.skip_rows_before_header)
-            reader = csv.reader(fp, dialect=dialect_name)  # type: ignore
+            reader = csv.reader(fp, dialect=dialect)  # type: ignore
             headers = list(next(reader))
 
         fp.seek(0)
         return headers
 
-    def _auto_generate_headers(self, fp: IOBase, dialect_name: str) -> List[str]:
+    def _auto_generate_headers(self, fp: IOBase, dialect: Type[csv.Dialect]) -> List[str]:
         """
         Generates field names as [f0, f1, ...] in the same way as pyarrow's csv reader with autogenerate_column_names=True.
         See https://arrow.apache.org/docs/python/generated/pyarrow.csv.ReadOptions.html
         """
-        reader = csv.reader(fp, dialect=dialect_name)  # type: ignore
+        reader = csv.reader(fp, dialect=dialect)  # type: ignore
         number_of_columns = len(next(reader))  # type: ignore
         return [f"f{i}" for i in range(number_of_columns)]
 
@@ -117,11 +109,115 @@ class _CsvReader:
             fp.readline()
 
 
+class _PyArrowCsvReader(_CsvReader):
+    """
+    Reads csv files by blocks of rows using pyarrow.
+
+    The rows before the data and the headers are handled as in _CsvReader. All the values are read as strings so that they can be cast
+    exactly like the values read by _CsvReader.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    def read_blocks(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+    ) -> Generator[Tuple[List[str], List[List[str]]], None, None]:
+        """
+        Yields the headers and the values of each column for each block of rows
+        """
+        config_format = _extract_format(config)
+        with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
+            headers = self._get_headers(fp, config_format, _get_dialect(config_format))
+            if not headers:
+                raise ValueError("pyarrow can't read csv files without columns")
+
+            rows_to_skip = (
+                config_format.skip_rows_before_header
+                + (1 if config_format.header_definition.has_header_row() else 0)
+                + config_format.skip_rows_after_header
+            )
+            self._skip_rows(fp, rows_to_skip)
+
+            stream = _Utf8Stream(fp, config_format.quote_char + config_format.escape_char if config_format.escape_char else None)
+            reader = pa_csv.open_csv(
+                stream,
+                read_options=pa_csv.ReadOptions(column_names=headers, block_size=self.BLOCK_SIZE),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=config_format.delimiter,
+                    quote_char=config_format.quote_char,
+                    double_quote=config_format.double_quote,
+                    escape_char=config_format.escape_char or False,
+                    newlines_in_values=True,
+                    ignore_empty_lines=True,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={header: pa.string() for header in headers},
+                    null_values=[],
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            # The python reader parses escape characters differently from pyarrow right after a closing quote and at the end of the file.
+            # Each block is held back until the text following it was read so that the blocks where this could happen are left to it.
+            previous_batch = None
+            for batch in reader:
+                if stream.has_unsupported_text:
+                    raise ValueError("The file has an escape character following a quote character")
+                if previous_batch is not None:
+                    yield headers, [column.to_pylist() for column in previous_batch.columns]
+                previous_batch = batch
+            if stream.has_unsupported_text or (config_format.escape_char and stream.last_character == config_format.escape_char):
+                raise ValueError("The file has an escape character following a quote character or ending the file")
+            if previous_batch is not None:
+                yield headers, [column.to_pylist() for column in previous_batch.columns]
+
+
+class _Utf8Stream(io.RawIOBase):
+    """
+    Binary stream of the utf-8 encoding of a text stream, so that pyarrow parses the text as decoded by the stream reader.
+
+    The stream also records whether the text read so far contains `unsupported_text`.
+    """
+
+    _READ_SIZE = 64 * 1024
+
+    def __init__(self, text_stream: IOBase, unsupported_text: Optional[str] = None):
+        self._text_stream = text_stream
+        self._unsupported_text = unsupported_text
+        self._pending = bytearray()
+        self.last_character = ""
+        self.has_unsupported_text = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while len(self._pending) < len(buffer):
+            text = self._text_stream.read(max(len(buffer), self._READ_SIZE))
+            if not text:
+                break
+            if self._unsupported_text and not self.has_unsupported_text:
+                # The unsupported text can span two reads
+                self.has_unsupported_text = self._unsupported_text in self.last_character + text
+            self.last_character = text[-1]
+            self._pending += text.encode("utf-8")
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        del self._pending[:size]
+        return size
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None):
+    def __init__(self, csv_reader: Optional[_CsvReader] = None, pyarrow_csv_reader: Optional[_PyArrowCsvReader] = None):
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._pyarrow_csv_reader = pyarrow_csv_reader if pyarrow_csv_reader else _PyArrowCsvReader()
 
     async def infer_schema(
         self,
@@ -179,11 +275,101 @@ class CsvParser(FileTypeParser):
         else:
             deduped_property_types = {}
         cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
+        n_rows_read = 0
+        if config_format.parsing_engine == CsvParsingEngine.PYARROW:
+            # Count the rows read by blocks so that the python reader can resume after them if pyarrow can't parse the rest of the file
+            for record in self._parse_records_by_blocks(config, file, stream_reader, logger, deduped_property_types):
+                if record is None:
+                    break
+                n_rows_read += 1
+                yield record
+            else:
+                return
         data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
-        for row in data_generator:
+        for row in itertools.islice(data_generator, n_rows_read, None):
             yield CsvParser._to_nullable(cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null)
         data_generator.close()
 
+    def _parse_records_by_blocks(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        deduped_property_types: Mapping[str, str],
+    ) -> Generator[Optional[Dict[str, Any]], None, None]:
+        """
+        Yields the records read by the pyarrow reader, casting the values one column at a time.
+
+        pyarrow refuses blocks that the python reader would either reject with a RecordParseError, like rows with a different number of
+        values than there are headers, or accept with its own interpretation. In both cases, None is yielded once all the rows of the
+        previous blocks were yielded so that the python reader handles the rest of the file.
+        """
+        config_format = _extract_format(config)
+        blocks = self._pyarrow_csv_reader.read_blocks(config, file, stream_reader, logger, self.file_read_mode)
+        try:
+            while True:
+                try:
+                    headers, columns = next(blocks)
+                except StopIteration:
+                    return
+                except Exception as exc:
+                    logger.debug(f"Reading the rest of {file.uri} with the python csv reader as pyarrow could not parse it: {exc}")
+                    yield None
+                    return
+                yield from CsvParser._records_from_columns(
+                    headers, columns, deduped_property_types, config_format, logger, bool(deduped_property_types) and not config.schemaless
+                )
+        finally:
+            blocks.close()
+
+    @staticmethod
+    def _records_from_columns(
+        headers: List[str],
+        columns: List[List[str]],
+        deduped_property_types: Mapping[str, str],
+        config_format: CsvFormat,
+        logger: logging.Logger,
+        cast: bool,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Builds the records of a block the same way as casting and nulling the rows of _CsvReader one by one would.
+        """
+        # When a header is duplicated, the row has its first position and its last value
+        column_index_by_header = {header: index for index, header in enumerate(headers)}
+        output_headers: List[str] = []
+        output_columns: List[List[Any]] = []
+        warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+        first_error: Optional[Tuple[int, Exception]] = None
+        for header in column_index_by_header:
+            prop_type = deduped_property_types.get(header)
+            values: List[Any] = columns[column_index_by_header[header]]
+            if cast:
+                if prop_type not in TYPE_PYTHON_MAPPING or prop_type is None:
+                    continue
+                values = _cast_column(header, values, prop_type, config_format, warnings_by_row)
+            values, error = _null_column(values, prop_type, config_format.null_values, config_format.strings_can_be_null)
+            if error and (first_error is None or error[0] < first_error[0]):
+                first_error = error
+            output_headers.append(header)
+            output_columns.append(values)
+
+        n_rows = len(columns[0]) if columns else 0
+        n_rows_to_emit = first_error[0] if first_error else n_rows
+        rows = zip(*output_columns) if output_columns else itertools.repeat((), n_rows)
+        if not warnings_by_row:
+            for row in itertools.islice(rows, n_rows_to_emit):
+                yield dict(zip(output_headers, row))
+        else:
+            for row_index, row in enumerate(itertools.islice(rows, n_rows_to_emit)):
+                if row_index in warnings_by_row:
+                    _log_cast_warnings(logger, warnings_by_row[row_index])
+                yield dict(zip(output_headers, row))
+        if first_error:
+            if first_error[0] in warnings_by_row:
+                _log_cast_warnings(logger, warnings_by_row[first_error[0]])
+            raise first_error[1]
+
     @property
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ
@@ -298,9 +484,7 @@ class CsvParser(FileTypeParser):
                 result[key] = cast_value
 
         if warnings:
-            logger.warning(
-                f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join([w for w in warnings])}",
-            )
+            _log_cast_warnings(logger, warnings)
         return result
 
 
@@ -417,10 +601,99 @@ def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
 
+def _log_cast_warnings(logger: logging.Logger, warnings: List[str]) -> None:
+    logger.warning(
+        f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join([w for w in warnings])}",
+    )
+
+
+def _cast_column(
+    key: str, values: List[str], prop_type: str, config_format: CsvFormat, warnings_by_row: Dict[int, List[str]]
+) -> List[Any]:
+    """
+    Casts the values of a column like CsvParser._cast_types casts the values of a row, adding the warnings for the values that could not
+    be cast to the warnings of their row.
+    """
+    _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+    if python_type == str:
+        return values
+
+    cast_function: Callable[[str], Any]
+    if python_type is None:
+        cast_function = _value_to_null
+    elif python_type == bool:
+        cast_function = partial(_value_to_bool, true_values=config_format.true_values, false_values=config_format.false_values)
+    elif python_type == dict:
+        cast_function = json.loads
+    elif python_type == list:
+        cast_function = _value_to_list
+    else:
+        cast_function = python_type
+        try:
+            return list(map(cast_function, values))
+        except ValueError:
+            pass
+
+    cast_values: List[Any] = []
+    for row_index, value in enumerate(values):
+        try:
+            cast_values.append(cast_function(value))
+        except ValueError:
+            # json.JSONDecodeError is a ValueError
+            warnings_by_row[row_index].append(_format_warning(key, value, prop_type))
+            cast_values.append(value)
+    return cast_values
+
+
+def _null_column(
+    values: List[Any], prop_type: Optional[str], null_values: Set[str], strings_can_be_null: bool
+) -> Tuple[List[Any], Optional[Tuple[int, Exception]]]:
+    """
+    Replaces the null values of a column like CsvParser._to_nullable does for a row. If checking a value fails, returns the values before
+    it along with the index of the value and the error.
+    """
+    # Checking values that are not hashable, like objects and arrays, against the null values fails even when there are no null values
+    if prop_type not in ("object", "array"):
+        if not null_values or (not strings_can_be_null and prop_type == "string"):
+            return values, None
+        return [None if value in null_values else value for value in values], None
+
+    nulled_values: List[Any] = []
+    for row_index, value in enumerate(values):
+        try:
+            nulled_values.append(None if CsvParser._value_is_none(value, prop_type, null_values, strings_can_be_null) else value)
+        except Exception as exc:
+            return nulled_values, (row_index, exc)
+    return nulled_values, None
+
+
+def _value_to_null(value: str) -> None:
+    if value == "":
+        return None
+    raise ValueError(f"Value {value} is not a valid null value")
+
+
 def _no_cast(row: Mapping[str, str]) -> Mapping[str, str]:
     return row
 
 
+def _get_dialect(config_format: CsvFormat) -> Type[csv.Dialect]:
+    """
+    Files of a stream can be read concurrently, so the dialect is passed to each reader instead of being registered under a shared name
+    """
+    return type(
+        "ConfigDialect",
+        (csv.excel,),
+        {
+            "delimiter": config_format.delimiter,
+            "quotechar": config_format.quote_char,
+            "escapechar": config_format.escape_char,
+            "doublequote": config_format.double_quote,
+            "quoting": csv.QUOTE_MINIMAL,
+        },
+    )
+
+
 def _extract_format(config: FileBasedStreamConfig) -> CsvFormat:
     config_format = config.format
     if not isinstance(config_format, CsvFormat):
@@ -5,7 +5,7 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -63,12 +63,11 @@ class ParquetParser(FileTypeParser):
             partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
             for row_group in range(reader.num_row_groups):
                 batch = reader.read_row_group(row_group)
-                for row in range(batch.num_rows):
+                # Convert each column of the row group at once so that the type dispatch happens per column rather than per cell
+                columns = [ParquetParser._to_output_column(batch.column(column), parquet_format) for column in batch.column_names]
+                for row in zip(*columns):
                     yield {
-                        **{
-                            column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                            for column in batch.column_names
-                        },
+                        **dict(zip(batch.column_names, row)),
                         **partition_columns,
                     }
 
@@ -80,6 +79,53 @@ class ParquetParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ_BINARY
 
+    @staticmethod
+    def _to_output_column(parquet_column: pa.ChunkedArray, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a whole pyarrow column to a list of values that can be output by the source.
+
+        The output values are the same as the ones produced by `_to_output_value` for each of the column's scalars.
+        """
+        if pa.types.is_dictionary(parquet_column.type):
+            # Dictionaries are rare enough that we keep converting them one scalar at a time
+            return [ParquetParser._to_output_value(parquet_value, parquet_format) for parquet_value in parquet_column]
+
+        py_values: List[Any] = parquet_column.to_pylist()
+        converter = ParquetParser._python_value_converter(parquet_column.type, parquet_format)
+        if converter is None:
+            return py_values
+        return [None if py_value is None else converter(py_value) for py_value in py_values]
+
+    @staticmethod
+    def _python_value_converter(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the python representation of a non-null value of the given pyarrow type to a value that can be
+        output by the source, or None if the python representation can be output as is.
+        """
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return lambda py_value: py_value.isoformat()
+        if parquet_type == pa.month_day_nano_interval():
+            return list
+        if ParquetParser._is_binary(parquet_type):
+            return lambda py_value: py_value.decode("utf-8")
+        if pa.types.is_decimal(parquet_type):
+            return None if parquet_format.decimal_as_float else str
+        if pa.types.is_map(parquet_type):
+            return dict
+        if pa.types.is_duration(parquet_type):
+            unit = parquet_type.unit
+            if unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif unit == "ns":
+                return lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
+            else:
+                raise ValueError(f"Unknown duration unit: {unit}")
+        return None
+
     @staticmethod
     def _to_output_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
         """
@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Optional, Set
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
+
+
+class SchemaInferenceCache:
+    """
+    Keeps the schemas inferred for each file in a json file on disk so that files which did not change since a previous discover are not
+    read again.
+
+    Schemas are keyed by the uri and last modification time of the file, and by the format options of the stream since they change the
+    inferred schema. The cache is loaded on first use and written back by `save`; a missing or unreadable cache file is treated as empty.
+    Only the schemas of the files looked up since the cache was loaded are written back, so the entries of files that were deleted,
+    modified or are no longer used for inference do not pile up from one discover to the next.
+    """
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self._path = path
+        self._logger = logger or logging.getLogger("airbyte")
+        self._schemas: Optional[Dict[str, SchemaType]] = None
+        self._has_changes = False
+        self._seen_keys: Set[str] = set()
+
+    def get(self, config: FileBasedStreamConfig, file: RemoteFile) -> Optional[SchemaType]:
+        key = self._key(config, file)
+        self._seen_keys.add(key)
+        return self._load().get(key)
+
+    def set(self, config: FileBasedStreamConfig, file: RemoteFile, schema: SchemaType) -> None:
+        key = self._key(config, file)
+        self._seen_keys.add(key)
+        self._load()[key] = schema
+        self._has_changes = True
+
+    def save(self) -> None:
+        """
+        Writes the cache to disk if schemas were added since it was loaded or if some of its schemas were not looked up, in which case they
+        are dropped from the file. They are kept in memory as the streams not discovered yet may still look them up before the next save.
+        The file is replaced atomically so that a concurrent discover never reads a partially written cache.
+        """
+        if self._schemas is None:
+            return
+        schemas = {key: schema for key, schema in self._schemas.items() if key in self._seen_keys}
+        if not self._has_changes and len(schemas) == len(self._schemas):
+            return
+        directory = os.path.dirname(os.path.abspath(self._path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=directory, delete=False, suffix=".tmp") as temporary_file:
+                json.dump(schemas, temporary_file)
+            os.replace(temporary_file.name, self._path)
+            self._has_changes = False
+        except OSError as exc:
+            self._logger.warning(f"Could not write the schema inference cache to {self._path}: {exc}")
+
+    def _load(self) -> Dict[str, SchemaType]:
+        if self._schemas is None:
+            try:
+                with open(self._path) as cache_file:
+                    schemas = json.load(cache_file)
+                self._schemas = schemas if isinstance(schemas, dict) else {}
+            except FileNotFoundError:
+                self._schemas = {}
+            except (OSError, ValueError) as exc:
+                self._logger.warning(f"Ignoring the schema inference cache at {self._path} as it could not be read: {exc}")
+                self._schemas = {}
+        return self._schemas
+
+    @staticmethod
+    def _key(config: FileBasedStreamConfig, file: RemoteFile) -> str:
+        format_hash = hashlib.sha256(config.format.json(sort_keys=True).encode("utf-8")).hexdigest()
+        return f"{format_hash}:{file.last_modified.isoformat()}:{file.uri}"
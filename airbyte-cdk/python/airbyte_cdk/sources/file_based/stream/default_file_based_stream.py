@@ -7,7 +7,7 @@ import itertools
 import traceback
 from copy import deepcopy
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Generator, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
@@ -21,31 +21,64 @@ from airbyte_cdk.sources.file_based.exceptions import (
     SchemaInferenceError,
     StopSyncPerValidationPolicy,
 )
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType, merge_schemas, schemaless_schema
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams import IncrementalMixin
 from airbyte_cdk.sources.streams.core import JsonSchema
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils.concurrent_iterators import iterate_concurrently
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
+DEFAULT_N_CONCURRENT_FILE_READS = 1
+
+
+class _FileReadCompleted:
+    """
+    Follows the messages of a file read by a worker once all the records of the file were read
+    """
+
+    def __init__(self, file: RemoteFile):
+        self.file = file
+
 
 class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
     """
     The default file-based stream.
+
+    Files are read one after another unless `n_concurrent_file_reads` is greater than 1. In that case, that many files are opened and
+    parsed at once by worker threads. Their messages are still emitted file after file, in the same order as a sequential read.
     """
 
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
     ab_last_mod_col = "_ab_source_file_last_modified"
     ab_file_name_col = "_ab_source_file_url"
     airbyte_columns = [ab_last_mod_col, ab_file_name_col]
-
-    def __init__(self, cursor: AbstractFileBasedCursor, **kwargs: Any):
+    # Number of messages a worker can read ahead from a file before waiting for them to be emitted
+    MAX_BUFFERED_MESSAGES_PER_FILE = 1000
+    # Messages are handed over from the workers in batches to limit the synchronization overhead per record
+    MESSAGES_PER_BATCH = 100
+    # When reading files concurrently, slices hold at least this many files per worker so that workers are not idle at slice boundaries
+    MIN_FILES_PER_WORKER_IN_SLICE = 4
+
+    def __init__(
+        self,
+        cursor: AbstractFileBasedCursor,
+        n_concurrent_file_reads: int = DEFAULT_N_CONCURRENT_FILE_READS,
+        schema_inference_cache: Optional[SchemaInferenceCache] = None,
+        **kwargs: Any,
+    ):
         super().__init__(**kwargs)
+        if n_concurrent_file_reads < 1:
+            raise ValueError(f"n_concurrent_file_reads must be a positive integer, got {n_concurrent_file_reads}")
         self._cursor = cursor
+        self._n_concurrent_file_reads = n_concurrent_file_reads
+        self._schema_inference_cache = schema_inference_cache
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -65,9 +98,24 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         all_files = self.list_files()
         files_to_read = self._cursor.get_files_to_sync(all_files, self.logger)
         sorted_files_to_read = sorted(files_to_read, key=lambda f: (f.last_modified, f.uri))
-        slices = [{"files": list(group[1])} for group in itertools.groupby(sorted_files_to_read, lambda f: f.last_modified)]
+        slices: List[StreamSlice] = [{"files": list(group[1])} for group in itertools.groupby(sorted_files_to_read, lambda f: f.last_modified)]
+        if self._n_concurrent_file_reads > 1:
+            return self._merge_slices(slices, self._n_concurrent_file_reads * self.MIN_FILES_PER_WORKER_IN_SLICE)
         return slices
 
+    @staticmethod
+    def _merge_slices(slices: List[StreamSlice], min_n_files: int) -> List[StreamSlice]:
+        """
+        Merges consecutive slices until they hold at least `min_n_files` files. Files with the same last_modified stay in the same slice.
+        """
+        merged_slices: List[StreamSlice] = []
+        for stream_slice in slices:
+            if merged_slices and len(merged_slices[-1]["files"]) < min_n_files:
+                merged_slices[-1]["files"].extend(stream_slice["files"])
+            else:
+                merged_slices.append({"files": list(stream_slice["files"])})
+        return merged_slices
+
     def read_records_from_slice(self, stream_slice: StreamSlice) -> Iterable[AirbyteMessage]:
         """
         Yield all records from all remote files in `list_files_for_this_sync`.
@@ -81,65 +129,115 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
+        if self._n_concurrent_file_reads > 1:
+            yield from self._read_files_concurrently(parser, schema, stream_slice["files"])
+            return
         for file in stream_slice["files"]:
-            # only serialize the datetime once
-            file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
-            n_skipped = line_no = 0
-
             try:
-                for record in parser.parse_records(self.config, file, self.stream_reader, self.logger, schema):
-                    line_no += 1
-                    if self.config.schemaless:
-                        record = {"data": record}
-                    elif not self.record_passes_validation_policy(record):
-                        n_skipped += 1
-                        continue
-                    record[self.ab_last_mod_col] = file_datetime_string
-                    record[self.ab_file_name_col] = file.uri
-                    yield stream_data_to_airbyte_message(self.name, record)
-                self._cursor.add_file(file)
-
+                is_file_read = yield from self._read_file(parser, schema, file)
             except StopSyncPerValidationPolicy:
-                yield AirbyteMessage(
-                    type=MessageType.LOG,
-                    log=AirbyteLogMessage(
-                        level=Level.WARN,
-                        message=f"Stopping sync in accordance with the configured validation policy. Records in file did not conform to the schema. stream={self.name} file={file.uri} validation_policy={self.config.validation_policy.value} n_skipped={n_skipped}",
-                    ),
-                )
                 break
+            if is_file_read:
+                self._cursor.add_file(file)
+
+    def _read_file(
+        self, parser: FileTypeParser, schema: Mapping[str, Any], file: RemoteFile
+    ) -> Generator[AirbyteMessage, None, bool]:
+        """
+        Yield the records of a file and the logs about them. Return True if all the records of the file were read.
+
+        If an error is encountered reading records from the file, log a message and do not attempt to read the rest of the file.
+        If the validation policy requires the sync to stop, log a message and raise StopSyncPerValidationPolicy.
+        """
+        # only serialize the datetime once
+        file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+        n_skipped = line_no = 0
 
-            except RecordParseError:
-                # Increment line_no because the exception was raised before we could increment it
+        try:
+            for record in parser.parse_records(self.config, file, self.stream_reader, self.logger, schema):
                 line_no += 1
+                if self.config.schemaless:
+                    record = {"data": record}
+                elif not self.record_passes_validation_policy(record):
+                    n_skipped += 1
+                    continue
+                record[self.ab_last_mod_col] = file_datetime_string
+                record[self.ab_file_name_col] = file.uri
+                yield stream_data_to_airbyte_message(self.name, record)
+            return True
+
+        except StopSyncPerValidationPolicy:
+            yield AirbyteMessage(
+                type=MessageType.LOG,
+                log=AirbyteLogMessage(
+                    level=Level.WARN,
+                    message=f"Stopping sync in accordance with the configured validation policy. Records in file did not conform to the schema. stream={self.name} file={file.uri} validation_policy={self.config.validation_policy.value} n_skipped={n_skipped}",
+                ),
+            )
+            raise
+
+        except RecordParseError:
+            # Increment line_no because the exception was raised before we could increment it
+            line_no += 1
+            yield AirbyteMessage(
+                type=MessageType.LOG,
+                log=AirbyteLogMessage(
+                    level=Level.ERROR,
+                    message=f"{FileBasedSourceError.ERROR_PARSING_RECORD.value} stream={self.name} file={file.uri} line_no={line_no} n_skipped={n_skipped}",
+                    stack_trace=traceback.format_exc(),
+                ),
+            )
+
+        except Exception:
+            yield AirbyteMessage(
+                type=MessageType.LOG,
+                log=AirbyteLogMessage(
+                    level=Level.ERROR,
+                    message=f"{FileBasedSourceError.ERROR_PARSING_RECORD.value} stream={self.name} file={file.uri} line_no={line_no} n_skipped={n_skipped}",
+                    stack_trace=traceback.format_exc(),
+                ),
+            )
+
+        finally:
+            if n_skipped:
                 yield AirbyteMessage(
                     type=MessageType.LOG,
                     log=AirbyteLogMessage(
-                        level=Level.ERROR,
-                        message=f"{FileBasedSourceError.ERROR_PARSING_RECORD.value} stream={self.name} file={file.uri} line_no={line_no} n_skipped={n_skipped}",
-                        stack_trace=traceback.format_exc(),
+                        level=Level.WARN,
+                        message=f"Records in file did not pass validation policy. stream={self.name} file={file.uri} n_skipped={n_skipped} validation_policy={self.validation_policy.name}",
                     ),
                 )
+        return False
 
-            except Exception:
-                yield AirbyteMessage(
-                    type=MessageType.LOG,
-                    log=AirbyteLogMessage(
-                        level=Level.ERROR,
-                        message=f"{FileBasedSourceError.ERROR_PARSING_RECORD.value} stream={self.name} file={file.uri} line_no={line_no} n_skipped={n_skipped}",
-                        stack_trace=traceback.format_exc(),
-                    ),
-                )
+    def _read_files_concurrently(self, parser: FileTypeParser, schema: Mapping[str, Any], files: List[RemoteFile]) -> Iterable[AirbyteMessage]:
+        """
+        Read up to `n_concurrent_file_reads` files at once and yield their messages file after file.
 
-            finally:
-                if n_skipped:
-                    yield AirbyteMessage(
-                        type=MessageType.LOG,
-                        log=AirbyteLogMessage(
-                            level=Level.WARN,
-                            message=f"Records in file did not pass validation policy. stream={self.name} file={file.uri} n_skipped={n_skipped} validation_policy={self.validation_policy.name}",
-                        ),
-                    )
+        Each worker buffers a bounded number of messages so a slow consumer pauses the workers instead of accumulating records in memory.
+        Files are added to the cursor from the consuming thread once all of their messages were yielded, as in a sequential read.
+        """
+        messages = iterate_concurrently(
+            (self._read_file_until_completed(parser, schema, file) for file in files),
+            n_workers=self._n_concurrent_file_reads,
+            max_buffered_items=self.MAX_BUFFERED_MESSAGES_PER_FILE,
+            batch_size=self.MESSAGES_PER_BATCH,
+            thread_name_prefix=f"{self.name}_reader",
+        )
+        try:
+            for message in messages:
+                if isinstance(message, _FileReadCompleted):
+                    self._cursor.add_file(message.file)
+                else:
+                    yield message
+        except StopSyncPerValidationPolicy:
+            return
+
+    def _read_file_until_completed(
+        self, parser: FileTypeParser, schema: Mapping[str, Any], file: RemoteFile
+    ) -> Generator[Union[AirbyteMessage, _FileReadCompleted], None, None]:
+        is_file_read = yield from self._read_file(parser, schema, file)
+        if is_file_read:
+            yield _FileReadCompleted(file)
 
     @property
     def cursor_field(self) -> Union[str, List[str]]:
@@ -211,6 +309,8 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     def infer_schema(self, files: List[RemoteFile]) -> Mapping[str, Any]:
         loop = asyncio.get_event_loop()
         schema = loop.run_until_complete(self._infer_schema(files))
+        if self._schema_inference_cache:
+            self._schema_inference_cache.save()
         # as infer schema returns a Mapping that is assumed to be immutable, we need to create a deepcopy to avoid modifying the reference
         return self._fill_nulls(deepcopy(schema))
 
@@ -259,8 +359,12 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         return base_schema
 
     async def _infer_file_schema(self, file: RemoteFile) -> SchemaType:
+        if self._schema_inference_cache:
+            cached_schema = self._schema_inference_cache.get(self.config, file)
+            if cached_schema is not None:
+                return cached_schema
         try:
-            return await self.get_parser().infer_schema(self.config, file, self.stream_reader, self.logger)
+            schema = await self.get_parser().infer_schema(self.config, file, self.stream_reader, self.logger)
         except Exception as exc:
             raise SchemaInferenceError(
                 FileBasedSourceError.SCHEMA_INFERENCE_ERROR,
@@ -268,3 +372,6 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                 format=str(self.config.format),
                 stream=self.name,
             ) from exc
+        if self._schema_inference_cache:
+            self._schema_inference_cache.set(self.config, file, schema)
+        return schema
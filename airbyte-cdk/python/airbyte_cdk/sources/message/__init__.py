@@ -8,6 +8,14 @@ from .repository import (
     LogMessage,
     MessageRepository,
     NoopMessageRepository,
+    StructuredLogMessage,
 )
 
-__all__ = ["InMemoryMessageRepository", "LogAppenderMessageRepositoryDecorator", "LogMessage", "MessageRepository", "NoopMessageRepository"]
+__all__ = [
+    "InMemoryMessageRepository",
+    "LogAppenderMessageRepositoryDecorator",
+    "LogMessage",
+    "MessageRepository",
+    "NoopMessageRepository",
+    "StructuredLogMessage",
+]
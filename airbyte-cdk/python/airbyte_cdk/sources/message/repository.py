@@ -11,6 +11,7 @@ from typing import Callable, Deque, Iterable, List, Optional
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
+from pydantic import PrivateAttr
 
 _LOGGER = logging.getLogger("MessageRepository")
 _SUPPORTED_MESSAGE_TYPES = {Type.CONTROL, Type.LOG}
@@ -26,6 +27,35 @@ _SEVERITY_BY_LOG_LEVEL = {
 }
 
 
+class StructuredLogMessage(AirbyteLogMessage):
+    """
+    Log message keeping the content it was serialized from so that in-process consumers, like the connector builder grouping the HTTP
+    requests and responses, don't need to parse the message back. The content is not part of the serialized message.
+    """
+
+    _content: LogMessage = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def from_content(cls, level: Level, content: LogMessage) -> "StructuredLogMessage":
+        log_message = cls(level=level, message=json.dumps(content))
+        log_message._content = content
+        return log_message
+
+    @property
+    def content(self) -> LogMessage:
+        return self._content
+
+
+def _filter_secrets(value: JsonType) -> JsonType:
+    if isinstance(value, str):
+        return filter_secrets(value)
+    if isinstance(value, dict):
+        return {filter_secrets(key): _filter_secrets(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_filter_secrets(item) for item in value]
+    return value
+
+
 def _is_severe_enough(threshold: Level, level: Level) -> bool:
     if threshold not in _SEVERITY_BY_LOG_LEVEL:
         _LOGGER.warning(f"Log level {threshold} for threshold is not supported. This is probably a CDK bug. Please contact Airbyte.")
@@ -85,13 +115,17 @@ class InMemoryMessageRepository(MessageRepository):
 
     def log_message(self, level: Level, message_provider: Callable[[], LogMessage]) -> None:
         if _is_severe_enough(self._log_level, level):
-            self.emit_message(
-                AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=level, message=filter_secrets(json.dumps(message_provider()))))
-            )
+            # Secrets are filtered out of the content rather than out of the serialized message so that the content can be kept along
+            content: LogMessage = _filter_secrets(message_provider())  # type: ignore # a LogMessage is filtered into a LogMessage
+            self.emit_message(AirbyteMessage(type=Type.LOG, log=StructuredLogMessage.from_content(level, content)))
 
     def consume_queue(self) -> Iterable[AirbyteMessage]:
-        while self._message_queue:
-            yield self._message_queue.popleft()
+        # The queue can be consumed from several threads so it is popped until empty instead of checking its length first
+        while True:
+            try:
+                yield self._message_queue.popleft()
+            except IndexError:
+                return
 
 
 class LogAppenderMessageRepositoryDecorator(MessageRepository):
@@ -3,12 +3,13 @@
 #
 
 import concurrent
-import time
+import warnings
+from collections import deque
 from concurrent.futures import Future
 from functools import lru_cache
 from logging import Logger
-from queue import Queue
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from queue import Empty, Queue
+from typing import Any, Callable, Deque, Iterable, List, Mapping, Optional, Set
 
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.message import MessageRepository
@@ -28,6 +29,7 @@ class ThreadBasedConcurrentStream(AbstractStream):
     DEFAULT_TIMEOUT_SECONDS = 900
     DEFAULT_MAX_QUEUE_SIZE = 10_000
     DEFAULT_SLEEP_TIME = 0.1
+    DEFAULT_DRAIN_TIMEOUT_SECONDS = 0.1
 
     def __init__(
         self,
@@ -43,9 +45,19 @@ class ThreadBasedConcurrentStream(AbstractStream):
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
         max_concurrent_tasks: int = DEFAULT_MAX_QUEUE_SIZE,
-        sleep_time: float = DEFAULT_SLEEP_TIME,
+        sleep_time: Optional[float] = None,
         namespace: Optional[str] = None,
+        *,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
     ):
+        """
+        :param sleep_time: deprecated and ignored, partitions are scheduled when the running ones complete instead of polling them
+        :param max_queue_size: maximum number of records and partitions waiting in the work queue for the main thread
+        """
+        if sleep_time is not None:
+            warnings.warn(
+                "The sleep_time argument of ThreadBasedConcurrentStream is deprecated and ignored", DeprecationWarning, stacklevel=2
+            )
         self._stream_partition_generator = partition_generator
         self._max_workers = max_workers
         self._threadpool = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="workerpool")
@@ -59,7 +71,7 @@ class ThreadBasedConcurrentStream(AbstractStream):
         self._message_repository = message_repository
         self._timeout_seconds = timeout_seconds
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._sleep_time = sleep_time
+        self._max_queue_size = max_queue_size
         self._namespace = namespace
 
     def read(self) -> Iterable[Record]:
@@ -71,66 +83,81 @@ class ThreadBasedConcurrentStream(AbstractStream):
           - This has to be done asynchronously because we sometimes need to submit requests to the API to generate all partitions (eg for substreams).
           - The future will add the partitions to process on a work queue
         2. Continuously poll work from the work queue until all partitions are generated and processed
-          - If the next work item is a partition, submit a future to process it.
+          - If the next work item is a partition, submit a future to process it if fewer than max_concurrent_tasks partitions are running.
+            Otherwise, keep it as pending until a running partition completes.
             - The future will add the records to emit on the work queue
-            - Add the partitions to the partitions_to_done dict so we know it needs to complete for the sync to succeed
           - If the next work item is a record, yield the record
           - If the next work item is PARTITIONS_GENERATED_SENTINEL, all the partitions were generated
           - If the next work item is a PartitionCompleteSentinel, a partition is done processing
-            - Update the value in partitions_to_done to True so we know the partition is completed
+            - Remove the partition from the running partitions and submit the next pending partition
+
+        The work queue is bounded by max_queue_size so the futures wait for the main thread to consume records instead of piling them up in
+        memory. The main thread never waits on anything else than the work queue.
         """
         self._logger.debug(f"Processing stream slices for {self.name} (sync_mode: full_refresh)")
         futures: List[Future[Any]] = []
-        queue: Queue[QueueItem] = Queue()
+        queue: Queue[QueueItem] = Queue(maxsize=self._max_queue_size)
         partition_generator = PartitionEnqueuer(queue, PARTITIONS_GENERATED_SENTINEL)
         partition_reader = PartitionReader(queue)
 
         # Submit partition generation tasks
         self._submit_task(futures, partition_generator.generate_partitions, self._stream_partition_generator, SyncMode.full_refresh)
 
-        # True -> partition is done
-        # False -> partition is not done
-        partitions_to_done: Dict[Partition, bool] = {}
+        pending_partitions: Deque[Partition] = deque()
+        running_partitions: Set[Partition] = set()
 
         finished_partitions = False
-        while record_or_partition := queue.get(block=True, timeout=self._timeout_seconds):
-            if record_or_partition == PARTITIONS_GENERATED_SENTINEL:
-                # All partitions were generated
-                finished_partitions = True
-            elif isinstance(record_or_partition, PartitionCompleteSentinel):
-                # All records for a partition were generated
-                if record_or_partition.partition not in partitions_to_done:
-                    raise RuntimeError(
-                        f"Received sentinel for partition {record_or_partition.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{partitions_to_done}"
-                    )
-                partitions_to_done[record_or_partition.partition] = True
-            elif isinstance(record_or_partition, Record):
-                # Emit records
-                yield record_or_partition
-            elif isinstance(record_or_partition, Partition):
-                # A new partition was generated and must be processed
-                partitions_to_done[record_or_partition] = False
-                if self._slice_logger.should_log_slice_message(self._logger):
-                    self._message_repository.emit_message(self._slice_logger.create_slice_log_message(record_or_partition.to_slice()))
-                self._submit_task(futures, partition_reader.process_partition, record_or_partition)
-            if finished_partitions and all(partitions_to_done.values()):
-                # All partitions were generated and process. We're done here
-                break
+        try:
+            while record_or_partition := queue.get(block=True, timeout=self._timeout_seconds):
+                if record_or_partition == PARTITIONS_GENERATED_SENTINEL:
+                    # All partitions were generated
+                    finished_partitions = True
+                elif isinstance(record_or_partition, PartitionCompleteSentinel):
+                    # All records for a partition were generated
+                    if record_or_partition.partition not in running_partitions:
+                        raise RuntimeError(
+                            f"Received sentinel for partition {record_or_partition.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{running_partitions}"
+                        )
+                    running_partitions.remove(record_or_partition.partition)
+                    if pending_partitions:
+                        self._submit_partition(futures, partition_reader, running_partitions, pending_partitions.popleft())
+                elif isinstance(record_or_partition, Record):
+                    # Emit records
+                    yield record_or_partition
+                elif isinstance(record_or_partition, Partition):
+                    # A new partition was generated and must be processed
+                    if self._slice_logger.should_log_slice_message(self._logger):
+                        self._message_repository.emit_message(self._slice_logger.create_slice_log_message(record_or_partition.to_slice()))
+                    if len(running_partitions) < self._max_concurrent_tasks:
+                        self._submit_partition(futures, partition_reader, running_partitions, record_or_partition)
+                    else:
+                        pending_partitions.append(record_or_partition)
+                if finished_partitions and not running_partitions and not pending_partitions:
+                    # All partitions were generated and process. We're done here
+                    break
+        finally:
+            self._wait_for_tasks(futures, queue)
         self._check_for_errors(futures)
 
+    def _submit_partition(
+        self, futures: List[Future[Any]], partition_reader: PartitionReader, running_partitions: Set[Partition], partition: Partition
+    ) -> None:
+        running_partitions.add(partition)
+        self._submit_task(futures, partition_reader.process_partition, partition)
+
     def _submit_task(self, futures: List[Future[Any]], function: Callable[..., Any], *args: Any) -> None:
-        # Submit a task to the threadpool, waiting if there are too many pending tasks
-        self._wait_while_too_many_pending_futures(futures)
         futures.append(self._threadpool.submit(function, *args))
 
-    def _wait_while_too_many_pending_futures(self, futures: List[Future[Any]]) -> None:
-        # Wait until the number of pending tasks is < self._max_concurrent_tasks
-        while True:
-            pending_futures = [f for f in futures if not f.done()]
-            if len(pending_futures) < self._max_concurrent_tasks:
-                break
-            self._logger.info("Main thread is sleeping because the task queue is full...")
-            time.sleep(self._sleep_time)
+    def _wait_for_tasks(self, futures: List[Future[Any]], queue: Queue[QueueItem]) -> None:
+        # If the read stopped early, the tasks that did not start are cancelled and the running ones might be blocked on the full queue so
+        # it is emptied until they are all done
+        running_futures = [f for f in futures if not f.done() and not f.cancel()]
+        while running_futures:
+            try:
+                queue.get(block=True, timeout=self.DEFAULT_DRAIN_TIMEOUT_SECONDS)
+            except Empty:
+                pass
+            running_futures = [f for f in running_futures if not f.done()]
 
     def _check_for_errors(self, futures: List[Future[Any]]) -> None:
         exceptions_from_futures = [f for f in [future.exception() for future in futures] if f is not None]
@@ -5,5 +5,14 @@
 # Initialize Streams Package
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream, HttpSubStream
+from .rate_limiter import HttpRequestMatcher, RateLimiter, SlidingWindowRatePolicy, TokenBucketRatePolicy
 
-__all__ = ["HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
+__all__ = [
+    "HttpRequestMatcher",
+    "HttpStream",
+    "HttpSubStream",
+    "RateLimiter",
+    "SlidingWindowRatePolicy",
+    "TokenBucketRatePolicy",
+    "UserDefinedBackoffException",
+]
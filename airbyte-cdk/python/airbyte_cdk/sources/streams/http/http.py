@@ -23,12 +23,24 @@ from requests.auth import AuthBase
 
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
+from .rate_limiter import RateLimiter
 from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
 
 
+def mount_connection_pool(session: requests.Session, max_connections: int) -> None:
+    """
+    Keeps up to `max_connections` connections alive per host in the session instead of the default of requests
+    """
+    if max_connections < 1:
+        raise ValueError(f"At least one connection per host is needed, got {max_connections}")
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_connections)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
 class HttpStream(Stream, ABC):
     """
     Base abstract class for an Airbyte Stream using the HTTP protocol. Basic building block for users building an Airbyte source for a HTTP API.
@@ -38,11 +50,18 @@ class HttpStream(Stream, ABC):
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
 
     # TODO: remove legacy HttpAuthenticator authenticator references
-    def __init__(self, authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None):
+    def __init__(self, authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None, rate_limiter: Optional[RateLimiter] = None):
+        """
+        :param authenticator: authenticator adding the credentials to the requests
+        :param rate_limiter: schedules the requests to respect the rate limit of the API. Pass the same instance to all the streams of
+        a source so that they share the API's budget of calls.
+        """
+        self._rate_limiter = rate_limiter
         if self.use_cache:
             self._session = self.request_cache()
         else:
             self._session = requests.Session()
+        self._connection_pool_mounted = False
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
@@ -103,6 +122,15 @@ class HttpStream(Stream, ABC):
         """
         return 5
 
+    @property
+    def max_connections(self) -> Optional[int]:
+        """
+        Override if needed. Specifies the number of connections kept alive per host. Should be at least the number of threads sending
+        requests at once, otherwise the connections of the extra threads are closed after each request instead of being reused.
+        Return None to keep the connection pool of the session.
+        """
+        return None
+
     @property
     def retry_factor(self) -> float:
         """
@@ -329,7 +357,11 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
+        if self._rate_limiter:
+            self._rate_limiter.acquire(request)
         response: requests.Response = self._session.send(request, **request_kwargs)
+        if self._rate_limiter:
+            self._rate_limiter.update_from_response(request, response)
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
@@ -359,6 +391,12 @@ class HttpStream(Stream, ABC):
         """
         Creates backoff wrappers which are responsible for retry logic
         """
+        if not self._connection_pool_mounted:
+            # Mounted on the first request rather than in __init__ so that max_connections can rely on the state of subclasses
+            max_connections = self.max_connections
+            if max_connections is not None:
+                mount_connection_pool(self._session, max_connections)
+            self._connection_pool_mounted = True
 
         """
         Backoff package has max_tries parameter that means total number of
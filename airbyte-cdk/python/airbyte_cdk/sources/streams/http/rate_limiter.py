@@ -0,0 +1,234 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger("airbyte")
+
+# Reset headers holding a value above this are a unix timestamp rather than a number of seconds
+_MIN_RESET_TIMESTAMP = 1_000_000_000
+
+
+class HttpRequestMatcher:
+    """
+    Selects the requests a rate limit policy applies to by HTTP method, host and path. A matcher without criteria matches every request.
+    """
+
+    def __init__(self, method: Optional[str] = None, host: Optional[str] = None, path_pattern: Optional[str] = None):
+        self._method = method.upper() if method else None
+        self._host = host.lower() if host else None
+        self._path_pattern = re.compile(path_pattern) if path_pattern else None
+
+    def matches(self, request: requests.PreparedRequest) -> bool:
+        if self._method and (request.method or "").upper() != self._method:
+            return False
+        url = urlparse(request.url or "")
+        if self._host and (url.hostname or "").lower() != self._host:
+            return False
+        if self._path_pattern and not self._path_pattern.search(url.path):
+            return False
+        return True
+
+
+class RateLimitPolicy(ABC):
+    """
+    Budget of calls for the requests selected by its matchers. Policies are thread safe so that one instance can be shared by all the
+    streams and partitions sending requests to the same API.
+    """
+
+    def __init__(self, matchers: Optional[List[HttpRequestMatcher]] = None, clock: Callable[[], float] = time.monotonic):
+        self._matchers = matchers or []
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def matches(self, request: requests.PreparedRequest) -> bool:
+        return not self._matchers or any(matcher.matches(request) for matcher in self._matchers)
+
+    def try_acquire(self) -> float:
+        """
+        Consumes a call if one is available.
+
+        :return: 0 if the call can be made, otherwise the number of seconds to wait before trying again
+        """
+        with self._lock:
+            now = self._clock()
+            if now < self._paused_until:
+                return self._paused_until - now
+            return self._try_acquire(now)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Prevents any call from being made for the given number of seconds, e.g. until the rate limit window of the API resets
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def limit_available_calls(self, available_calls: int) -> None:
+        """
+        Lowers the number of calls that can be made right away to what the API reports as remaining
+        """
+        with self._lock:
+            self._limit_available_calls(self._clock(), available_calls)
+
+    @abstractmethod
+    def _try_acquire(self, now: float) -> float:
+        pass
+
+    @abstractmethod
+    def _limit_available_calls(self, now: float, available_calls: int) -> None:
+        pass
+
+
+class TokenBucketRatePolicy(RateLimitPolicy):
+    """
+    Allows bursts of up to `max_calls` calls, with calls becoming available again at a steady rate of `max_calls` per `period_in_seconds`
+    """
+
+    def __init__(
+        self,
+        max_calls: int,
+        period_in_seconds: float,
+        matchers: Optional[List[HttpRequestMatcher]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_calls < 1 or period_in_seconds <= 0:
+            raise ValueError(f"A token bucket needs at least one call per period, got {max_calls} calls per {period_in_seconds} seconds")
+        super().__init__(matchers, clock)
+        self._capacity = float(max_calls)
+        self._refill_rate = max_calls / period_in_seconds
+        self._tokens = self._capacity
+        self._last_refill = clock()
+
+    def _try_acquire(self, now: float) -> float:
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._refill_rate
+
+    def _limit_available_calls(self, now: float, available_calls: int) -> None:
+        self._refill(now)
+        self._tokens = min(self._tokens, float(max(available_calls, 0)))
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
+
+
+class SlidingWindowRatePolicy(RateLimitPolicy):
+    """
+    Allows at most `max_calls` calls in any window of `period_in_seconds` seconds
+    """
+
+    def __init__(
+        self,
+        max_calls: int,
+        period_in_seconds: float,
+        matchers: Optional[List[HttpRequestMatcher]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_calls < 1 or period_in_seconds <= 0:
+            raise ValueError(f"A sliding window needs at least one call per period, got {max_calls} calls per {period_in_seconds} seconds")
+        super().__init__(matchers, clock)
+        self._max_calls = max_calls
+        self._period = period_in_seconds
+        self._calls: Deque[float] = deque()
+
+    def _try_acquire(self, now: float) -> float:
+        self._expire_calls(now)
+        if len(self._calls) < self._max_calls:
+            self._calls.append(now)
+            return 0.0
+        return self._calls[0] + self._period - now
+
+    def _limit_available_calls(self, now: float, available_calls: int) -> None:
+        self._expire_calls(now)
+        while self._max_calls - len(self._calls) > max(available_calls, 0):
+            self._calls.append(now)
+
+    def _expire_calls(self, now: float) -> None:
+        while self._calls and self._calls[0] + self._period <= now:
+            self._calls.popleft()
+
+
+class RateLimiter:
+    """
+    Schedules outgoing requests according to the first policy matching them so that an API's rate limit is respected before it is hit,
+    instead of backing off once it returned a 429. Requests matching no policy are sent right away.
+
+    Policies also learn from the responses: the number of remaining calls reported by the API lowers the calls available, and all calls
+    are paused until the reported reset time (or the Retry-After of a 429) so that concurrent requests wait together for the API to
+    accept calls again instead of all getting rate limited.
+    """
+
+    def __init__(
+        self,
+        policies: List[RateLimitPolicy],
+        remaining_header: Optional[str] = "X-RateLimit-Remaining",
+        reset_header: Optional[str] = "X-RateLimit-Reset",
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._policies = policies
+        self._remaining_header = remaining_header
+        self._reset_header = reset_header
+        self._sleep = sleep
+
+    def acquire(self, request: requests.PreparedRequest) -> None:
+        """
+        Blocks until the request can be sent
+        """
+        policy = self._get_policy(request)
+        if policy is None:
+            return
+        wait_time = policy.try_acquire()
+        while wait_time > 0:
+            logger.debug(f"Waiting {wait_time:.3f} seconds before sending request to {request.url} to respect the API rate limit")
+            self._sleep(wait_time)
+            wait_time = policy.try_acquire()
+
+    def update_from_response(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        policy = self._get_policy(request)
+        if policy is None:
+            return
+
+        remaining_calls = self._get_numeric_header(response, self._remaining_header)
+        if remaining_calls is not None:
+            policy.limit_available_calls(int(remaining_calls))
+
+        pause_time = None
+        if response.status_code == requests.codes.too_many_requests:
+            pause_time = self._get_numeric_header(response, "Retry-After")
+        if pause_time is None and remaining_calls is not None and remaining_calls <= 0:
+            pause_time = self._get_reset_delay(response)
+        if pause_time is not None and pause_time > 0:
+            policy.pause(pause_time)
+
+    def _get_policy(self, request: requests.PreparedRequest) -> Optional[RateLimitPolicy]:
+        return next((policy for policy in self._policies if policy.matches(request)), None)
+
+    def _get_reset_delay(self, response: requests.Response) -> Optional[float]:
+        reset = self._get_numeric_header(response, self._reset_header)
+        if reset is None:
+            return None
+        return reset - time.time() if reset > _MIN_RESET_TIMESTAMP else reset
+
+    @staticmethod
+    def _get_numeric_header(response: requests.Response, header: Optional[str]) -> Optional[float]:
+        value = response.headers.get(header) if header else None
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
@@ -3,9 +3,10 @@
 #
 
 import logging
+import numbers
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from jsonschema import Draft7Validator, ValidationError, validators
 
@@ -13,8 +14,40 @@ json_to_python_simple = {"string": str, "number": float, "integer": int, "boolea
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
 python_to_json = {v: k for k, v in json_to_python.items()}
 
+# Python types the normalizing validator checks the json types against. Booleans only match the boolean type.
+_type_checks = {"array": list, "boolean": bool, "integer": int, "null": type(None), "number": numbers.Number, "object": dict, "string": str}
+
 logger = logging.getLogger("airbyte")
 
+# Normalizes a value in place given its path in the record
+Normalizer = Callable[[Any, Tuple[Union[str, int], ...]], None]
+
+
+def _normalize_nothing(instance: Any, path: Tuple[Union[str, int], ...]) -> None:
+    pass
+
+
+def _ensure_list(thing: Any) -> Any:
+    """
+    Wrap a single type name in a list, the same way as the type validator of jsonschema does.
+    """
+    if isinstance(thing, str):
+        return [thing]
+    return thing
+
+
+def _types_msg(instance: Any, types: Any) -> str:
+    """
+    Build the same message as the type validator of jsonschema for an instance not matching the types.
+    """
+    reprs = []
+    for type_ in types:
+        try:
+            reprs.append(repr(type_["name"]))
+        except Exception:
+            reprs.append(repr(type_))
+    return "%r is not of type %s" % (instance, ", ".join(reprs))
+
 
 class TransformConfig(Flag):
     """
@@ -42,6 +75,9 @@ class TypeTransformer:
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
 
+    # Normalizers are compiled once per schema object and reused for every record
+    MAX_CACHED_NORMALIZERS = 100
+
     def __init__(self, config: TransformConfig):
         """
         Initialize TypeTransformer instance.
@@ -57,6 +93,8 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # Normalizers by id of the schema they were compiled for. The schema is kept along so that its id is not reused by another object.
+        self._compiled_normalizers: Dict[int, Tuple[Mapping[str, Any], Optional[Normalizer]]] = {}
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -180,6 +218,10 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_normalizer = self._get_compiled_normalizer(schema)
+        if compiled_normalizer:
+            compiled_normalizer(record, ())
+            return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,6 +230,162 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_normalizer(self, schema: Mapping[str, Any]) -> Optional[Normalizer]:
+        """
+        Return the normalizer compiled for the schema, or None if the schema has to be walked with the normalizing validator.
+        Streams give the same schema object for all their records, so the schema is compiled the first time it is seen. A schema modified
+        in place after records were transformed with it is not compiled again.
+        """
+        compiled_normalizer = self._compiled_normalizers.get(id(schema))
+        if compiled_normalizer is not None and compiled_normalizer[0] is schema:
+            return compiled_normalizer[1]
+        if len(self._compiled_normalizers) >= self.MAX_CACHED_NORMALIZERS:
+            del self._compiled_normalizers[next(iter(self._compiled_normalizers))]
+        normalizer = self.__compile_normalizer(schema)
+        self._compiled_normalizers[id(schema)] = (schema, normalizer)
+        return normalizer
+
+    def __compile_normalizer(self, schema: Mapping[str, Any]) -> Optional[Normalizer]:
+        """
+        Build a function normalizing a record the same way as walking it with the normalizing validator: values are converted before their
+        type is checked, type errors are logged in the same order and references are resolved once, while compiling.
+        Schemas that would make the validator fail are not compiled so that the validator raises the same errors when walking records.
+        """
+        try:
+            return self.__compile(schema, self._normalizer(schema), {})
+        except Exception:
+            return None
+
+    def __compile(self, schema: Any, validator: Any, compiled: Dict[Tuple[int, str], Normalizer]) -> Normalizer:
+        if schema is True:
+            return _normalize_nothing
+        if schema is False:
+
+            def reject(instance: Any, path: Tuple[Union[str, int], ...]) -> None:
+                error = ValidationError(
+                    "False schema does not allow %r" % (instance,),
+                    validator=None,
+                    path=path,
+                    validator_value=None,
+                    instance=instance,
+                    schema=schema,
+                )
+                logger.warning(self.get_error_message(error))
+
+            return reject
+
+        # Recursive references reach a schema that is being compiled so they go through the compiled function once it is built
+        key = (id(schema), validator.resolver.resolution_scope)
+        if key in compiled:
+            return compiled[key]
+        steps: List[Normalizer] = []
+        compiled[key] = lambda instance, path: normalize(instance, path)
+
+        scope = validator.ID_OF(schema)
+        if scope:
+            validator.resolver.push_scope(scope)
+        try:
+            ref = schema.get("$ref")
+            keywords = [("$ref", ref)] if ref is not None else schema.items()
+            for keyword, value in keywords:
+                step = self.__compile_keyword(keyword, value, schema, validator, compiled)
+                if step:
+                    steps.append(step)
+        finally:
+            if scope:
+                validator.resolver.pop_scope()
+
+        normalize: Normalizer
+        if not steps:
+            normalize = _normalize_nothing
+        elif len(steps) == 1:
+            normalize = steps[0]
+        else:
+
+            def normalize_steps(instance: Any, path: Tuple[Union[str, int], ...]) -> None:
+                for step in steps:
+                    step(instance, path)
+
+            normalize = normalize_steps
+
+        compiled[key] = normalize
+        return normalize
+
+    def __compile_keyword(
+        self, keyword: str, value: Any, schema: Any, validator: Any, compiled: Dict[Tuple[int, str], Normalizer]
+    ) -> Optional[Normalizer]:
+        def resolve(subschema: Any) -> Any:
+            if "$ref" in subschema:
+                _, resolved = validator.resolver.resolve(subschema["$ref"])
+                return resolved
+            return subschema
+
+        normalize_value = self.__normalize
+        if keyword == "$ref":
+            scope, resolved = validator.resolver.resolve(value)
+            validator.resolver.push_scope(scope)
+            try:
+                return self.__compile(resolved, validator, compiled)
+            finally:
+                validator.resolver.pop_scope()
+        elif keyword == "type":
+            types = _ensure_list(value)
+            if isinstance(types, (list, tuple)) and all(isinstance(t, str) and t in _type_checks for t in types):
+                python_types = tuple(_type_checks[t] for t in types)
+                accepts_booleans = "boolean" in types
+
+                def is_valid(instance: Any) -> bool:
+                    return accepts_booleans if isinstance(instance, bool) else isinstance(instance, python_types)
+
+            else:
+
+                def is_valid(instance: Any) -> bool:
+                    return any(validator.is_type(instance, t) for t in types)
+
+            def check_type(instance: Any, path: Tuple[Union[str, int], ...]) -> None:
+                if not is_valid(instance):
+                    error = ValidationError(
+                        _types_msg(instance, types), validator="type", path=path, validator_value=value, instance=instance, schema=schema
+                    )
+                    logger.warning(self.get_error_message(error))
+
+            return check_type
+        elif keyword == "properties":
+            properties = [(name, resolve(subschema), self.__compile(subschema, validator, compiled)) for name, subschema in value.items()]
+
+            def normalize_properties(instance: Any, path: Tuple[Union[str, int], ...]) -> None:
+                if not isinstance(instance, dict):
+                    return
+                for name, resolved_subschema, _ in properties:
+                    if name in instance:
+                        instance[name] = normalize_value(instance[name], resolved_subschema)
+                for name, _, normalize in properties:
+                    if name in instance:
+                        normalize(instance[name], path + (name,))
+
+            return normalize_properties
+        elif keyword == "items":
+            resolved_items = resolve(value)
+            if isinstance(value, list):
+                item_normalizers = [self.__compile(subschema, validator, compiled) for subschema in value]
+            else:
+                item_normalizer = self.__compile(value, validator, compiled)
+
+            def normalize_items(instance: Any, path: Tuple[Union[str, int], ...]) -> None:
+                if not isinstance(instance, list):
+                    return
+                for index, item in enumerate(instance):
+                    instance[index] = normalize_value(item, resolved_items)
+                if isinstance(value, list):
+                    for index, normalize in zip(range(len(instance)), item_normalizers):
+                        normalize(instance[index], path + (index,))
+                else:
+                    for index, item in enumerate(instance):
+                        item_normalizer(item, path + (index,))
+
+            return normalize_items
+        return None
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
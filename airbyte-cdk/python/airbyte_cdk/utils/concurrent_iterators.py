@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
+from typing import Any, Deque, Generator, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+# Workers waiting for room in a queue check this often whether the iteration was stopped
+_WORKER_PUT_TIMEOUT_SECONDS = 0.1
+
+
+class _IteratorCompleted:
+    """
+    Marks the end of the items of an iterator read by a worker
+    """
+
+
+_ITERATOR_COMPLETED = _IteratorCompleted()
+
+
+def iterate_concurrently(
+    iterators: Iterable[Iterator[T]],
+    n_workers: int,
+    max_buffered_items: int,
+    preserve_order: bool = True,
+    batch_size: int = 1,
+    thread_name_prefix: str = "",
+) -> Generator[T, None, None]:
+    """
+    Iterate over up to `n_workers` iterators at once in worker threads and yield their items.
+
+    When `preserve_order` is set, the items are yielded iterator after iterator, in the same order as a sequential iteration, and each
+    iterator being read buffers up to `max_buffered_items` items. Otherwise, the items of the iterators are yielded as they are produced and
+    all the iterators share a buffer of `max_buffered_items` items. Either way, a slow consumer pauses the workers instead of accumulating
+    items in memory.
+
+    The items are handed over from the workers in batches of `batch_size` items to limit the synchronization overhead per item.
+
+    An exception raised by an iterator is raised once the items produced by the iterator before it were yielded. Closing the returned
+    generator, or the exception, stops the workers: the iterators being read are closed and the iterators not started yet are not read.
+    """
+    stop_reading = threading.Event()
+    iterators_to_read = iter(iterators)
+    queue_size = max(1, max_buffered_items // batch_size)
+
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix=thread_name_prefix) as executor:
+        try:
+            if preserve_order:
+                iterators_in_progress: Deque["Queue[Any]"] = deque()
+
+                def submit_next_iterator() -> None:
+                    iterator = next(iterators_to_read, None)
+                    if iterator is not None:
+                        iterator_items: "Queue[Any]" = Queue(maxsize=queue_size)
+                        executor.submit(_read_into_queue, iterator, iterator_items, batch_size, stop_reading)
+                        iterators_in_progress.append(iterator_items)
+
+                for _ in range(n_workers):
+                    submit_next_iterator()
+                while iterators_in_progress:
+                    yield from _get_until_completed(iterators_in_progress.popleft(), 1)
+                    submit_next_iterator()
+            else:
+                items: "Queue[Any]" = Queue(maxsize=queue_size)
+                n_iterators = 0
+                for iterator in iterators_to_read:
+                    executor.submit(_read_into_queue, iterator, items, batch_size, stop_reading)
+                    n_iterators += 1
+                yield from _get_until_completed(items, n_iterators)
+        finally:
+            stop_reading.set()
+
+
+def _get_until_completed(items: "Queue[Any]", n_iterators: int) -> Generator[Any, None, None]:
+    """
+    Yield the items put in the queue until `n_iterators` iterators are completed, raising the first exception put in the queue
+    """
+    while n_iterators:
+        batch = items.get()
+        if batch is _ITERATOR_COMPLETED:
+            n_iterators -= 1
+        elif isinstance(batch, BaseException):
+            raise batch
+        else:
+            yield from batch
+
+
+def _read_into_queue(iterator: Iterator[Any], items: "Queue[Any]", batch_size: int, stop_reading: threading.Event) -> None:
+    if stop_reading.is_set():
+        _close(iterator)
+        return
+    batch: List[Any] = []
+    try:
+        for item in iterator:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                if not _put_until_stopped(items, batch, stop_reading):
+                    _close(iterator)
+                    return
+                batch = []
+    except BaseException as exception:
+        if not batch or _put_until_stopped(items, batch, stop_reading):
+            _put_until_stopped(items, exception, stop_reading)
+    else:
+        if not batch or _put_until_stopped(items, batch, stop_reading):
+            _put_until_stopped(items, _ITERATOR_COMPLETED, stop_reading)
+
+
+def _put_until_stopped(items: "Queue[Any]", item: Any, stop_reading: threading.Event) -> bool:
+    """
+    Wait for room in the queue to put the item. Return False if the reading was stopped before the item could be put.
+    """
+    while not stop_reading.is_set():
+        try:
+            items.put(item, timeout=_WORKER_PUT_TIMEOUT_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _close(iterator: Iterator[Any]) -> None:
+    if isinstance(iterator, Generator):
+        iterator.close()
@@ -3,3 +3,4 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+ENV_MANIFEST_CACHE_PATH = "MANIFEST_CACHE_PATH"
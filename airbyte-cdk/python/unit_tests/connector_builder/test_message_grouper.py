@@ -19,6 +19,7 @@ from airbyte_cdk.models import (
     OrchestratorType,
 )
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.message import StructuredLogMessage
 from unit_tests.connector_builder.utils import create_configured_catalog
 
 MAX_PAGES_PER_SLICE = 4
@@ -629,6 +630,40 @@ def test_given_no_slices_then_return_empty_slices(mock_entrypoint_read: Mock) ->
     assert len(stream_read.slices) == 0
 
 
+@patch("airbyte_cdk.connector_builder.message_grouper.AirbyteEntrypoint.read")
+def test_given_structured_log_messages_then_use_content_without_parsing_message(mock_entrypoint_read: Mock) -> None:
+    content = {
+        "http": {
+            "title": "a title",
+            "description": "a description",
+            "request": {"method": "GET", "headers": {}, "body": {"content": None}},
+            "response": {"status_code": 200, "headers": {}, "body": {"content": '{"items": [{"name": "Shinobu Kocho"}]}'}},
+        },
+        "url": {"full": "https://demonslayers.com/api/v1/hashiras"},
+    }
+    mock_source = make_mock_source(
+        mock_entrypoint_read,
+        iter(
+            [
+                AirbyteMessage(type=MessageType.LOG, log=StructuredLogMessage.from_content(Level.DEBUG, content)),
+                record_message("hashiras", {"name": "Shinobu Kocho"}),
+            ]
+        ),
+    )
+    connector_builder_handler = MessageGrouper(MAX_PAGES_PER_SLICE, MAX_SLICES)
+
+    with patch("airbyte_cdk.connector_builder.message_grouper.json.loads") as json_loads:
+        stream_read: StreamRead = connector_builder_handler.get_message_groups(
+            source=mock_source, config=CONFIG, configured_catalog=create_configured_catalog("hashiras")
+        )
+        json_loads.assert_not_called()
+
+    page = stream_read.slices[0].pages[0]
+    assert page.request.url == "https://demonslayers.com/api/v1/hashiras"
+    assert page.response == HttpResponse(status=200, body='{"items": [{"name": "Shinobu Kocho"}]}', headers={})
+    assert page.records == [{"name": "Shinobu Kocho"}]
+
+
 def make_mock_source(mock_entrypoint_read: Mock, return_value: Iterator[AirbyteMessage]) -> MagicMock:
     mock_source = MagicMock()
     mock_entrypoint_read.return_value = return_value
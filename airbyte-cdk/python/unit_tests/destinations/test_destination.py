@@ -241,3 +241,17 @@ class TestRun:
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
             list(destination.run_cmd(parsed_args=argparse.Namespace(**args)))
+
+    @pytest.mark.parametrize("validate_input_records", [True, False])
+    def test_parse_input_stream(self, destination: Destination, validate_input_records: bool):
+        destination.validate_input_records = validate_input_records
+        input_messages = [_wrapped(_record("s1", {"k1": "v1"})), _wrapped(_state({"k1": "v1"})), _wrapped(_record("s1", {"k2": [1, 2]}))]
+        input_lines = [message.json(exclude_unset=True) for message in input_messages]
+        input_lines.append("not a message")
+        input_lines.append('{"type": "STATE", "state": "not a state"}')
+
+        parsed_messages = list(destination._parse_input_stream(io.StringIO("\n".join(input_lines))))
+
+        assert parsed_messages == input_messages
+        assert [message.json(exclude_unset=True) for message in parsed_messages] == input_lines[:3]
+        assert isinstance(parsed_messages[1].state, AirbyteStateMessage)
@@ -0,0 +1,30 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.destinations import RecordBuffer
+
+
+def test_record_buffer_is_full_once_the_row_limit_is_reached():
+    buffer = RecordBuffer(max_rows=3)
+
+    buffer.add("stream", ("id_1", "{}"))
+    buffer.add("another_stream", ("id_2", "{}"))
+    assert not buffer.is_full
+
+    buffer.add("stream", ("id_3", "{}"))
+    assert buffer.is_full
+
+    assert buffer.pop_all() == {"stream": [("id_1", "{}"), ("id_3", "{}")], "another_stream": [("id_2", "{}")]}
+    assert not buffer.is_full
+    assert buffer.pop_all() == {}
+
+
+def test_record_buffer_is_full_once_the_byte_limit_is_reached():
+    buffer = RecordBuffer(max_bytes=20)
+
+    buffer.add("stream", ("id_1", 1, '{"a": 1}'))
+    assert not buffer.is_full
+
+    buffer.add("stream", ("id_2", 2, '{"a": 2}'))
+    assert buffer.is_full
@@ -57,3 +57,36 @@ def test_format_datetime(test_name, input_dt, datetimeformat, expected_output):
     parser = DatetimeParser()
     output_date = parser.format(input_dt, datetimeformat)
     assert expected_output == output_date
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-01-01T00:00:00.123+0000", "%Y-%m-%dT%H:%M:%S.%f%z"),
+        ("2021-01-01T00:00:00.123456-05:30", "%Y-%m-%dT%H:%M:%S.%f%z"),
+        ("2021-01-01T00:00:00Z", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01t00:00:00z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-1-1  0:0:0", "%Y-%m-%d %H:%M:%S"),
+        ("%2021-01-01", "%%%Y-%m-%d"),
+        ("31.12.2021 (UTC)", "%d.%m.%Y (UTC)"),
+        ("2021-01-01T00:00:00Z", "%Y-%m-%dT%H:%M:%S.%f%z"),
+        ("2021-01-01T00:00:00.000+05:3000", "%Y-%m-%dT%H:%M:%S.%f%z"),
+        ("2021-02-30", "%Y-%m-%d"),
+        ("2021-01-01T00:00:00", "%Y-%m-%d"),
+        ("Jan 01 2021", "%b %d %Y"),
+    ],
+)
+def test_parse_date_like_strptime(input_date, date_format):
+    try:
+        expected_output_date = datetime.datetime.strptime(input_date, date_format)
+    except ValueError:
+        with pytest.raises(ValueError):
+            DatetimeParser().parse(input_date, date_format)
+        return
+    if expected_output_date.tzinfo is None:
+        expected_output_date = expected_output_date.replace(tzinfo=datetime.timezone.utc)
+
+    output_date = DatetimeParser().parse(input_date, date_format)
+
+    assert output_date == expected_output_date
+    assert output_date.utcoffset() == expected_output_date.utcoffset()
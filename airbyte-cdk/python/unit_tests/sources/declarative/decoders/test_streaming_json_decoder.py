@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import json
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
+
+
+def create_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response._content = content
+    response._content_consumed = True
+    response.encoding = "utf-8"
+    return response
+
+
+def create_streamed_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.raw = io.BytesIO(content)
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.parametrize(
+    "body, path, expected_items",
+    [
+        ({"data": [{"id": 1}, {"id": 2}]}, ["data"], [{"id": 1}, {"id": 2}]),
+        ({"data": []}, ["data"], []),
+        ({"data": {"id": 1}}, ["data"], [{"id": 1}]),
+        ({"data": {}}, ["data"], []),
+        ([{"id": 1}, {"id": 2}], [], [{"id": 1}, {"id": 2}]),
+        ({"before": {"data": [1]}, "meta": {"data": [2, 3]}, "data": [12345, "é ☃"], "after": [4]}, ["meta", "data"], [2, 3]),
+        ({"before": {"data": [1]}, "data": [12345, "é ☃"], "after": [4]}, ["data"], [12345, "é ☃"]),
+        ({"data": [{"id": 1}, {"id": 2}]}, ["data", "1"], [{"id": 2}]),
+        ({"data": [{"id": 1}, {"id": 2}]}, ["data", "2"], []),
+        ({"data": [{"id": 1}, {"id": 2}]}, ["data", "01"], []),
+        ({"data": {"1": {"id": 1}}}, ["data", "1"], [{"id": 1}]),
+        ({"id": 1}, ["data"], []),
+        ({"data": "records"}, ["data", "records"], []),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, StreamingJsonDecoder.CHUNK_SIZE])
+def test_decode_items(mocker, body, path, expected_items, chunk_size):
+    mocker.patch.object(StreamingJsonDecoder, "CHUNK_SIZE", chunk_size)
+    response = create_response(json.dumps(body, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    assert StreamingJsonDecoder(parameters={}).decode_items(response, path) == expected_items
+
+
+@pytest.mark.parametrize("content", [b"", b"not json", b'{"data": [{"id": 1}, {"id": '])
+def test_decode_items_of_invalid_json(content):
+    assert StreamingJsonDecoder(parameters={}).decode_items(create_response(content), ["data"]) == []
+
+
+def test_decode_returns_the_whole_document():
+    body = {"data": [{"id": 1}], "next_page": "token"}
+    assert StreamingJsonDecoder(parameters={}).decode(create_response(json.dumps(body).encode("utf-8"))) == body
+
+
+def test_decode_items_reads_a_streamed_response_one_chunk_at_a_time(mocker):
+    mocker.patch.object(StreamingJsonDecoder, "CHUNK_SIZE", 16)
+    body = json.dumps({"data": [{"id": i} for i in range(100)], "next_page": "token"}).encode("utf-8")
+    response = create_streamed_response(body)
+    read_spy = mocker.spy(response.raw, "read")
+
+    items = StreamingJsonDecoder(parameters={}).decode_items(response, ["data"])
+
+    assert items == [{"id": i} for i in range(100)]
+    assert response._content is False
+    assert all(call.args[0] == 16 for call in read_spy.call_args_list)
@@ -7,6 +7,7 @@ import json
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 
 config = {"field": "record_array"}
@@ -31,6 +32,13 @@ decoder = JsonDecoder(parameters={})
             [{"id": 1}, {"id": 2}],
         ),
         ("test_field_does_not_exist", ["record"], {"id": 1}, []),
+        ("test_nested_field_does_not_exist", ["data", "records"], {"data": [{"records": [{"id": 1}]}]}, []),
+        ("test_path_through_scalar", ["data", "records"], {"data": "records"}, []),
+        ("test_list_index", ["data", "1"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 2}]),
+        ("test_list_index_out_of_range", ["data", "2"], {"data": [{"id": 1}, {"id": 2}]}, []),
+        ("test_list_index_is_not_a_number", ["data", "id"], {"data": [{"id": 1}, {"id": 2}]}, []),
+        ("test_numeric_key", ["data", "1"], {"data": {"1": {"id": 1}}}, [{"id": 1}]),
+        ("test_glob_character", ["da?a"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 1}, {"id": 2}]),
         ("test_nested_list", ["list", "*", "item"], {"list": [{"item": {"id": "1"}}]}, [{"id": "1"}]),
         (
             "test_complex_nested_list",
@@ -40,8 +48,9 @@ decoder = JsonDecoder(parameters={})
         ),
     ],
 )
-def test_dpath_extractor(test_name, field_path, body, expected_records):
-    extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder, parameters=parameters)
+@pytest.mark.parametrize("record_decoder", [decoder, StreamingJsonDecoder(parameters={})], ids=["json", "streaming_json"])
+def test_dpath_extractor(test_name, field_path, body, expected_records, record_decoder):
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=record_decoder, parameters=parameters)
 
     response = create_response(body)
     actual_records = extractor.extract_records(response)
@@ -52,4 +61,15 @@ def test_dpath_extractor(test_name, field_path, body, expected_records):
 def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
+    response._content_consumed = True
     return response
+
+
+def test_dpath_extractor_evaluates_interpolated_path_for_every_response():
+    extractor_config = {"field": "first_array"}
+    extractor = DpathExtractor(field_path=["{{ config['field'] }}"], config=extractor_config, decoder=decoder, parameters=parameters)
+    body = {"first_array": [{"id": 1}], "second_array": [{"id": 2}]}
+
+    assert extractor.extract_records(create_response(body)) == [{"id": 1}]
+    extractor_config["field"] = "second_array"
+    assert extractor.extract_records(create_response(body)) == [{"id": 2}]
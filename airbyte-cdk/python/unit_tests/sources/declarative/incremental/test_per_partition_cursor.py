@@ -3,7 +3,7 @@
 #
 
 from collections import OrderedDict
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
@@ -152,10 +152,11 @@ def test_given_partition_associated_with_state_when_stream_slices_then_do_not_re
     cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router)
 
     cursor.set_initial_state({"states": [{"partition": partition, "cursor": CURSOR_STATE}]})
-    mocked_cursor_factory.create.assert_called_once()
+    mocked_cursor_factory.create.assert_not_called()
     slices = list(cursor.stream_slices())
 
     mocked_cursor_factory.create.assert_called_once()
+    mocked_cursor_factory.create.return_value.set_initial_state.assert_called_once_with(CURSOR_STATE)
     assert len(slices) == 1
 
 
@@ -290,3 +291,90 @@ def test_when_is_greater_than_or_equal_then_return_underlying_cursor_response(mo
 
     assert result == underlying_cursor.is_greater_than_or_equal.return_value
     underlying_cursor.is_greater_than_or_equal.assert_called_once_with(first_record, second_record)
+
+
+class InMemoryCursor:
+    """
+    Cursor keeping the highest cursor value of the records of the slices it closed
+    """
+
+    def __init__(self):
+        self._state = {}
+
+    def stream_slices(self):
+        return [{}]
+
+    def set_initial_state(self, stream_state):
+        self._state = dict(stream_state)
+
+    def get_stream_state(self):
+        return dict(self._state)
+
+    def close_slice(self, stream_slice, most_recent_record):
+        self._state = {CURSOR_STATE_KEY: max(self._state.get(CURSOR_STATE_KEY, 0), most_recent_record[CURSOR_STATE_KEY])}
+
+    def is_greater_than_or_equal(self, first, second):
+        return first[CURSOR_STATE_KEY] >= second[CURSOR_STATE_KEY]
+
+
+def _read_partitions(cursor, cursor_value_per_partition):
+    for stream_slice in cursor.stream_slices():
+        cursor.close_slice(stream_slice, Record({CURSOR_STATE_KEY: cursor_value_per_partition[stream_slice["id"]]}, stream_slice))
+
+
+def test_given_more_partitions_than_cursors_in_memory_when_close_slice_then_cursor_is_created_from_partition_state(mocked_partition_router):
+    partitions = [{"id": 1}, {"id": 2}, {"id": 3}]
+    mocked_partition_router.stream_slices.return_value = partitions
+    cursor_factory = Mock()
+    cursor_factory.create.side_effect = InMemoryCursor
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router)
+
+    with patch.object(PerPartitionCursor, "_MAX_CURSORS_IN_MEMORY", 1):
+        _read_partitions(cursor, {1: 10, 2: 20, 3: 30})
+        cursor.close_slice(PerPartitionStreamSlice({"id": 1}, {}), Record({CURSOR_STATE_KEY: 15}, PerPartitionStreamSlice({"id": 1}, {})))
+
+    assert len(cursor._cursor_per_partition) == 1
+    assert cursor.get_stream_state() == {
+        "states": [
+            {"partition": {"id": 2}, "cursor": {CURSOR_STATE_KEY: 20}},
+            {"partition": {"id": 3}, "cursor": {CURSOR_STATE_KEY: 30}},
+            {"partition": {"id": 1}, "cursor": {CURSOR_STATE_KEY: 15}},
+        ]
+    }
+
+
+def test_given_max_partitions_in_state_when_get_stream_state_then_least_recently_updated_partitions_are_collapsed(mocked_partition_router):
+    mocked_partition_router.stream_slices.return_value = [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    cursor_factory = Mock()
+    cursor_factory.create.side_effect = InMemoryCursor
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router, max_partitions_in_state=2)
+
+    _read_partitions(cursor, {1: 30, 2: 10, 3: 40, 4: 50})
+
+    assert cursor.get_stream_state() == {
+        "states": [
+            {"partition": {"id": 3}, "cursor": {CURSOR_STATE_KEY: 40}},
+            {"partition": {"id": 4}, "cursor": {CURSOR_STATE_KEY: 50}},
+        ],
+        "state": {CURSOR_STATE_KEY: 10},
+    }
+
+
+def test_given_lower_bound_state_when_stream_slices_then_partitions_without_state_start_from_lower_bound(mocked_partition_router):
+    mocked_partition_router.stream_slices.return_value = [{"id": 1}, {"id": 2}]
+    created_cursors = []
+
+    def create_cursor():
+        created_cursors.append(InMemoryCursor())
+        return created_cursors[-1]
+
+    cursor_factory = Mock()
+    cursor_factory.create.side_effect = create_cursor
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router, max_partitions_in_state=2)
+    cursor.set_initial_state(
+        {"states": [{"partition": {"id": 1}, "cursor": {CURSOR_STATE_KEY: 30}}], "state": {CURSOR_STATE_KEY: 10}}
+    )
+
+    list(cursor.stream_slices())
+
+    assert [created_cursor.get_stream_state() for created_cursor in created_cursors] == [{CURSOR_STATE_KEY: 30}, {CURSOR_STATE_KEY: 10}]
@@ -224,3 +224,43 @@ def test_macros_examples(template_string, expected_value):
     # If you change the expected output, you must also change the expected output in declarative_component_schema.yaml
     now_utc = interpolation.eval(template_string, {})
     assert now_utc == expected_value
+
+
+@pytest.mark.parametrize(
+    "template_string, expected_value",
+    [
+        pytest.param("hello world", "hello world", id="test_static_string"),
+        pytest.param("hello world\n", "hello world", id="test_static_string_with_trailing_newline"),
+        pytest.param("hello {# comment #}world", "hello world", id="test_static_string_with_comment"),
+        pytest.param("{% raw %}{{ hello }}{% endraw %}", "{{ hello }}", id="test_static_string_with_raw_block"),
+        pytest.param("[1, 2]", [1, 2], id="test_static_literal"),
+    ],
+)
+def test_static_strings_are_evaluated_like_templates(template_string, expected_value):
+    assert interpolation.eval(template_string, {}) == expected_value
+    assert interpolation._environment.from_string(template_string).render() == (
+        expected_value if isinstance(expected_value, str) else template_string
+    )
+
+
+def test_templates_are_compiled_once(mocker):
+    jinja_interpolation = JinjaInterpolation()
+    parse_spy = mocker.spy(jinja_interpolation._environment, "parse")
+    from_string_spy = mocker.spy(jinja_interpolation._environment, "from_string")
+
+    assert jinja_interpolation.eval("{{ config['page'] }}", {"page": 0}) == 0
+    parse_call_count, from_string_call_count = parse_spy.call_count, from_string_spy.call_count
+    for page in range(1, 3):
+        assert jinja_interpolation.eval("{{ config['page'] }}", {"page": page}) == page
+
+    assert parse_spy.call_count == parse_call_count
+    assert from_string_spy.call_count == from_string_call_count
+
+
+def test_templates_are_shared_between_interpolations(mocker):
+    from_string_spy = mocker.spy(JinjaInterpolation()._environment, "from_string")
+
+    for page in range(3):
+        assert JinjaInterpolation().eval("{{ config['shared_page'] }}", {"shared_page": page}) == page
+
+    assert from_string_spy.call_count == 1
@@ -19,7 +19,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import SessionTokenProv
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -41,6 +41,7 @@ from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer impo
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
 from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentRecordsCache
 from airbyte_cdk.sources.declarative.requesters import HttpRequester
 from airbyte_cdk.sources.declarative.requesters.error_handlers import CompositeErrorHandler, DefaultErrorHandler, HttpResponseFilter
 from airbyte_cdk.sources.declarative.requesters.error_handlers.backoff_strategies import (
@@ -68,6 +69,7 @@ from airbyte_cdk.sources.declarative.stream_slicers import CartesianProductStrea
 from airbyte_cdk.sources.declarative.transformations import AddFields, RemoveFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+from airbyte_cdk.sources.streams.http.rate_limiter import HttpRequestMatcher, RateLimiter, SlidingWindowRatePolicy, TokenBucketRatePolicy
 from airbyte_cdk.sources.streams.http.requests_native_auth.oauth import SingleUseRefreshTokenOauth2Authenticator
 from unit_tests.sources.declarative.parsers.testing_components import TestingCustomSubstreamPartitionRouter, TestingSomeComponent
 
@@ -460,6 +462,8 @@ def test_create_substream_partition_router():
             type: RequestOption
             inject_into: request_parameter
             field_name: repository_id
+          concurrency: 4
+          cache_records: true
         - stream: "#/stream_B"
           parent_key: someid
           partition_field: word_id
@@ -482,10 +486,17 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[0].partition_field.eval({}) == "repository_id"
     assert partition_router.parent_stream_configs[0].request_option.inject_into == RequestOptionType.request_parameter
     assert partition_router.parent_stream_configs[0].request_option.field_name == "repository_id"
+    assert partition_router.parent_stream_configs[0].concurrency == 4
+    assert isinstance(partition_router.parent_stream_configs[0].stream_factory(), DeclarativeStream)
+    assert isinstance(partition_router.parent_stream_configs[0].records_cache, ParentRecordsCache)
 
     assert partition_router.parent_stream_configs[1].parent_key.eval({}) == "someid"
     assert partition_router.parent_stream_configs[1].partition_field.eval({}) == "word_id"
     assert partition_router.parent_stream_configs[1].request_option is None
+    assert partition_router.parent_stream_configs[1].concurrency == 1
+    assert partition_router.parent_stream_configs[1].records_cache is None
+    assert partition_router.parent_stream_configs[0].cache_key is not None
+    assert partition_router.parent_stream_configs[1].cache_key is None
 
 
 def test_datetime_based_cursor():
@@ -752,6 +763,27 @@ def test_create_record_selector(test_name, record_selector, expected_runtime_sel
     assert selector.record_filter.condition == "{{ record['id'] > stream_state['id'] }}"
 
 
+def test_create_record_selector_with_streaming_json_decoder():
+    content = """
+    selector:
+      type: RecordSelector
+      extractor:
+        type: DpathExtractor
+        decoder:
+          type: StreamingJsonDecoder
+        field_path: ["data"]
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    selector_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["selector"], {})
+
+    selector = factory.create_component(
+        model_type=RecordSelectorModel, component_definition=selector_manifest, transformations=[], config=input_config
+    )
+
+    assert isinstance(selector.extractor.decoder, StreamingJsonDecoder)
+
+
 @pytest.mark.parametrize(
     "test_name, error_handler, expected_backoff_strategy_type",
     [
@@ -970,6 +1002,74 @@ def test_create_composite_error_handler():
     assert error_handler_1.response_filters[0].action == ResponseAction.RETRY
 
 
+def test_create_requesters_with_rate_limiter():
+    content = """
+definitions:
+  rate_limiter:
+    type: RateLimiter
+    remaining_header: X-Calls-Left
+    policies:
+      - type: TokenBucketRatePolicy
+        max_calls: 10
+        period_in_seconds: 1
+        matchers:
+          - method: GET
+            path_pattern: "^/v3/marketing"
+      - type: SlidingWindowRatePolicy
+        max_calls: 100
+        period_in_seconds: 60
+lists_requester:
+  type: HttpRequester
+  path: "/v3/marketing/lists"
+  url_base: "https://api.sendgrid.com"
+  rate_limiter: "#/definitions/rate_limiter"
+  $parameters:
+    name: lists
+contacts_requester:
+  type: HttpRequester
+  path: "/v3/marketing/contacts"
+  url_base: "https://api.sendgrid.com"
+  rate_limiter: "#/definitions/rate_limiter"
+  $parameters:
+    name: contacts
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    rate_limiter_factory = ModelToComponentFactory()
+
+    requesters = []
+    for requester_name in ["lists_requester", "contacts_requester"]:
+        requester_manifest = transformer.propagate_types_and_parameters("", resolved_manifest[requester_name], {})
+        requesters.append(
+            rate_limiter_factory.create_component(
+                model_type=HttpRequesterModel, component_definition=requester_manifest, config=input_config, name=requester_name
+            )
+        )
+
+    rate_limiter = requesters[0].rate_limiter
+    assert isinstance(rate_limiter, RateLimiter)
+    assert requesters[1].rate_limiter is rate_limiter
+    assert rate_limiter._remaining_header == "X-Calls-Left"
+    assert rate_limiter._reset_header == "X-RateLimit-Reset"
+
+    token_bucket, sliding_window = rate_limiter._policies
+    assert isinstance(token_bucket, TokenBucketRatePolicy)
+    assert isinstance(token_bucket._matchers[0], HttpRequestMatcher)
+    assert token_bucket._matchers[0]._method == "GET"
+    assert isinstance(sliding_window, SlidingWindowRatePolicy)
+    assert sliding_window._matchers == []
+
+
+def test_create_requester_without_rate_limiter():
+    requester_manifest = {"type": "HttpRequester", "path": "/v3/marketing/lists", "url_base": "https://api.sendgrid.com"}
+
+    requester = factory.create_component(
+        model_type=HttpRequesterModel, component_definition=requester_manifest, config=input_config, name="lists"
+    )
+
+    assert requester.rate_limiter is None
+
+
 # This might be a better test for the manifest transformer but also worth testing end-to-end here as well
 def test_config_with_defaults():
     content = """
@@ -2,11 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 from typing import Any, Iterable, List, Mapping, Optional, Union
 
 import pytest as pytest
 from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, SyncMode, Type
-from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
+    ParentRecordsCache,
+    ParentStreamConfig,
+    SubstreamPartitionRouter,
+)
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.types import Record
 from airbyte_cdk.sources.streams.core import Stream
@@ -27,6 +32,7 @@ class MockStream(Stream):
         self._slices = slices
         self._records = records
         self._name = name
+        self.read_slices = []
 
     @property
     def name(self) -> str:
@@ -50,6 +56,7 @@ class MockStream(Stream):
     ) -> Iterable[Mapping[str, Any]]:
         # The parent stream's records should always be read as full refresh
         assert sync_mode == SyncMode.full_refresh
+        self.read_slices.append(stream_slice)
         if not stream_slice:
             yield from self._records
         else:
@@ -321,3 +328,130 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
 
     slices = list(partition_router.stream_slices())
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
+
+
+def test_given_concurrency_when_stream_slices_then_parent_slices_are_read_concurrently_in_order():
+    parent_streams = []
+    all_slices_started = threading.Barrier(len(parent_slices), timeout=5)
+
+    class BlockingMockStream(MockStream):
+        def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+            all_slices_started.wait()
+            yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+    def create_parent_stream():
+        parent_streams.append(BlockingMockStream(parent_slices, all_parent_data, "first_stream"))
+        return parent_streams[-1]
+
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=MockStream(parent_slices, all_parent_data, "first_stream"),
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+                concurrency=len(parent_slices),
+                stream_factory=create_parent_stream,
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+    slices = list(partition_router.stream_slices())
+
+    assert slices == [
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+        {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
+    ]
+    assert len(parent_streams) == len(parent_slices)
+    assert all(len(parent_stream.read_slices) == 1 for parent_stream in parent_streams)
+
+
+def test_given_concurrency_and_parent_read_fails_when_stream_slices_then_raise():
+    class FailingMockStream(MockStream):
+        def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+            if stream_slice["slice"] == "second":
+                raise ValueError("parent read failed")
+            yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=MockStream(parent_slices, all_parent_data, "first_stream"),
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+                concurrency=2,
+                stream_factory=lambda: FailingMockStream(parent_slices, all_parent_data, "first_stream"),
+            )
+        ],
+        parameters={},
+        config={},
+    )
+    slices = []
+
+    with pytest.raises(ValueError, match="parent read failed"):
+        for stream_slice in partition_router.stream_slices():
+            slices.append(stream_slice)
+    assert slices == [
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+    ]
+
+
+def test_given_records_cache_when_stream_slices_then_parent_stream_is_read_once():
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    records_cache = ParentRecordsCache()
+
+    def create_partition_router(partition_field):
+        return SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=parent_stream,
+                    parent_key="id",
+                    partition_field=partition_field,
+                    parameters={},
+                    config={},
+                    records_cache=records_cache,
+                    cache_key="first_stream",
+                )
+            ],
+            parameters={},
+            config={},
+        )
+
+    first_slices = list(create_partition_router("first_stream_id").stream_slices())
+    second_slices = list(create_partition_router("parent_id").stream_slices())
+
+    assert parent_stream.read_slices == parent_slices
+    assert [stream_slice["first_stream_id"] for stream_slice in first_slices] == [0, 1, 2]
+    assert [stream_slice["parent_id"] for stream_slice in second_slices] == [0, 1, 2]
+    assert [stream_slice["parent_slice"] for stream_slice in second_slices] == [{"slice": "first"}, {"slice": "first"}, {"slice": "second"}]
+
+
+def test_given_partially_read_parent_when_stream_slices_then_parent_records_are_not_cached():
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=parent_stream,
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+                records_cache=ParentRecordsCache(),
+                cache_key="first_stream",
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+    next(iter(partition_router.stream_slices()))
+    list(partition_router.stream_slices())
+
+    assert parent_stream.read_slices == [{"slice": "first"}] + parent_slices
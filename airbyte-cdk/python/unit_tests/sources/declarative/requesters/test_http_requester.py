@@ -76,6 +76,26 @@ def test_http_requester():
     assert requester.interpret_response_status(requests.Response()) == response_status
 
 
+@pytest.mark.parametrize(
+    "test_name, max_connections, expected_pool_size",
+    [
+        ("test_default_pool_size", None, requests.adapters.DEFAULT_POOLSIZE),
+        ("test_configured_pool_size", 32, 32),
+    ],
+)
+def test_connection_pool_size(test_name, max_connections, expected_pool_size):
+    requester = HttpRequester(
+        name="name",
+        url_base="https://example.com",
+        path="deals",
+        config={},
+        parameters={},
+        max_connections=max_connections,
+    )
+
+    assert requester._session.get_adapter("https://example.com/deals")._pool_maxsize == expected_pool_size
+
+
 @pytest.mark.parametrize(
     "test_name, base_url, expected_base_url",
     [
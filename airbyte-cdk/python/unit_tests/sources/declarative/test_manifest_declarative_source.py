@@ -652,6 +652,39 @@ class TestManifestDeclarativeSource:
         with pytest.raises(ValidationError):
             ManifestDeclarativeSource(source_config=manifest)
 
+    def test_given_manifest_cache_when_creating_source_again_then_reuse_validated_manifest(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MANIFEST_CACHE_PATH", str(tmp_path))
+        manifest = _a_valid_manifest()
+        source = ManifestDeclarativeSource(source_config=manifest)
+
+        with patch(
+            "airbyte_cdk.sources.declarative.manifest_declarative_source.ManifestReferenceResolver.preprocess_manifest"
+        ) as preprocess_manifest:
+            cached_source = ManifestDeclarativeSource(source_config=manifest)
+
+        preprocess_manifest.assert_not_called()
+        assert cached_source.resolved_manifest == source.resolved_manifest
+        assert [stream.name for stream in cached_source.streams({})] == ["lists"]
+
+    def test_given_manifest_cache_when_manifest_is_invalid_then_raise_and_do_not_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MANIFEST_CACHE_PATH", str(tmp_path))
+        manifest = _a_valid_manifest()
+        manifest["streams"] = []
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                ManifestDeclarativeSource(source_config=manifest)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_given_corrupted_manifest_cache_entry_when_creating_source_then_ignore_entry(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MANIFEST_CACHE_PATH", str(tmp_path))
+        manifest = _a_valid_manifest()
+        source = ManifestDeclarativeSource(source_config=manifest)
+        for cache_entry in tmp_path.iterdir():
+            cache_entry.write_text("{not json")
+
+        assert ManifestDeclarativeSource(source_config=manifest).resolved_manifest == source.resolved_manifest
+
     @patch("airbyte_cdk.sources.declarative.declarative_source.DeclarativeSource.read")
     def test_given_debug_when_read_then_set_log_level(self, declarative_source_read):
         any_valid_manifest = {
@@ -744,6 +777,31 @@ class TestManifestDeclarativeSource:
         assert debug_logger.isEnabledFor(logging.DEBUG)
 
 
+def _a_valid_manifest() -> dict:
+    return {
+        "version": "0.29.3",
+        "definitions": {},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "$parameters": {"name": "lists", "primary_key": "id", "url_base": "https://api.sendgrid.com"},
+                "schema_loader": {
+                    "name": "{{ parameters.stream_name }}",
+                    "file_path": "./source_sendgrid/schemas/{{ parameters.name }}.yaml",
+                },
+                "retriever": {
+                    "requester": {
+                        "path": "/v3/marketing/lists",
+                        "authenticator": {"type": "BearerAuthenticator", "api_token": "{{ config.apikey }}"},
+                    },
+                    "record_selector": {"extractor": {"field_path": ["result"]}},
+                },
+            }
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["lists"]},
+    }
+
+
 def request_log_message(request: dict) -> AirbyteMessage:
     return AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"request:{json.dumps(request)}"))
 
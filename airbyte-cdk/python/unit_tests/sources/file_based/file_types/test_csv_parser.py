@@ -6,9 +6,11 @@ import asyncio
 import csv
 import io
 import logging
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
@@ -20,12 +22,13 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
     CsvFormat,
     CsvHeaderAutogenerated,
     CsvHeaderUserProvided,
+    CsvParsingEngine,
     InferenceType,
 )
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader, _PyArrowCsvReader
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -434,7 +437,7 @@ class CsvReaderTest(unittest.TestCase):
 
         assert list(data_generator) == [{"header1": "1", "header2": 'Text with doublequote: "This is a text."""'}]
 
-    def test_given_generator_closed_when_read_data_then_unregister_dialect(self) -> None:
+    def test_given_generator_closed_when_read_data_then_no_dialect_is_registered(self) -> None:
         self._stream_reader.open_file.return_value = (
             CsvFileBuilder()
             .with_data(
@@ -447,13 +450,14 @@ class CsvReaderTest(unittest.TestCase):
             .build()
         )
 
+        dialects = csv.list_dialects()
         data_generator = self._read_data()
         next(data_generator)
-        assert f"{self._CONFIG_NAME}_config_dialect" in csv.list_dialects()
+        assert csv.list_dialects() == dialects
         data_generator.close()
-        assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
+        assert csv.list_dialects() == dialects
 
-    def test_given_too_many_values_for_columns_when_read_data_then_raise_exception_and_unregister_dialect(self) -> None:
+    def test_given_too_many_values_for_columns_when_read_data_then_raise_exception_and_no_dialect_is_registered(self) -> None:
         self._stream_reader.open_file.return_value = (
             CsvFileBuilder()
             .with_data(
@@ -466,15 +470,16 @@ class CsvReaderTest(unittest.TestCase):
             .build()
         )
 
+        dialects = csv.list_dialects()
         data_generator = self._read_data()
         next(data_generator)
-        assert f"{self._CONFIG_NAME}_config_dialect" in csv.list_dialects()
+        assert csv.list_dialects() == dialects
 
         with pytest.raises(RecordParseError):
             next(data_generator)
-        assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
+        assert csv.list_dialects() == dialects
 
-    def test_given_too_few_values_for_columns_when_read_data_then_raise_exception_and_unregister_dialect(self) -> None:
+    def test_given_too_few_values_for_columns_when_read_data_then_raise_exception_and_no_dialect_is_registered(self) -> None:
         self._stream_reader.open_file.return_value = (
             CsvFileBuilder()
             .with_data(
@@ -487,13 +492,32 @@ class CsvReaderTest(unittest.TestCase):
             .build()
         )
 
+        dialects = csv.list_dialects()
         data_generator = self._read_data()
         next(data_generator)
-        assert f"{self._CONFIG_NAME}_config_dialect" in csv.list_dialects()
+        assert csv.list_dialects() == dialects
 
         with pytest.raises(RecordParseError):
             next(data_generator)
-        assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
+        assert csv.list_dialects() == dialects
+
+    def test_given_files_read_concurrently_when_read_data_then_read_all_records(self) -> None:
+        self._config_format.delimiter = ";"
+        self._stream_reader.open_file.side_effect = lambda *args, **kwargs: (
+            CsvFileBuilder().with_data(["header1;header2", "value1;value2", "value3;value4"]).build()
+        )
+
+        def read_file(_: int) -> List[Dict[str, Any]]:
+            data_generator = self._read_data()
+            records = [next(data_generator)]
+            # leave another file of the stream time to start and stop while this one is being read
+            time.sleep(0.001)
+            return records + list(data_generator)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            files_records = list(executor.map(read_file, range(50)))
+
+        assert files_records == [[{"header1": "value1", "header2": "value2"}, {"header1": "value3", "header2": "value4"}]] * 50
 
     def _read_data(self) -> Generator[Dict[str, str], None, None]:
         data_generator = self._csv_reader.read_data(
@@ -538,3 +562,114 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+def _schema(**property_types: str) -> Dict[str, Any]:
+    return {"properties": {name: {"type": ["null", property_type]} for name, property_type in property_types.items()}}
+
+
+def _parse_with_engine(
+    content: str, format_options: Dict[str, Any], schema: Optional[Dict[str, Any]], schemaless: bool, engine: CsvParsingEngine
+) -> Tuple[List[Dict[str, Any]], Optional[str], List[Any]]:
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda *args: io.StringIO(content)
+    parser_logger = Mock()
+    config = FileBasedStreamConfig(
+        name="test", file_type="csv", format=CsvFormat(parsing_engine=engine, **format_options), schemaless=schemaless
+    )
+    records = []
+    error = None
+    try:
+        for record in CsvParser().parse_records(
+            config, RemoteFile(uri="a_file.csv", last_modified=datetime.now()), stream_reader, parser_logger, schema
+        ):
+            records.append(record)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return records, error, parser_logger.warning.call_args_list
+
+
+@pytest.mark.parametrize(
+    "content, format_options, schema",
+    [
+        pytest.param("a,b,c\n1,2.5,x\n3,4,y\n", {}, _schema(a="integer", b="number", c="string"), id="primitive-types"),
+        pytest.param('a,b\n"x, y","he said ""hi"""\n"multi\nline",z\n', {}, _schema(a="string", b="string"), id="quoted-values"),
+        pytest.param("a,b\nx\\,y,z\n", {"escape_char": "\\"}, _schema(a="string", b="string"), id="escape-char"),
+        pytest.param('a,b\n"x\\"y",z\n"\\"x",y\nz,\\', {"escape_char": "\\"}, _schema(a="string", b="string"), id="escape-char-after-quote"),
+        pytest.param('a,b\n"x""y",z\n', {"double_quote": False}, _schema(a="string", b="string"), id="double-quote-off"),
+        pytest.param("a;b\n1;2\n", {"delimiter": ";"}, _schema(a="integer", b="integer"), id="delimiter"),
+        pytest.param("a\tb\n1\t2\n", {"delimiter": "\t"}, None, id="tab-delimiter-without-schema"),
+        pytest.param(
+            "a,b,c\nNA,NA,1\nx,,NA\n", {"null_values": ["NA", ""]}, _schema(a="string", b="integer", c="integer"), id="null-values"
+        ),
+        pytest.param(
+            "a,b,c\nNA,NA,1\nx,,NA\n",
+            {"null_values": ["NA", ""], "strings_can_be_null": False},
+            _schema(a="string", b="integer", c="integer"),
+            id="strings-cannot-be-null",
+        ),
+        pytest.param(
+            "a,b\nyes,nope\nno,yes\nmaybe,x\n",
+            {"true_values": ["yes"], "false_values": ["no", "nope"]},
+            _schema(a="boolean", b="boolean"),
+            id="true-and-false-values",
+        ),
+        pytest.param(
+            "a,b,c\nabc,1_000, 7 \n99999999999999999999999,1e5,inf\n",
+            {},
+            _schema(a="integer", b="number", c="integer"),
+            id="values-that-cannot-be-cast",
+        ),
+        pytest.param("a,b,c\n1,x,\n", {}, _schema(a="null", b="null", c="null"), id="null-type"),
+        pytest.param('a,b\n"{""k"": 1}","[1, 2]"\n', {}, _schema(a="object", b="array"), id="objects-and-arrays"),
+        pytest.param('a,b\n"not json","{}"\n', {}, _schema(a="object", b="array"), id="invalid-objects-and-arrays"),
+        pytest.param(
+            "junk\njunk2\na,b\nskip\n1,2\n",
+            {"skip_rows_before_header": 2, "skip_rows_after_header": 1},
+            _schema(a="integer", b="integer"),
+            id="skip-rows",
+        ),
+        pytest.param(
+            "1,2\n3,4\n", {"header_definition": CsvHeaderAutogenerated()}, _schema(f0="integer", f1="integer"), id="autogenerated-headers"
+        ),
+        pytest.param(
+            "1,2\n3,4\n",
+            {"header_definition": CsvHeaderUserProvided(column_names=["x", "y"])},
+            _schema(x="integer", y="integer"),
+            id="user-provided-headers",
+        ),
+        pytest.param("a,b\n1,2\n3,4,5\n6,7\n", {}, _schema(a="integer", b="integer"), id="too-many-values"),
+        pytest.param("a,b\n1,2\n3\n6,7\n", {}, _schema(a="integer", b="integer"), id="too-few-values"),
+        pytest.param("a,b\n1,2\n\n\n3,4", {}, _schema(a="integer", b="integer"), id="empty-lines-and-no-final-newline"),
+        pytest.param("a,b\n \n1,2\n", {}, _schema(a="integer", b="integer"), id="blank-line"),
+        pytest.param("a,b\r\n1,2\r\n3,4\r\n", {}, _schema(a="integer", b="integer"), id="crlf"),
+        pytest.param("a,a,b\n1,2,3\n", {}, _schema(a="integer", b="integer"), id="duplicated-headers"),
+        pytest.param("a,b\n1,2\n", {}, _schema(a="integer"), id="column-not-in-schema"),
+        pytest.param("a,b\n1,2\n", {}, {"properties": {}}, id="empty-schema"),
+        pytest.param('a,b\n"x" ,y\na"b,c\n', {}, _schema(a="string", b="string"), id="quotes-inside-values"),
+        pytest.param("a,b\n", {}, _schema(a="string", b="string"), id="headers-only"),
+        pytest.param("", {}, _schema(a="string", b="string"), id="empty-file"),
+    ],
+)
+@pytest.mark.parametrize("schemaless", [False, True])
+def test_pyarrow_engine_emits_the_same_records_and_warnings_as_python_engine(
+    content: str, format_options: Dict[str, Any], schema: Optional[Dict[str, Any]], schemaless: bool
+) -> None:
+    assert _parse_with_engine(content, format_options, schema, schemaless, CsvParsingEngine.PYARROW) == _parse_with_engine(
+        content, format_options, schema, schemaless, CsvParsingEngine.PYTHON
+    )
+
+
+@pytest.mark.parametrize(
+    "last_rows",
+    [pytest.param("", id="valid-file"), pytest.param("1,2,3\n5,6\n", id="invalid-row-after-the-first-blocks")],
+)
+def test_pyarrow_engine_emits_the_same_records_as_python_engine_across_blocks(last_rows: str) -> None:
+    content = "a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(2000)) + last_rows
+    schema = _schema(a="integer", b="integer")
+
+    with mock.patch.object(_PyArrowCsvReader, "BLOCK_SIZE", 256):
+        records, error, warnings = _parse_with_engine(content, {}, schema, False, CsvParsingEngine.PYARROW)
+
+    assert (records, error, warnings) == _parse_with_engine(content, {}, schema, False, CsvParsingEngine.PYTHON)
+    assert len(records) == 2000
@@ -9,6 +9,7 @@ from typing import Any, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -227,3 +228,52 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     logger = Mock()
     with pytest.raises(ValueError):
         asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+
+
+@pytest.mark.parametrize(
+    "parquet_format",
+    [
+        pytest.param(_default_parquet_format, id="test_decimal_as_string"),
+        pytest.param(_decimal_as_float_parquet_format, id="test_decimal_as_float"),
+    ],
+)
+def test_parse_records_matches_value_transformation(parquet_format: ParquetFormat) -> None:
+    table = pa.table(
+        {
+            "int": pa.array([1, 2, 3], type=pa.int64()),
+            "float": pa.array([1.5, None, 3.5], type=pa.float64()),
+            "string": pa.array(["a", None, "c"], type=pa.string()),
+            "binary": pa.array([b"a", None, b"c"], type=pa.binary()),
+            "timestamp": pa.array([datetime.datetime(2023, 7, 7, 10, 11, 12)] * 3, type=pa.timestamp("us")),
+            "date": pa.array([datetime.date(2023, 7, 7)] * 3, type=pa.date32()),
+            "time": pa.array([datetime.time(1, 2, 3)] * 3, type=pa.time64("us")),
+            "duration": pa.array([12345, 1, 2], type=pa.duration("ms")),
+            "decimal": pa.array([12, 13, 14], type=pa.decimal128(5, 3)),
+            "map": pa.array([{"hello": 1}, {"world": 2}, {}], type=pa.map_(pa.string(), pa.int32())),
+            "struct": pa.array([{"field": 1}, {"field": 2}, None], type=pa.struct([pa.field("field", pa.int32())])),
+            "list": pa.array([[1, 2], [], None], type=pa.list_(pa.int32())),
+            "null": pa.array([None, None, None], type=pa.null()),
+        }
+    )
+    parquet_buffer = pa.BufferOutputStream()
+    pq.write_table(table, parquet_buffer, row_group_size=2)
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=pa.BufferReader(parquet_buffer.getvalue()))
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    config = FileBasedStreamConfig(
+        name="test.parquet",
+        format=parquet_format,
+        validation_policy=ValidationPolicy.emit_record,
+    )
+    file = RemoteFile(uri="s3://mybucket/year=2023/test.parquet", last_modified=datetime.datetime.now())
+
+    records = list(ParquetParser().parse_records(config, file, stream_reader, Mock(), None))
+
+    expected_records = [
+        {
+            **{column: ParquetParser._to_output_value(table.column(column)[row], parquet_format) for column in table.column_names},
+            "year": "2023",
+        }
+        for row in range(table.num_rows)
+    ]
+    assert records == expected_records
@@ -255,6 +255,13 @@ single_csv_scenario = (
                                                     "airbyte_hidden": True,
                                                     "enum": ["None", "Primitive Types Only"],
                                                 },
+                                                "parsing_engine": {
+                                                    "title": "Parsing Engine",
+                                                    "description": "The library used to parse the CSV files. PyArrow parses blocks of rows at once, which is faster on large files, and emits the same records as Python.",
+                                                    "default": "Python",
+                                                    "airbyte_hidden": True,
+                                                    "enum": ["Python", "PyArrow"],
+                                                },
                                             },
                                         },
                                         {
@@ -4,16 +4,18 @@
 
 import unittest
 from datetime import datetime, timezone
-from typing import Any, Iterable, Iterator, Mapping
+from typing import Any, Iterable, Iterator, Mapping, Optional
 from unittest.mock import Mock
 
 import pytest
 from airbyte_cdk.models import Level
 from airbyte_cdk.sources.file_based.availability_strategy import AbstractFileBasedAvailabilityStrategy
 from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
+from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, StopSyncPerValidationPolicy
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
 from airbyte_cdk.sources.file_based.schema_validation_policies import AbstractSchemaValidationPolicy
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.stream.default_file_based_stream import DefaultFileBasedStream
@@ -159,6 +161,112 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         }
         assert self._parser.infer_schema.call_count == 3
 
+    def test_given_schema_inference_cache_when_infer_schema_then_only_read_files_not_in_cache(self) -> None:
+        schema_inference_cache = Mock(spec=SchemaInferenceCache)
+        cached_file, new_file = RemoteFile(uri="cached_file", last_modified=self._NOW), RemoteFile(uri="new_file", last_modified=self._NOW)
+        schema_inference_cache.get.side_effect = lambda config, file: {"cached": {"type": "string"}} if file == cached_file else None
+        self._discovery_policy.n_concurrent_requests = 1
+        self._parser.infer_schema.return_value = {"new": {"type": "integer"}}
+        stream = self._create_stream(n_concurrent_file_reads=1, schema_inference_cache=schema_inference_cache)
+
+        schema = stream.infer_schema([cached_file, new_file])
+
+        assert schema == {"cached": {"type": ["null", "string"]}, "new": {"type": ["null", "integer"]}}
+        assert [call.args[1] for call in self._parser.infer_schema.call_args_list] == [new_file]
+        schema_inference_cache.set.assert_called_once_with(self._stream_config, new_file, {"new": {"type": "integer"}})
+        schema_inference_cache.save.assert_called_once()
+
+    def test_given_concurrent_reads_when_read_records_from_slice_then_return_records_in_file_order(self) -> None:
+        stream = self._create_stream(n_concurrent_file_reads=3)
+        self._stream_config.schemaless = True
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(10)]
+        self._parser.parse_records.side_effect = lambda config, file, *args: self._iter(
+            [{"file": file.uri, "line": line} for line in range(int(file.uri[len("file") :]) * 30)]
+        )
+
+        messages = list(stream.read_records_from_slice({"files": files}))
+
+        assert [message.record.data["data"] for message in messages] == [
+            {"file": file.uri, "line": line} for file in files for line in range(int(file.uri[len("file") :]) * 30)
+        ]
+        assert [call.args[0] for call in self._cursor.add_file.call_args_list] == files
+
+    def test_given_concurrent_reads_and_exception_when_read_records_from_slice_then_do_process_other_files(self) -> None:
+        stream = self._create_stream(n_concurrent_file_reads=2)
+        self._parser.parse_records.side_effect = lambda config, file, *args: self._iter(
+            [ValueError("An error")] if file.uri == "invalid_file" else [dict(self._A_RECORD)]
+        )
+        files = [RemoteFile(uri="invalid_file", last_modified=self._NOW), RemoteFile(uri="valid_file", last_modified=self._NOW)]
+
+        messages = list(stream.read_records_from_slice({"files": files}))
+
+        assert messages[0].log.level == Level.ERROR
+        assert messages[1].record.data["data"] == self._A_RECORD
+        assert [call.args[0] for call in self._cursor.add_file.call_args_list] == files[1:]
+
+    def test_given_concurrent_reads_and_sync_stopped_by_validation_policy_when_read_records_from_slice_then_stop_reading(self) -> None:
+        stream = self._create_stream(n_concurrent_file_reads=2)
+        self._stream_config.schemaless = False
+        self._validation_policy.record_passes_validation_policy.side_effect = StopSyncPerValidationPolicy(
+            FileBasedSourceError.STOP_SYNC_PER_SCHEMA_VALIDATION_POLICY
+        )
+        self._parser.parse_records.side_effect = lambda config, file, *args: self._iter([dict(self._A_RECORD)])
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(5)]
+
+        messages = list(stream.read_records_from_slice({"files": files}))
+
+        assert len(messages) == 1
+        assert messages[0].log.level == Level.WARN
+        self._cursor.add_file.assert_not_called()
+
+    def test_given_concurrent_reads_when_closing_before_the_end_then_workers_stop(self) -> None:
+        stream = self._create_stream(n_concurrent_file_reads=2)
+        stream.MAX_BUFFERED_MESSAGES_PER_FILE = 1
+        self._stream_config.schemaless = True
+        self._parser.parse_records.side_effect = lambda config, file, *args: self._iter([dict(self._A_RECORD)] * 1000)
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(5)]
+
+        messages = stream.read_records_from_slice({"files": files})
+        next(messages)
+        messages.close()
+
+        self._cursor.add_file.assert_not_called()
+
+    def test_given_concurrent_reads_when_compute_slices_then_group_timestamps_until_workers_have_enough_files(self) -> None:
+        stream = self._create_stream(n_concurrent_file_reads=2)
+        stream.MIN_FILES_PER_WORKER_IN_SLICE = 1
+        files = [
+            RemoteFile(uri="a", last_modified=datetime(2023, 1, 1)),
+            RemoteFile(uri="b", last_modified=datetime(2023, 1, 2)),
+            RemoteFile(uri="c", last_modified=datetime(2023, 1, 2)),
+            RemoteFile(uri="d", last_modified=datetime(2023, 1, 2)),
+            RemoteFile(uri="e", last_modified=datetime(2023, 1, 3)),
+        ]
+        self._stream_reader.get_matching_files.return_value = files
+        self._cursor.get_files_to_sync.side_effect = lambda all_files, logger: all_files
+
+        assert stream.compute_slices() == [{"files": files[:4]}, {"files": files[4:]}]
+
+    def test_given_n_concurrent_file_reads_is_not_positive_when_create_stream_then_raise(self) -> None:
+        with pytest.raises(ValueError):
+            self._create_stream(n_concurrent_file_reads=0)
+
+    def _create_stream(
+        self, n_concurrent_file_reads: int, schema_inference_cache: Optional[SchemaInferenceCache] = None
+    ) -> DefaultFileBasedStream:
+        return DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=self._catalog_schema,
+            stream_reader=self._stream_reader,
+            availability_strategy=self._availability_strategy,
+            discovery_policy=self._discovery_policy,
+            parsers={MockFormat: self._parser},
+            validation_policy=self._validation_policy,
+            cursor=self._cursor,
+            n_concurrent_file_reads=n_concurrent_file_reads,
+            schema_inference_cache=schema_inference_cache,
+        )
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
@@ -0,0 +1,92 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from datetime import datetime
+
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
+
+_CONFIG = FileBasedStreamConfig(name="a stream", file_type="csv", format=CsvFormat())
+_FILE = RemoteFile(uri="a/file.csv", last_modified=datetime(2023, 6, 5, 3, 54, 7))
+_SCHEMA = {"col1": {"type": "string"}, "col2": {"type": "integer"}}
+
+
+def test_given_schema_saved_when_get_from_another_cache_then_return_schema(tmp_path):
+    path = str(tmp_path / "cache" / "schemas.json")
+    cache = SchemaInferenceCache(path)
+    cache.set(_CONFIG, _FILE, _SCHEMA)
+    cache.save()
+
+    assert SchemaInferenceCache(path).get(_CONFIG, _FILE) == _SCHEMA
+
+
+def test_given_file_modified_when_get_then_return_none(tmp_path):
+    cache = SchemaInferenceCache(str(tmp_path / "schemas.json"))
+    cache.set(_CONFIG, _FILE, _SCHEMA)
+
+    assert cache.get(_CONFIG, RemoteFile(uri=_FILE.uri, last_modified=datetime(2023, 6, 6))) is None
+
+
+def test_given_different_format_when_get_then_return_none(tmp_path):
+    cache = SchemaInferenceCache(str(tmp_path / "schemas.json"))
+    cache.set(_CONFIG, _FILE, _SCHEMA)
+
+    assert cache.get(FileBasedStreamConfig(name="a stream", file_type="csv", format=CsvFormat(delimiter=";")), _FILE) is None
+    assert cache.get(FileBasedStreamConfig(name="a stream", file_type="jsonl", format=JsonlFormat()), _FILE) is None
+
+
+def test_given_unreadable_cache_file_when_get_then_return_none(tmp_path):
+    path = tmp_path / "schemas.json"
+    path.write_text("not json")
+
+    assert SchemaInferenceCache(str(path)).get(_CONFIG, _FILE) is None
+
+
+def test_given_no_changes_when_save_then_do_not_write(tmp_path):
+    path = tmp_path / "schemas.json"
+    cache = SchemaInferenceCache(str(path))
+    cache.get(_CONFIG, _FILE)
+    cache.save()
+
+    assert not path.exists()
+
+
+def test_given_files_not_seen_when_save_then_drop_their_schemas(tmp_path):
+    path = str(tmp_path / "schemas.json")
+    modified_file = RemoteFile(uri=_FILE.uri, last_modified=datetime(2023, 6, 6))
+    deleted_file = RemoteFile(uri="a/deleted_file.csv", last_modified=_FILE.last_modified)
+    cache = SchemaInferenceCache(path)
+    cache.set(_CONFIG, _FILE, _SCHEMA)
+    cache.set(_CONFIG, deleted_file, _SCHEMA)
+    cache.save()
+
+    cache = SchemaInferenceCache(path)
+    cache.get(_CONFIG, modified_file)
+    cache.set(_CONFIG, modified_file, _SCHEMA)
+    cache.save()
+
+    cache = SchemaInferenceCache(path)
+    assert cache.get(_CONFIG, modified_file) == _SCHEMA
+    assert cache.get(_CONFIG, _FILE) is None
+    assert cache.get(_CONFIG, deleted_file) is None
+
+
+def test_given_only_cached_files_seen_when_save_then_drop_the_schemas_of_the_other_files(tmp_path):
+    path = str(tmp_path / "schemas.json")
+    other_file = RemoteFile(uri="a/other_file.csv", last_modified=_FILE.last_modified)
+    cache = SchemaInferenceCache(path)
+    cache.set(_CONFIG, _FILE, _SCHEMA)
+    cache.set(_CONFIG, other_file, _SCHEMA)
+    cache.save()
+
+    cache = SchemaInferenceCache(path)
+    assert cache.get(_CONFIG, _FILE) == _SCHEMA
+    cache.save()
+
+    cache = SchemaInferenceCache(path)
+    assert cache.get(_CONFIG, _FILE) == _SCHEMA
+    assert cache.get(_CONFIG, other_file) is None
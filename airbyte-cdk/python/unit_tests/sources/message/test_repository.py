@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -19,6 +20,7 @@ from airbyte_cdk.sources.message import (
     LogAppenderMessageRepositoryDecorator,
     MessageRepository,
     NoopMessageRepository,
+    StructuredLogMessage,
 )
 from pydantic.error_wrappers import ValidationError
 
@@ -91,7 +93,26 @@ class TestInMemoryMessageRepository:
 
         repo.log_message(Level.INFO, lambda: "this is a log message")
 
-        assert list(repo.consume_queue())[0].log.message == filtered_message
+        assert list(repo.consume_queue())[0].log.message == f'"{filtered_message}"'
+
+    def test_given_secrets_in_nested_values_when_log_message_then_filter_secrets_in_message_and_content(self, mocker):
+        mocker.patch("airbyte_cdk.utils.airbyte_secrets_utils.__SECRETS_FROM_CONFIG", ['a "secret"'])
+        repo = InMemoryMessageRepository(Level.DEBUG)
+
+        repo.log_message(Level.INFO, lambda: {"http": {"headers": {"token": 'a "secret"'}, "values": ['is a "secret"', 1]}})
+
+        log_message = list(repo.consume_queue())[0].log
+        assert isinstance(log_message, StructuredLogMessage)
+        assert log_message.content == {"http": {"headers": {"token": "****"}, "values": ["is ****", 1]}}
+        assert json.loads(log_message.message) == log_message.content
+
+    def test_when_log_message_then_content_is_not_serialized(self):
+        repo = InMemoryMessageRepository(Level.DEBUG)
+
+        repo.log_message(Level.INFO, lambda: {"a_key": "a_value"})
+
+        message = list(repo.consume_queue())[0]
+        assert json.loads(message.json(exclude_unset=True)) == {"type": "LOG", "log": {"level": "INFO", "message": '{"a_key": "a_value"}'}}
 
     def test_given_log_level_not_severe_enough_when_log_message_then_do_not_allow_message_to_be_consumed(self):
         repo = InMemoryMessageRepository(Level.ERROR)
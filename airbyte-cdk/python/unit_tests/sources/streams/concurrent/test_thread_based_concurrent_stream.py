@@ -2,9 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import functools
+import threading
+import time
 import unittest
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
+import pytest
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.streams.concurrent.availability_strategy import STREAM_AVAILABLE
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -103,18 +107,95 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
 
         self._message_repository.emit_message.assert_called_once_with(slice_log_message)
 
-    def test_wait_while_task_queue_is_full(self):
-        f1 = Mock()
-        f2 = Mock()
+    def test_read_does_not_process_more_than_max_concurrent_tasks_partitions_at_once(self):
+        max_concurrent_tasks = 2
+        stream = ThreadBasedConcurrentStream(
+            self._partition_generator,
+            4,
+            self._name,
+            self._json_schema,
+            self._availability_strategy,
+            self._primary_key,
+            self._cursor_field,
+            self._slice_logger,
+            self._logger,
+            self._message_repository,
+            1,
+            max_concurrent_tasks,
+            max_queue_size=1,
+        )
+        lock = threading.Lock()
+        running_partitions = []
+        max_running_partitions = []
+
+        def _read_partition(partition_id):
+            with lock:
+                running_partitions.append(partition_id)
+                max_running_partitions.append(len(running_partitions))
+            time.sleep(0.01)
+            with lock:
+                running_partitions.remove(partition_id)
+            return [Record({"id": partition_id})]
+
+        partitions = []
+        for partition_id in range(10):
+            partition = Mock(spec=Partition)
+            partition.read.side_effect = functools.partial(_read_partition, partition_id)
+            partitions.append(partition)
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = partitions
+
+        actual_records = list(stream.read())
 
-        # Verify that the done() method will be called until only one future is still running
-        f1.done.side_effect = [False, False]
-        f2.done.side_effect = [False, True]
-        futures = [f1, f2]
-        self._stream._wait_while_too_many_pending_futures(futures)
+        assert sorted(record.data["id"] for record in actual_records) == list(range(10))
+        assert max(max_running_partitions) <= max_concurrent_tasks
+
+    def test_read_stopped_early_waits_for_tasks_blocked_on_the_queue(self):
+        stream = ThreadBasedConcurrentStream(
+            self._partition_generator,
+            self._max_workers,
+            self._name,
+            self._json_schema,
+            self._availability_strategy,
+            self._primary_key,
+            self._cursor_field,
+            self._slice_logger,
+            self._logger,
+            self._message_repository,
+            1,
+            2,
+            max_queue_size=1,
+        )
+        partition = Mock(spec=Partition)
+        partition.read.return_value = [Record({"id": record_id}) for record_id in range(10)]
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = [partition]
 
-        f1.done.assert_has_calls([call(), call()])
-        f2.done.assert_has_calls([call(), call()])
+        records = stream.read()
+        assert next(records) == Record({"id": 0})
+        records.close()
+
+        assert stream._threadpool.submit(lambda: True).result(timeout=1)
+
+    def test_sleep_time_is_deprecated_and_does_not_bound_the_queue(self):
+        with pytest.warns(DeprecationWarning, match="sleep_time"):
+            stream = ThreadBasedConcurrentStream(
+                self._partition_generator,
+                self._max_workers,
+                self._name,
+                self._json_schema,
+                self._availability_strategy,
+                self._primary_key,
+                self._cursor_field,
+                self._slice_logger,
+                self._logger,
+                self._message_repository,
+                1,
+                2,
+                0.1,
+            )
+
+        assert stream._max_queue_size == ThreadBasedConcurrentStream.DEFAULT_MAX_QUEUE_SIZE
 
     def test_as_airbyte_stream(self):
         expected_airbyte_stream = AirbyteStream(
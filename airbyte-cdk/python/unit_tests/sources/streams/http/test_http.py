@@ -15,6 +15,7 @@ from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
+from airbyte_cdk.sources.streams.http.http import mount_connection_pool
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
 
 
@@ -60,6 +61,40 @@ def test_http_token_authenticator():
     assert stream._session.auth is None
 
 
+class ManyConnectionsHttpStream(StubBasicReadHttpStream):
+    max_connections = 32
+
+
+@pytest.mark.parametrize(
+    "stream_class, expected_pool_size",
+    [
+        pytest.param(StubBasicReadHttpStream, requests.adapters.DEFAULT_POOLSIZE, id="test_default_pool_size"),
+        pytest.param(ManyConnectionsHttpStream, 32, id="test_overridden_pool_size"),
+    ],
+)
+def test_connection_pool_size(mocker, stream_class, expected_pool_size):
+    stream = stream_class()
+    response = requests.Response()
+    response.status_code = 200
+    mocker.patch.object(stream._session, "send", return_value=response)
+
+    stream._send_request(requests.PreparedRequest(), {})
+
+    for scheme in ["https://", "http://"]:
+        assert stream._session.adapters[scheme]._pool_maxsize == expected_pool_size
+
+
+def test_connection_pool_mounted_on_first_request():
+    stream = ManyConnectionsHttpStream()
+
+    assert stream._session.adapters["https://"]._pool_maxsize == requests.adapters.DEFAULT_POOLSIZE
+
+
+def test_connection_pool_without_connections_raises():
+    with pytest.raises(ValueError):
+        mount_connection_pool(requests.Session(), 0)
+
+
 def test_request_kwargs_used(mocker, requests_mock):
     stream = StubBasicReadHttpStream()
     request_kwargs = {"cert": None, "proxies": "google.com"}
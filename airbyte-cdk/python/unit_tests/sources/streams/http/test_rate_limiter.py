@@ -0,0 +1,158 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import time
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.rate_limiter import HttpRequestMatcher, RateLimiter, SlidingWindowRatePolicy, TokenBucketRatePolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _request(method: str = "GET", url: str = "https://api.example.com/v1/users") -> requests.PreparedRequest:
+    return requests.Request(method, url).prepare()
+
+
+def _response(status_code: int = 200, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.mark.parametrize(
+    "matcher, request_, expected_match",
+    [
+        pytest.param(HttpRequestMatcher(), _request(), True, id="test_no_criteria_matches_everything"),
+        pytest.param(HttpRequestMatcher(method="get"), _request("GET"), True, id="test_method_is_case_insensitive"),
+        pytest.param(HttpRequestMatcher(method="POST"), _request("GET"), False, id="test_other_method"),
+        pytest.param(HttpRequestMatcher(host="API.example.com"), _request(), True, id="test_host"),
+        pytest.param(HttpRequestMatcher(host="other.example.com"), _request(), False, id="test_other_host"),
+        pytest.param(HttpRequestMatcher(path_pattern="^/v1/"), _request(), True, id="test_path_pattern"),
+        pytest.param(HttpRequestMatcher(path_pattern="^/v2/"), _request(), False, id="test_other_path"),
+    ],
+)
+def test_http_request_matcher(matcher, request_, expected_match):
+    assert matcher.matches(request_) == expected_match
+
+
+def test_token_bucket_allows_burst_then_refills_steadily():
+    clock = FakeClock()
+    policy = TokenBucketRatePolicy(max_calls=2, period_in_seconds=1, clock=clock)
+
+    assert policy.try_acquire() == 0
+    assert policy.try_acquire() == 0
+    assert policy.try_acquire() == pytest.approx(0.5)
+
+    clock.now = 0.5
+    assert policy.try_acquire() == 0
+    assert policy.try_acquire() == pytest.approx(0.5)
+
+
+def test_sliding_window_allows_max_calls_per_window():
+    clock = FakeClock()
+    policy = SlidingWindowRatePolicy(max_calls=2, period_in_seconds=10, clock=clock)
+
+    assert policy.try_acquire() == 0
+    clock.now = 4
+    assert policy.try_acquire() == 0
+    assert policy.try_acquire() == pytest.approx(6)
+
+    clock.now = 10
+    assert policy.try_acquire() == 0
+    assert policy.try_acquire() == pytest.approx(4)
+
+
+@pytest.mark.parametrize("policy_class", [TokenBucketRatePolicy, SlidingWindowRatePolicy])
+def test_policy_limits_available_calls(policy_class):
+    clock = FakeClock()
+    policy = policy_class(max_calls=10, period_in_seconds=10, clock=clock)
+
+    policy.limit_available_calls(1)
+
+    assert policy.try_acquire() == 0
+    assert policy.try_acquire() > 0
+
+
+@pytest.mark.parametrize("policy_class", [TokenBucketRatePolicy, SlidingWindowRatePolicy])
+def test_policy_pause(policy_class):
+    clock = FakeClock()
+    policy = policy_class(max_calls=10, period_in_seconds=1, clock=clock)
+
+    policy.pause(30)
+
+    assert policy.try_acquire() == pytest.approx(30)
+    clock.now = 30
+    assert policy.try_acquire() == 0
+
+
+@pytest.mark.parametrize("policy_class", [TokenBucketRatePolicy, SlidingWindowRatePolicy])
+def test_policy_without_calls_raises(policy_class):
+    with pytest.raises(ValueError):
+        policy_class(max_calls=0, period_in_seconds=1)
+
+
+def test_rate_limiter_waits_for_the_matching_policy():
+    clock = FakeClock()
+    users_policy = TokenBucketRatePolicy(
+        max_calls=1, period_in_seconds=2, matchers=[HttpRequestMatcher(path_pattern="/users")], clock=clock
+    )
+    rate_limiter = RateLimiter(policies=[users_policy], sleep=clock.sleep)
+
+    rate_limiter.acquire(_request())
+    rate_limiter.acquire(_request(url="https://api.example.com/v1/orders"))
+    assert clock.now == 0
+
+    rate_limiter.acquire(_request())
+    assert clock.now == pytest.approx(2)
+
+
+def test_rate_limiter_pauses_on_retry_after():
+    clock = FakeClock()
+    policy = TokenBucketRatePolicy(max_calls=10, period_in_seconds=1, clock=clock)
+    rate_limiter = RateLimiter(policies=[policy], sleep=clock.sleep)
+
+    rate_limiter.update_from_response(_request(), _response(429, {"Retry-After": "15"}))
+    rate_limiter.acquire(_request())
+
+    assert clock.now == pytest.approx(15)
+
+
+@pytest.mark.parametrize(
+    "reset_header_value",
+    [
+        pytest.param(lambda: "20", id="test_reset_in_seconds"),
+        pytest.param(lambda: str(time.time() + 20), id="test_reset_as_timestamp"),
+    ],
+)
+def test_rate_limiter_pauses_until_reset_when_no_calls_remain(reset_header_value):
+    clock = FakeClock()
+    policy = SlidingWindowRatePolicy(max_calls=10, period_in_seconds=1, clock=clock)
+    rate_limiter = RateLimiter(policies=[policy], sleep=clock.sleep)
+
+    rate_limiter.update_from_response(_request(), _response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset_header_value()}))
+    rate_limiter.acquire(_request())
+
+    assert clock.now == pytest.approx(20, abs=1)
+
+
+def test_rate_limiter_ignores_invalid_headers():
+    clock = FakeClock()
+    policy = TokenBucketRatePolicy(max_calls=1, period_in_seconds=1, clock=clock)
+    rate_limiter = RateLimiter(policies=[policy], sleep=clock.sleep)
+
+    rate_limiter.update_from_response(_request(), _response(429, {"Retry-After": "soon", "X-RateLimit-Remaining": "unknown"}))
+    rate_limiter.acquire(_request())
+
+    assert clock.now == 0
@@ -5,6 +5,8 @@
 import copy
 import datetime
 import logging
+import threading
+import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from unittest.mock import Mock, call
@@ -54,12 +56,14 @@ class MockSource(AbstractSource):
         per_stream: bool = True,
         message_repository: MessageRepository = None,
         exception_on_missing_stream: bool = True,
+        n_concurrent_stream_reads: int = 1,
     ):
         self._streams = streams
         self.check_lambda = check_lambda
         self.per_stream = per_stream
         self.exception_on_missing_stream = exception_on_missing_stream
         self._message_repository = message_repository
+        self._n_concurrent_stream_reads = n_concurrent_stream_reads
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
         if self.check_lambda:
@@ -83,6 +87,10 @@ class MockSource(AbstractSource):
     def message_repository(self):
         return self._message_repository
 
+    @property
+    def n_concurrent_stream_reads(self) -> int:
+        return self._n_concurrent_stream_reads
+
 
 class StreamNoStateMethod(Stream):
     name = "managers"
@@ -1155,3 +1163,116 @@ def test_checkpoint_state_from_stream_instance():
     assert actual_message == _as_state(
         {"teams": {"updated_at": "2022-09-11"}, "managers": {"updated": "expected_here"}}, "managers", {"updated": "expected_here"}
     )
+
+
+def _messages_by_stream(messages: List[AirbyteMessage]) -> Dict[str, List[AirbyteMessage]]:
+    messages_by_stream = defaultdict(list)
+    for message in messages:
+        if message.type == Type.RECORD:
+            messages_by_stream[message.record.stream].append(message)
+        elif message.type == Type.STATE:
+            # The legacy state data holds the state of the streams checkpointed so far which depends on how the reads interleave
+            messages_by_stream[message.state.stream.stream_descriptor.name].append(message.state.stream)
+        elif message.type == Type.TRACE:
+            messages_by_stream[message.trace.stream_status.stream_descriptor.name].append(message)
+    return messages_by_stream
+
+
+@pytest.mark.parametrize("config", [pytest.param({}, id="test_without_limit"), pytest.param({"_limit": 3}, id="test_with_limit")])
+def test_concurrent_read_emits_the_messages_of_each_stream_in_order(mocker, config):
+    stream_output = [{"cursor": i} for i in range(5)]
+    streams = [
+        MockStreamWithState([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name=f"s{i}") for i in range(6)
+    ]
+    mocker.patch.object(MockStreamWithState, "get_json_schema", return_value={})
+    mocker.patch.object(MockStreamWithState, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=2)
+    mocker.patch.object(MockStreamWithState, "state", new_callable=mocker.PropertyMock, return_value={"cursor": "value"})
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    expected = _fix_emitted_at(list(MockSource(streams=streams).read(logger, config, catalog)))
+    messages = _fix_emitted_at(list(MockSource(streams=streams, n_concurrent_stream_reads=3).read(logger, config, catalog)))
+
+    assert len(messages) == len(expected)
+    assert _messages_by_stream(messages) == _messages_by_stream(expected)
+
+
+def test_concurrent_read_raises_the_exception_of_a_failing_stream(mocker):
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s2")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(s2, "read_records", side_effect=RuntimeError("oh no!"))
+
+    src = MockSource(streams=[s1, s2], n_concurrent_stream_reads=2)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+
+    messages = []
+    with pytest.raises(RuntimeError, match="oh no!"):
+        for message in src.read(logger, {}, catalog):
+            messages.append(message)
+
+    assert _fix_emitted_at(_messages_by_stream(messages)["s2"]) == _fix_emitted_at(
+        [_as_stream_status("s2", AirbyteStreamStatus.STARTED), _as_stream_status("s2", AirbyteStreamStatus.INCOMPLETE)]
+    )
+
+
+def test_concurrent_read_marks_the_streams_stopped_by_a_failing_stream_as_incomplete(mocker):
+    s1 = MockStream(name="s1")
+    s2 = MockStream(name="s2")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    s1_started = threading.Event()
+
+    def read_s1_records(**kwargs):
+        s1_started.set()
+        while True:
+            yield {"k1": "v1"}
+            time.sleep(0.01)
+
+    def read_s2_records(**kwargs):
+        s1_started.wait()
+        raise RuntimeError("oh no!")
+
+    mocker.patch.object(s1, "read_records", side_effect=read_s1_records)
+    mocker.patch.object(s2, "read_records", side_effect=read_s2_records)
+
+    src = MockSource(streams=[s1, s2], n_concurrent_stream_reads=2)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+
+    messages = []
+    with pytest.raises(RuntimeError, match="oh no!"):
+        for message in src.read(logger, {}, catalog):
+            messages.append(message)
+
+    s1_statuses = [
+        message.trace.stream_status.status for message in _messages_by_stream(messages)["s1"] if message.type == MessageType.TRACE
+    ]
+    assert s1_statuses[0] == AirbyteStreamStatus.STARTED
+    assert s1_statuses[-1] == AirbyteStreamStatus.INCOMPLETE
+    assert AirbyteStreamStatus.COMPLETE not in s1_statuses
+
+
+def test_concurrent_read_raises_on_missing_stream_before_reading(mocker):
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k1": "v1"}])], name="s1")
+    s2 = MockStream(name="this_stream_doesnt_exist_in_the_source")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    read_records = mocker.spy(s1, "read_records")
+
+    src = MockSource(streams=[s1], n_concurrent_stream_reads=2)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+
+    with pytest.raises(KeyError):
+        list(src.read(logger, {}, catalog))
+    read_records.assert_not_called()
+
+
+def test_state_lock_is_not_shared_between_sources():
+    source, another_source = MockSource(), MockSource()
+
+    assert source._get_state_lock() is source._get_state_lock()
+    assert source._get_state_lock() is not another_source._get_state_lock()
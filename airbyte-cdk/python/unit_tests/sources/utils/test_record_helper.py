@@ -83,3 +83,16 @@ def test_state_message_to_message(test_name, data):
     schema = {}
     with pytest.raises(ValueError):
         stream_data_to_airbyte_message(STREAM_NAME, data, transformer, schema)
+
+
+def test_record_message_is_built_like_a_validated_message():
+    data = {"id": 0, "nested": {"field": [1, 2]}}
+    message = stream_data_to_airbyte_message(STREAM_NAME, data)
+    expected_message = AirbyteMessage(
+        type=MessageType.RECORD, record=AirbyteRecordMessage(stream=STREAM_NAME, data=data, emitted_at=message.record.emitted_at)
+    )
+
+    assert message.record.data is not data
+    assert message.__fields_set__ == expected_message.__fields_set__
+    assert message.record.__fields_set__ == expected_message.record.__fields_set__
+    assert message.json(exclude_unset=True) == expected_message.json(exclude_unset=True)
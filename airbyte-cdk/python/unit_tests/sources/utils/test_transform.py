@@ -264,3 +264,67 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+def test_transform_with_recursive_reference(caplog):
+    schema = {
+        "definitions": {"node": {"type": "object", "properties": {"value": {"type": "integer"}, "child": {"$ref": "#/definitions/node"}}}},
+        "$ref": "#/definitions/node",
+    }
+    record = {"value": "1", "child": {"value": "2", "child": {"value": "three"}}}
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, schema)
+
+    assert record == {"value": 1, "child": {"value": 2, "child": {"value": "three"}}}
+    assert [r.message for r in caplog.records] == [
+        "Failed to transform value 'three' of type 'string' to 'integer', key path: '.child.child.value'"
+    ]
+
+
+def test_transform_compiles_a_schema_once():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    schema = json.loads(json.dumps(SIMPLE_SCHEMA))
+
+    for _ in range(3):
+        record = {"value": 12}
+        transformer.transform(record, schema)
+        assert record == {"value": "12"}
+
+    assert list(transformer._compiled_normalizers) == [id(schema)]
+
+
+def test_transform_compiles_each_schema():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    record = {"value": 12}
+    transformer.transform(record, SIMPLE_SCHEMA)
+    assert record == {"value": "12"}
+
+    record = {"value": "12"}
+    transformer.transform(record, {"type": "object", "properties": {"value": {"type": "integer"}}})
+
+    assert record == {"value": 12}
+
+
+def test_custom_transform_registered_after_transforming_records():
+    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+    record = {"value": 12}
+    transformer.transform(record, SIMPLE_SCHEMA)
+    assert record == {"value": "12"}
+
+    transformer.registerCustomTransform(lambda instance, schema: f"transformed {instance}")
+    record = {"value": 12}
+    transformer.transform(record, SIMPLE_SCHEMA)
+    assert record == {"value": "transformed 12"}
+
+
+def test_transform_with_schema_the_validator_cannot_walk():
+    # A boolean subschema makes the validator fail when the record has the property, compiling the schema must not change that
+    schema = {"type": "object", "properties": {"value": {"type": "string"}, "anything": True}}
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    record = {"value": 12}
+    transformer.transform(record, schema)
+    assert record == {"value": "12"}
+
+    with pytest.raises(TypeError):
+        transformer.transform({"value": 12, "anything": 1}, schema)
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
 import os
 from argparse import Namespace
 from copy import deepcopy
@@ -18,10 +19,12 @@ from airbyte_cdk.models import (
     AirbyteConnectionStatus,
     AirbyteControlConnectorConfigMessage,
     AirbyteControlMessage,
+    AirbyteLogMessage,
     AirbyteMessage,
     AirbyteRecordMessage,
     AirbyteStream,
     ConnectorSpecification,
+    Level,
     OrchestratorType,
     Status,
     SyncMode,
@@ -257,6 +260,52 @@ def test_run_read_with_exception(entrypoint: AirbyteEntrypoint, mocker, spec_moc
         assert [MESSAGE_FROM_REPOSITORY.json(exclude_unset=True)] == messages
 
 
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(
+                    namespace=None,
+                    stream="stream",
+                    data={
+                        "unicode": "caf\u00e9",
+                        "nested": [1, {"null": None}],
+                        "datetime": datetime.datetime(2023, 1, 1),
+                        "tuple": (1, 2),
+                        "model": AirbyteLogMessage(level=Level.INFO, message="message"),
+                    },
+                    emitted_at=1,
+                ),
+            ),
+            id="test_record_with_non_json_values",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1, extra="field")),
+            id="test_record_with_extra_field",
+        ),
+        pytest.param(AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="message")), id="test_log"),
+    ],
+)
+def test_airbyte_message_to_string(message):
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+def test_launch_prints_one_message_per_line(mocker, capsys):
+    messages = ["message_1", "message_2"]
+    mocker.patch.object(AirbyteEntrypoint, "parse_args")
+    mocker.patch.object(AirbyteEntrypoint, "run", return_value=messages)
+
+    entrypoint_module.launch(MockSource(), [])
+
+    assert capsys.readouterr().out == "message_1\nmessage_2\n"
+
+
 def test_invalid_command(entrypoint: AirbyteEntrypoint, config_mock):
     with pytest.raises(Exception):
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
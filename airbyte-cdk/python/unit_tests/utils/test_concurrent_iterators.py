@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from typing import Iterator, List
+
+import pytest
+from airbyte_cdk.utils.concurrent_iterators import iterate_concurrently
+
+
+def _items(name: str, n_items: int, delay: float = 0) -> Iterator[str]:
+    for i in range(n_items):
+        time.sleep(delay)
+        yield f"{name}{i}"
+
+
+@pytest.mark.parametrize("batch_size", [pytest.param(1, id="test_without_batches"), pytest.param(3, id="test_with_batches")])
+def test_given_preserve_order_when_iterate_concurrently_then_yield_items_iterator_after_iterator(batch_size: int) -> None:
+    iterators = [_items("a", 5, delay=0.002), _items("b", 7), _items("c", 0), _items("d", 4)]
+
+    items = list(iterate_concurrently(iterators, n_workers=2, max_buffered_items=2, batch_size=batch_size))
+
+    assert items == [f"a{i}" for i in range(5)] + [f"b{i}" for i in range(7)] + [f"d{i}" for i in range(4)]
+
+
+def test_given_not_preserve_order_when_iterate_concurrently_then_yield_every_item_in_the_order_of_its_iterator() -> None:
+    iterators = [_items("a", 5, delay=0.002), _items("b", 7), _items("c", 4, delay=0.001)]
+
+    items = list(iterate_concurrently(iterators, n_workers=3, max_buffered_items=2, preserve_order=False))
+
+    assert sorted(items) == sorted([f"a{i}" for i in range(5)] + [f"b{i}" for i in range(7)] + [f"c{i}" for i in range(4)])
+    for name in "abc":
+        assert [item for item in items if item.startswith(name)] == sorted(item for item in items if item.startswith(name))
+
+
+@pytest.mark.parametrize("preserve_order", [pytest.param(True, id="test_preserve_order"), pytest.param(False, id="test_not_preserve_order")])
+def test_given_iterator_raising_when_iterate_concurrently_then_raise_after_its_previous_items(preserve_order: bool) -> None:
+    def failing_items() -> Iterator[str]:
+        yield "failing0"
+        raise ValueError("oh no!")
+
+    items: List[str] = []
+    with pytest.raises(ValueError, match="oh no!"):
+        for item in iterate_concurrently([failing_items()], n_workers=2, max_buffered_items=10, preserve_order=preserve_order, batch_size=5):
+            items.append(item)
+
+    assert items == ["failing0"]
+
+
+def test_given_generator_closed_when_iterate_concurrently_then_close_the_iterators_being_read() -> None:
+    closed = threading.Event()
+
+    def endless_items() -> Iterator[int]:
+        try:
+            while True:
+                yield 1
+        finally:
+            closed.set()
+
+    items = iterate_concurrently([endless_items()], n_workers=1, max_buffered_items=1)
+    next(items)
+    items.close()
+
+    assert closed.is_set()
@@ -0,0 +1,39 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque
+
+
+class BackgroundWriter:
+    """
+    Runs flushes on a background thread so that the next records are read while the previous ones are written.
+
+    Flushes run one at a time, in the order they were submitted, so the AWS session is never used by two threads at once.
+    Submitting blocks once `max_pending_flushes` flushes are queued, which bounds the memory used by the records waiting
+    to be written. Errors raised by a flush are raised again by the next call waiting for it.
+    """
+
+    def __init__(self, max_pending_flushes: int):
+        if max_pending_flushes < 1:
+            raise ValueError(f"At least one pending flush is needed, got {max_pending_flushes}")
+        self._max_pending_flushes = max_pending_flushes
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flush_writer")
+        self._pending_flushes: Deque[Future] = deque()
+
+    def submit(self, flush: Callable[[], None]) -> None:
+        while len(self._pending_flushes) >= self._max_pending_flushes:
+            self._pending_flushes.popleft().result()
+        self._pending_flushes.append(self._executor.submit(flush))
+
+    def wait(self) -> None:
+        """
+        Blocks until every submitted flush is written
+        """
+        while self._pending_flushes:
+            self._pending_flushes.popleft().result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
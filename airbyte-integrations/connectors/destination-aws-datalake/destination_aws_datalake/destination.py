@@ -14,6 +14,7 @@ from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, Configur
 from botocore.exceptions import ClientError, InvalidRegionError
 
 from .aws import AwsHandler
+from .background_writer import BackgroundWriter
 from .config_reader import ConnectorConfig
 from .stream_writer import StreamWriter
 
@@ -21,6 +22,8 @@ logger = logging.getLogger("airbyte")
 
 # Flush records every 25000 records to limit memory consumption
 RECORD_FLUSH_INTERVAL = 25000
+# Number of flushes of RECORD_FLUSH_INTERVAL records that can wait to be written while the next records are read
+MAX_PENDING_FLUSHES = 2
 
 
 class DestinationAwsDatalake(Destination):
@@ -64,8 +67,20 @@ class DestinationAwsDatalake(Destination):
             for s in configured_catalog.streams
         }
 
+        background_writer = BackgroundWriter(MAX_PENDING_FLUSHES)
+        try:
+            yield from self._write_messages(streams, background_writer, input_messages)
+        finally:
+            background_writer.shutdown()
+
+    def _write_messages(
+        self, streams: Dict[str, StreamWriter], background_writer: BackgroundWriter, input_messages: Iterable[AirbyteMessage]
+    ) -> Iterable[AirbyteMessage]:
         for message in input_messages:
             if message.type == Type.STATE:
+                # Records flushed in the background are written before resetting tables and releasing the state
+                background_writer.wait()
+
                 if not message.state.data:
 
                     if message.state.stream:
@@ -98,14 +113,16 @@ class DestinationAwsDatalake(Destination):
 
                 # Flush records every RECORD_FLUSH_INTERVAL records to limit memory consumption
                 # Records will either get flushed when a state message is received or when hitting the RECORD_FLUSH_INTERVAL
+                # They are written in the background while the next records are read
                 if len(streams[stream]._messages) > RECORD_FLUSH_INTERVAL:
                     logger.debug(f"Reached size limit: flushing records for {stream}")
-                    streams[stream].flush(partial=True)
+                    streams[stream].flush_in_background(background_writer, partial=True)
 
             else:
                 logger.info(f"Unhandled message type {message.type}: {message}")
 
         # Flush all or remaining records
+        background_writer.wait()
         self._flush_streams(streams)
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
@@ -11,9 +11,13 @@ from airbyte_cdk.models import ConfiguredAirbyteStream, DestinationSyncMode
 from destination_aws_datalake.config_reader import ConnectorConfig, PartitionOptions
 
 from .aws import AwsHandler
+from .background_writer import BackgroundWriter
 
 logger = logging.getLogger("airbyte")
 
+# Values of object and array columns that are written as null, see StreamWriter._clean_message
+INVALID_OBJECT_OR_ARRAY_VALUES = ["", " ", "-", "/", "null"]
+
 
 class StreamWriter:
     def __init__(self, aws_handler: AwsHandler, config: ConnectorConfig, configured_stream: ConfiguredAirbyteStream):
@@ -30,6 +34,11 @@ class StreamWriter:
         self._messages = []
         self._partial_flush_count = 0
 
+        # Derived from the schema once rather than for every record or flush
+        json_schema_types = self._get_json_schema_types()
+        self._object_or_array_columns = [key for key, typ in json_schema_types.items() if typ in ["object", "array"]]
+        self._date_columns = self._get_date_columns()
+
         logger.info(f"Creating StreamWriter for {self._database}:{self._table}")
 
     def _get_date_columns(self) -> list:
@@ -76,51 +85,20 @@ class StreamWriter:
 
         return fields
 
-    def _drop_additional_top_level_properties(self, record: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Helper that removes any unexpected top-level properties from the record.
-        Since the json schema is used to build the table and cast types correctly,
-        we need to remove any unexpected properties that can't be casted accurately.
-        """
-        schema_keys = self._schema.keys()
-        records_keys = record.keys()
-        difference = list(set(records_keys).difference(set(schema_keys)))
-
-        for key in difference:
-            del record[key]
-
-        return record
-
-    def _fix_obvious_type_violations(self, record: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Helper that fixes obvious type violations in a record's top level keys that may
-        cause issues when casting data to pyarrow types. Such as:
-        - Objects having empty strings or " " or "-" as value instead of null or {}
-        - Arrays having empty strings or " " or "-" as value instead of null or []
-        """
-        schema_keys = self._schema.keys()
-        for key in schema_keys:
-            typ = self._schema[key].get("type")
-            typ = self._get_json_schema_type(typ)
-            if typ in ["object", "array"]:
-                if record.get(key) in ["", " ", "-", "/", "null"]:
-                    record[key] = None
-
-        return record
-
-    def _add_missing_columns(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _clean_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Helper that adds missing columns to a record's top level keys. Required
-        for awswrangler to create the correct schema in glue, even with the explicit
-        schema passed in, awswrangler will remove those columns when not present
-        in the dataframe
+        Helper that keeps exactly the top-level properties of the schema in a record:
+        - Unexpected properties are removed since the json schema is used to build the table and cast types correctly,
+          and they can't be casted accurately.
+        - Missing properties are added as null. Required for awswrangler to create the correct schema in glue, even with the
+          explicit schema passed in, awswrangler will remove those columns when not present in the dataframe.
+        - Obvious type violations that may cause issues when casting data to pyarrow types are fixed, such as objects or
+          arrays having empty strings or " " or "-" as value instead of null.
         """
-        schema_keys = self._schema.keys()
-        records_keys = record.keys()
-        difference = list(set(schema_keys).difference(set(records_keys)))
-
-        for key in difference:
-            record[key] = None
+        record = {key: message.get(key) for key in self._schema}
+        for key in self._object_or_array_columns:
+            if record[key] in INVALID_OBJECT_OR_ARRAY_VALUES:
+                record[key] = None
 
         return record
 
@@ -335,10 +313,7 @@ class StreamWriter:
         return self._configured_stream.cursor_field
 
     def append_message(self, message: Dict[str, Any]):
-        clean_message = self._drop_additional_top_level_properties(message)
-        clean_message = self._fix_obvious_type_violations(clean_message)
-        clean_message = self._add_missing_columns(clean_message)
-        self._messages.append(clean_message)
+        self._messages.append(self._clean_message(message))
 
     def reset(self):
         logger.info(f"Deleting table {self._database}:{self._table}")
@@ -348,19 +323,49 @@ class StreamWriter:
             logger.warning(f"Failed to reset table {self._database}:{self._table}")
 
     def flush(self, partial: bool = False):
-        logger.debug(f"Flushing {len(self._messages)} messages to table {self._database}:{self._table}")
+        messages = self._take_messages(partial)
+        if messages:
+            self._write_messages(*messages)
 
-        df = pd.DataFrame(self._messages)
-        # best effort to convert pandas types
-        df = df.astype(self._get_pandas_dtypes_from_json_schema(df), errors="ignore")
+    def flush_in_background(self, background_writer: BackgroundWriter, partial: bool = False):
+        """
+        Hands the buffered records to the background writer so that the next records can be appended while they are written
+        """
+        messages = self._take_messages(partial)
+        if messages:
+            background_writer.submit(lambda: self._write_messages(*messages))
+
+    def _take_messages(self, partial: bool) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        Empties the buffer and decides whether its records overwrite the table, so that the decision follows the order of the
+        flushes even when they are written later
 
-        if len(df) < 1:
+        :return: the buffered records and whether they overwrite the table, or None if there is nothing to write
+        """
+        messages = self._messages
+        if len(messages) < 1:
             logger.info(f"No messages to write to {self._database}:{self._table}")
-            return
+            return None
+
+        self._messages = []
+        overwrite = self._sync_mode == DestinationSyncMode.overwrite and self._partial_flush_count < 1
+        if not overwrite and self._sync_mode != DestinationSyncMode.append and self._partial_flush_count < 1:
+            raise Exception(f"Unsupported sync mode: {self._sync_mode}")
+
+        if partial:
+            self._partial_flush_count += 1
+
+        return messages, overwrite
+
+    def _write_messages(self, messages: List[Dict[str, Any]], overwrite: bool):
+        logger.debug(f"Flushing {len(messages)} messages to table {self._database}:{self._table}")
+
+        df = pd.DataFrame(messages)
+        # best effort to convert pandas types
+        df = df.astype(self._get_pandas_dtypes_from_json_schema(df), errors="ignore")
 
         partition_fields = {}
-        date_columns = self._get_date_columns()
-        for col in date_columns:
+        for col in self._date_columns:
             if col in df.columns:
                 df[col] = pd.to_datetime(df[col])
 
@@ -380,7 +385,7 @@ class StreamWriter:
             if col in df.columns:
                 df[col] = df[col].apply(json.dumps)
 
-        if self._sync_mode == DestinationSyncMode.overwrite and self._partial_flush_count < 1:
+        if overwrite:
             logger.debug(f"Overwriting {len(df)} records to {self._database}:{self._table}")
             self._aws_handler.write(
                 df,
@@ -390,7 +395,7 @@ class StreamWriter:
                 partition_fields,
             )
 
-        elif self._sync_mode == DestinationSyncMode.append or self._partial_flush_count > 0:
+        else:
             logger.debug(f"Appending {len(df)} records to {self._database}:{self._table}")
             self._aws_handler.append(
                 df,
@@ -399,13 +404,3 @@ class StreamWriter:
                 dtype,
                 partition_fields,
             )
-
-        else:
-            self._messages = []
-            raise Exception(f"Unsupported sync mode: {self._sync_mode}")
-
-        if partial:
-            self._partial_flush_count += 1
-
-        del df
-        self._messages.clear()
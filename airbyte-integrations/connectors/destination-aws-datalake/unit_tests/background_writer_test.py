@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+
+import pytest
+from destination_aws_datalake.background_writer import BackgroundWriter
+
+
+def test_flushes_run_in_submission_order():
+    writer = BackgroundWriter(max_pending_flushes=2)
+    written = []
+    for i in range(5):
+        writer.submit(lambda i=i: written.append(i))
+    writer.wait()
+    writer.shutdown()
+
+    assert written == [0, 1, 2, 3, 4]
+
+
+def test_submit_blocks_when_too_many_flushes_are_pending():
+    writer = BackgroundWriter(max_pending_flushes=1)
+    release = threading.Event()
+    writer.submit(release.wait)
+
+    submitted = threading.Event()
+    submitter = threading.Thread(target=lambda: (writer.submit(lambda: None), submitted.set()))
+    submitter.start()
+
+    assert not submitted.wait(timeout=0.2)
+    release.set()
+    assert submitted.wait(timeout=5)
+
+    submitter.join()
+    writer.wait()
+    writer.shutdown()
+
+
+def test_wait_raises_flush_errors():
+    writer = BackgroundWriter(max_pending_flushes=2)
+
+    def failing_flush():
+        raise RuntimeError("write failed")
+
+    writer.submit(failing_flush)
+    with pytest.raises(RuntimeError, match="write failed"):
+        writer.wait()
+    writer.shutdown()
+
+
+def test_needs_at_least_one_pending_flush():
+    with pytest.raises(ValueError):
+        BackgroundWriter(max_pending_flushes=0)
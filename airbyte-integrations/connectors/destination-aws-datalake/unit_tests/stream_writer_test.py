@@ -5,11 +5,13 @@
 import json
 from datetime import datetime
 from typing import Any, Dict, Mapping
+from unittest.mock import MagicMock
 
 import pandas as pd
 from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
 from destination_aws_datalake import DestinationAwsDatalake
 from destination_aws_datalake.aws import AwsHandler
+from destination_aws_datalake.background_writer import BackgroundWriter
 from destination_aws_datalake.config_reader import ConnectorConfig
 from destination_aws_datalake.stream_writer import StreamWriter
 
@@ -215,6 +217,38 @@ def test_append_messsage():
     assert writer._messages[0] == message
 
 
+def test_append_message_keeps_schema_properties_only():
+    writer = get_big_schema_writer(get_config())
+    writer.append_message({"appId": 1, "browser": "-", "unknown_property": "value"})
+
+    record = writer._messages[0]
+    assert list(record.keys()) == list(writer._schema.keys())
+    assert record["appId"] == 1
+    assert record["browser"] is None
+    assert "unknown_property" not in record
+
+
+def test_flush_in_background():
+    connector_config = ConnectorConfig(**get_config())
+    aws_handler = MagicMock()
+    writer = StreamWriter(aws_handler, connector_config, get_configured_stream())
+    background_writer = BackgroundWriter(max_pending_flushes=1)
+
+    writer.append_message({"string_col": "a", "int_col": 1, "datetime_col": "2021-01-01T00:00:00Z", "date_col": "2021-01-01"})
+    writer.flush_in_background(background_writer, partial=True)
+    writer.append_message({"string_col": "b", "int_col": 2, "datetime_col": "2021-01-02T00:00:00Z", "date_col": "2021-01-02"})
+    writer.flush_in_background(background_writer, partial=True)
+    writer.flush_in_background(background_writer, partial=True)
+    background_writer.wait()
+    background_writer.shutdown()
+
+    assert writer._messages == []
+    assert writer._partial_flush_count == 2
+    written = [call.args[0]["string_col"].tolist() for call in aws_handler.append.call_args_list]
+    assert written == [["a"], ["b"]]
+    aws_handler.write.assert_not_called()
+
+
 def test_get_cursor_field():
     writer = get_writer(get_config())
     assert writer._cursor_fields == ["datetime_col"]
@@ -2,18 +2,19 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import csv
 import datetime
 import json
 import os
 import re
+import tempfile
 import uuid
-from collections import defaultdict
 from logging import getLogger
 from typing import Any, Iterable, Mapping
 
 import duckdb
 from airbyte_cdk import AirbyteLogger
-from airbyte_cdk.destinations import Destination
+from airbyte_cdk.destinations import Destination, RecordBuffer
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
 logger = getLogger("airbyte")
@@ -107,23 +108,15 @@ class DestinationDuckdb(Destination):
 
             con.execute(query)
 
-        buffer = defaultdict(list)
+        buffer = RecordBuffer()
+        # DuckDB inserts parameters row by row, so local databases load the rows from a CSV file instead
+        bulk_load = path.startswith("/local")
 
         for message in input_messages:
             if message.type == Type.STATE:
-                # flush the buffer
-                for stream_name in buffer.keys():
-                    logger.info(f"flushing buffer for state: {message}")
-                    table_name = f"_airbyte_raw_{stream_name}"
-                    query = f"""
-                    INSERT INTO {schema_name}.{table_name}
-                      (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
-                    VALUES (?,?,?)
-                    """
-                    con.executemany(query, buffer[stream_name])
-
-                con.commit()
-                buffer = defaultdict(list)
+                # every record received before the state message is persisted before the state message is released
+                logger.info(f"flushing buffer for state: {message}")
+                self._flush(con, schema_name, buffer, bulk_load)
 
                 yield message
             elif message.type == Type.RECORD:
@@ -134,26 +127,41 @@ class DestinationDuckdb(Destination):
                     continue
 
                 # add to buffer
-                buffer[stream].append(
+                buffer.add(
+                    stream,
                     (
                         str(uuid.uuid4()),
                         datetime.datetime.now().isoformat(),
                         json.dumps(data),
-                    )
+                    ),
                 )
+                if buffer.is_full:
+                    self._flush(con, schema_name, buffer, bulk_load)
             else:
                 logger.info(f"Message type {message.type} not supported, skipping")
 
         # flush any remaining messages
-        for stream_name in buffer.keys():
-            table_name = f"_airbyte_raw_{stream_name}"
-            query = f"""
-            INSERT INTO {schema_name}.{table_name}
-            VALUES (?,?,?)
-            """
+        self._flush(con, schema_name, buffer, bulk_load)
 
-            con.executemany(query, buffer[stream_name])
-            con.commit()
+    @staticmethod
+    def _flush(con: duckdb.DuckDBPyConnection, schema_name: str, buffer: RecordBuffer, bulk_load: bool) -> None:
+        for stream_name, rows in buffer.pop_all().items():
+            table_name = f"_airbyte_raw_{stream_name}"
+            if bulk_load:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    rows_path = os.path.join(temp_dir, "rows.csv")
+                    with open(rows_path, "w", newline="", encoding="utf-8") as rows_file:
+                        csv.writer(rows_file).writerows(rows)
+                    con.execute(f"COPY {schema_name}.{table_name} FROM '{rows_path}' (FORMAT CSV, HEADER FALSE, QUOTE '\"', ESCAPE '\"')")
+            else:
+                query = f"""
+                INSERT INTO {schema_name}.{table_name}
+                  (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
+                VALUES (?,?,?)
+                """
+                con.executemany(query, rows)
+
+        con.commit()
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
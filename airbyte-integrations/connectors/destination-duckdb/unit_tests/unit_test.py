@@ -2,7 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
+import json
+
+import duckdb
 import pytest
+from airbyte_cdk.destinations import RecordBuffer
 from destination_duckdb.destination import DestinationDuckdb, validated_sql_name
 
 
@@ -34,3 +39,21 @@ def test_validated_sql_name(input, expected):
             validated_sql_name(input)
     else:
         assert validated_sql_name(input) == expected
+
+
+@pytest.mark.parametrize("bulk_load", [True, False])
+def test_flush_inserts_buffered_rows(bulk_load):
+    con = duckdb.connect(":memory:")
+    con.execute("CREATE TABLE main._airbyte_raw_stream (_airbyte_ab_id TEXT PRIMARY KEY, _airbyte_emitted_at DATETIME, _airbyte_data JSON)")
+    data = json.dumps({"quote": 'a "quoted", value', "newline": "a\nb", "unicode": "é"})
+    buffer = RecordBuffer()
+    buffer.add("stream", ("id_1", "2023-01-01T00:00:00.123456", data))
+    buffer.add("stream", ("id_2", "2023-01-01T00:00:01", "{}"))
+
+    DestinationDuckdb._flush(con, "main", buffer, bulk_load)
+
+    assert con.execute("SELECT * FROM main._airbyte_raw_stream ORDER BY _airbyte_ab_id").fetchall() == [
+        ("id_1", datetime.datetime(2023, 1, 1, 0, 0, 0, 123456), data),
+        ("id_2", datetime.datetime(2023, 1, 1, 0, 0, 1), "{}"),
+    ]
+    assert buffer.pop_all() == {}
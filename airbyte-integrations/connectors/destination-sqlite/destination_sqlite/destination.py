@@ -8,11 +8,10 @@ import os
 import sqlite3
 import uuid
 from asyncio.log import logger
-from collections import defaultdict
 from typing import Any, Iterable, Mapping
 
 from airbyte_cdk import AirbyteLogger
-from airbyte_cdk.destinations import Destination
+from airbyte_cdk.destinations import Destination, RecordBuffer
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
 
@@ -81,25 +80,12 @@ class DestinationSqlite(Destination):
                 )
                 con.execute(query)
 
-            buffer = defaultdict(list)
+            buffer = RecordBuffer()
 
             for message in input_messages:
                 if message.type == Type.STATE:
-                    # flush the buffer
-                    for stream_name in buffer.keys():
-
-                        query = """
-                        INSERT INTO {table_name}
-                        VALUES (?,?,?)
-                        """.format(
-                            table_name=f"_airbyte_raw_{stream_name}"
-                        )
-
-                        con.executemany(query, buffer[stream_name])
-
-                    con.commit()
-                    buffer = defaultdict(list)
-
+                    # every record received before the state message is persisted before the state message is released
+                    self._flush(con, buffer)
                     yield message
                 elif message.type == Type.RECORD:
                     data = message.record.data
@@ -109,21 +95,26 @@ class DestinationSqlite(Destination):
                         continue
 
                     # add to buffer
-                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
+                    buffer.add(stream, (str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
+                    if buffer.is_full:
+                        self._flush(con, buffer)
 
             # flush any remaining messages
-            for stream_name in buffer.keys():
+            self._flush(con, buffer)
 
-                query = """
-                INSERT INTO {table_name}
-                VALUES (?,?,?)
-                """.format(
-                    table_name=f"_airbyte_raw_{stream_name}"
-                )
+    @staticmethod
+    def _flush(con: sqlite3.Connection, buffer: RecordBuffer) -> None:
+        for stream_name, rows in buffer.pop_all().items():
+            query = """
+            INSERT INTO {table_name}
+            VALUES (?,?,?)
+            """.format(
+                table_name=f"_airbyte_raw_{stream_name}"
+            )
 
-                con.executemany(query, buffer[stream_name])
+            con.executemany(query, rows)
 
-            con.commit()
+        con.commit()
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -2,7 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import sqlite3
+
 import pytest
+from airbyte_cdk.destinations import RecordBuffer
 from destination_sqlite import DestinationSqlite
 
 
@@ -22,3 +25,15 @@ def test_get_destination_path():
     invalid_input = "/sqlite.db"
     with pytest.raises(ValueError):
         _ = DestinationSqlite._get_destination_path(invalid_input)
+
+
+def test_flush_inserts_buffered_rows():
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE _airbyte_raw_stream (_airbyte_ab_id TEXT PRIMARY KEY, _airbyte_emitted_at TEXT, _airbyte_data TEXT)")
+    buffer = RecordBuffer()
+    buffer.add("stream", ("id_1", "2023-01-01T00:00:00", '{"a": 1}'))
+
+    DestinationSqlite._flush(con, buffer)
+
+    assert con.execute("SELECT * FROM _airbyte_raw_stream").fetchall() == [("id_1", "2023-01-01T00:00:00", '{"a": 1}')]
+    assert buffer.pop_all() == {}
@@ -6,11 +6,10 @@
 import json
 import logging
 import sys
-import tempfile
 import traceback
 import urllib
 from os import environ
-from typing import Iterable
+from typing import IO, Iterable
 from urllib.parse import urlparse
 from zipfile import BadZipFile
 
@@ -20,7 +19,9 @@ import botocore
 import google
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import smart_open
+import smart_open.compression
 import smart_open.ssh
 from airbyte_cdk.entrypoint import logger
 from airbyte_cdk.models import AirbyteStream, FailureType, SyncMode
@@ -33,10 +34,12 @@ from openpyxl import load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
 from pandas.errors import ParserError
 from paramiko import SSHException
+from pyarrow import feather, ipc, orc, parquet
 from urllib3.exceptions import ProtocolError
 from yaml import safe_load
 
-from .utils import LOCAL_STORAGE_NAME, backoff_handler
+from .download import download
+from .utils import LOCAL_STORAGE_NAME, backoff_handler, iter_json_items
 
 SSH_TIMEOUT = 60
 
@@ -67,6 +70,9 @@ class URLFile:
     ```
     """
 
+    # storages whose files can be read from any offset, which allows downloading them with concurrent range requests
+    range_request_storages = {"s3://", "gs://", "azure://", "https://"}
+
     def __init__(self, url: str, provider: dict, binary=None, encoding=None):
         self._url = url
         self._provider = provider
@@ -110,6 +116,23 @@ class URLFile:
             raise FileNotFoundError(self.url) from err
         return self
 
+    @property
+    def supports_range_requests(self) -> bool:
+        # compressed files are decompressed while they are read, seeking in them means decompressing everything before
+        compressed = self.url.lower().endswith(tuple(smart_open.compression.get_supported_extensions()))
+        return self.args["mode"] == "rb" and self.storage_scheme in self.range_request_storages and not compressed
+
+    def download(self, fp: IO[bytes]) -> IO[bytes]:
+        """Copy the opened binary file to the local spill cache of the process
+        :return: the local copy of the file, opened for reading
+        """
+        return download(fp, self.full_url, open_at=self._open_at if self.supports_range_requests else None)
+
+    def _open_at(self, offset: int) -> IO[bytes]:
+        fp = self._open()
+        fp.seek(offset)
+        return fp
+
     def _open(self):
         storage = self.storage_scheme
         url = self.url
@@ -252,7 +275,10 @@ class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
+    ARROW_BATCH_SIZE = 10_000
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
+    # formats read one record batch (row group, stripe) at a time with pyarrow instead of loading the whole file with pandas
+    arrow_formats = {"feather", "parquet", "orc"}
 
     def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: dict = None):
         self._dataset_name = dataset_name
@@ -279,11 +305,8 @@ class Client:
     def load_nested_json_schema(self, fp) -> dict:
         # Use Genson Library to take JSON objects and generate schemas that describe them,
         builder = SchemaBuilder()
-        if self._reader_format == "jsonl":
-            for o in self.read():
-                builder.add_object(o)
-        else:
-            builder.add_object(json.load(fp))
+        for o in self.load_nested_json(fp):
+            builder.add_object(o)
 
         result = builder.to_schema()
         if "items" in result:
@@ -293,18 +316,57 @@ class Client:
         result["$schema"] = "http://json-schema.org/draft-07/schema#"
         return result
 
-    def load_nested_json(self, fp) -> list:
+    def load_nested_json(self, fp) -> Iterable:
+        """Lazily read the records of a JSON or JSONL file, only one record is held in memory at a time"""
         if self._reader_format == "jsonl":
-            result = []
-            line = fp.readline()
-            while line:
-                result.append(json.loads(line))
-                line = fp.readline()
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line)
         else:
-            result = json.load(fp)
-            if not isinstance(result, list):
-                result = [result]
-        return result
+            yield from iter_json_items(fp, encoding=self.encoding)
+
+    @property
+    def reads_arrow_batches(self) -> bool:
+        # reader options are pandas arguments, files configured with them keep being read with pandas
+        return self._reader_format in self.arrow_formats and not self._reader_options
+
+    def load_arrow_batches(self, fp, fields: Iterable = None) -> Iterable[pa.RecordBatch]:
+        """Read a feather, parquet or orc file one record batch at a time.
+
+        :param fp: seekable binary file-like object to read from
+        :param fields: names of the columns to read, all the columns are read if not set
+        :return: record batches of at most one row group (parquet), stripe (orc) or record batch (feather)
+        """
+        if self._reader_format == "parquet":
+            parquet_file = parquet.ParquetFile(fp)
+            columns = self._arrow_columns(parquet_file.schema_arrow, fields)
+            yield from parquet_file.iter_batches(batch_size=self.ARROW_BATCH_SIZE, columns=columns)
+        elif self._reader_format == "orc":
+            orc_file = orc.ORCFile(fp)
+            columns = self._arrow_columns(orc_file.schema, fields)
+            for stripe in range(orc_file.nstripes):
+                yield orc_file.read_stripe(stripe, columns=columns)
+        else:
+            try:
+                feather_file = ipc.open_file(fp)
+                schema = feather_file.schema
+                batches = (feather_file.get_batch(i) for i in range(feather_file.num_record_batches))
+            except pa.ArrowInvalid:
+                # feather V1 files are not Arrow IPC files and can only be read as a whole
+                fp.seek(0)
+                table = feather.read_table(fp)
+                schema, batches = table.schema, table.to_batches(max_chunksize=self.ARROW_BATCH_SIZE)
+            columns = self._arrow_columns(schema, fields)
+            for batch in batches:
+                yield pa.RecordBatch.from_arrays([batch.column(name) for name in columns], names=columns)
+
+    @staticmethod
+    def _arrow_columns(schema: pa.Schema, fields: Iterable = None) -> list:
+        """Columns to read from a file written by pyarrow, without the index columns pandas stores next to the data"""
+        pandas_metadata = schema.pandas_metadata or {}
+        index_columns = {column for column in pandas_metadata.get("index_columns", []) if isinstance(column, str)}
+        fields = set(fields) if fields else None
+        return [name for name in schema.names if name not in index_columns and (fields is None or name in fields)]
 
     def load_yaml(self, fp):
         if self._reader_format == "yaml":
@@ -363,6 +425,9 @@ class Client:
                     yield from self.openpyxl_chunk_reader(fp, **reader_options)
                 except (InvalidFileException, BadZipFile):
                     yield reader(fp, **reader_options)
+            elif self.reads_arrow_batches:
+                for batch in self.load_arrow_batches(fp):
+                    yield batch.to_pandas()
             else:
                 yield reader(fp, **reader_options)
         except ParserError as err:
@@ -420,10 +485,14 @@ class Client:
                     fields = set(fields) if fields else None
                     if self.binary_source:
                         fp = self._cache_stream(fp)
-                    for df in self.load_dataframes(fp):
-                        columns = fields.intersection(set(df.columns)) if fields else df.columns
-                        df.replace({np.nan: None}, inplace=True)
-                        yield from df[list(columns)].to_dict(orient="records")
+                    if self.reads_arrow_batches:
+                        for batch in self.load_arrow_batches(fp, fields):
+                            yield from batch.to_pylist()
+                    else:
+                        for df in self.load_dataframes(fp):
+                            columns = fields.intersection(set(df.columns)) if fields else df.columns
+                            df.replace({np.nan: None}, inplace=True)
+                            yield from df[list(columns)].to_dict(orient="records")
             except ConnectionResetError:
                 logger.info(f"Catched `connection reset error - 104`, stream: {self.stream_name} ({self.reader.full_url})")
                 raise ConnectionResetError
@@ -435,12 +504,8 @@ class Client:
                 raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
 
     def _cache_stream(self, fp):
-        """cache stream to file"""
-        fp_tmp = tempfile.TemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
-        fp_tmp.seek(0)
-        fp.close()
-        return fp_tmp
+        """cache stream to a local file, shared by the passes of this process over the same file"""
+        return self.reader.download(fp)
 
     def _stream_properties(self, fp, empty_schema: bool = False, read_sample_chunk: bool = False):
         """
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Optional
+
+from .utils import logger
+
+# Files bigger than this are downloaded in parts of this size, each one with its own range request
+DOWNLOAD_PART_SIZE = 16 * 1024 * 1024
+MAX_DOWNLOAD_WORKERS = 4
+# Number of times the download of a part is resumed after a connection reset before giving up
+MAX_RESUME_ATTEMPTS = 5
+COPY_BUFFER_SIZE = 1024 * 1024
+
+_cache_directory = None
+
+
+def _get_cache_directory() -> str:
+    """The spill cache lives as long as the process, so that every pass over a file reads the same copy"""
+    global _cache_directory
+    if _cache_directory is None:
+        _cache_directory = tempfile.mkdtemp(prefix="source-file-cache-")
+        atexit.register(shutil.rmtree, _cache_directory, ignore_errors=True)
+    return _cache_directory
+
+
+def _get_size(fp: IO[bytes]) -> Optional[int]:
+    if not fp.seekable():
+        return None
+    try:
+        size = fp.seek(0, os.SEEK_END)
+        fp.seek(0)
+    except (OSError, ValueError):
+        return None
+    return size
+
+
+def download(fp: IO[bytes], url: str, open_at: Optional[Callable[[int], IO[bytes]]] = None) -> IO[bytes]:
+    """Copy a binary file to the local spill cache and return the local copy opened for reading.
+
+    The copy is keyed by the url and the size of the file, a file already copied by this process is not downloaded again.
+
+    :param fp: the file to copy, opened at its start
+    :param url: the url of the file
+    :param open_at: opens the file again at the given offset. When set, big files are downloaded in parts with concurrent
+        range requests, and a part interrupted by a connection reset is resumed where it stopped instead of starting over
+    :return: the local copy of the file
+    """
+    size = _get_size(fp)
+    if size is None:
+        # without a size the file can't be identified, it is copied to an anonymous file
+        fp_tmp = tempfile.TemporaryFile(mode="w+b")
+        shutil.copyfileobj(fp, fp_tmp, COPY_BUFFER_SIZE)
+        fp_tmp.seek(0)
+        fp.close()
+        return fp_tmp
+
+    path = os.path.join(_get_cache_directory(), hashlib.sha256(f"{url}:{size}".encode()).hexdigest())
+    if os.path.exists(path):
+        logger.info(f"Reading the cached copy of {url}")
+        return open(path, "rb")
+
+    fd, part_path = tempfile.mkstemp(dir=_get_cache_directory(), suffix=".part")
+    try:
+        if open_at and size > DOWNLOAD_PART_SIZE:
+            os.ftruncate(fd, size)
+            ranges = [(start, min(start + DOWNLOAD_PART_SIZE, size)) for start in range(0, size, DOWNLOAD_PART_SIZE)]
+            logger.info(f"Downloading {url} ({size} bytes) in {len(ranges)} parts")
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS, thread_name_prefix="download") as executor:
+                # list() raises the first error of the parts
+                list(executor.map(lambda byte_range: _download_range(fd, open_at, *byte_range), ranges))
+        else:
+            # the size is not trusted here: some servers don't send a content length, the file is read to its end
+            _download_range(fd, open_at, 0, None, fp=fp)
+    except BaseException:
+        os.close(fd)
+        os.remove(part_path)
+        raise
+    os.close(fd)
+    os.replace(part_path, path)
+    return open(path, "rb")
+
+
+def _download_range(
+    fd: int, open_at: Optional[Callable[[int], IO[bytes]]], start: int, end: Optional[int], fp: Optional[IO[bytes]] = None
+) -> None:
+    """Write the bytes of the file from start to end (or to the end of the file) at the same position of the local file"""
+    position, resume_attempts = start, 0
+    while True:
+        if fp is None:
+            fp = open_at(position)
+        try:
+            while end is None or position < end:
+                chunk = fp.read(COPY_BUFFER_SIZE if end is None else min(COPY_BUFFER_SIZE, end - position))
+                if not chunk:
+                    if end is None:
+                        return
+                    raise ConnectionResetError(f"The connection was closed at byte {position} before the end of the range")
+                os.pwrite(fd, chunk, position)
+                position += len(chunk)
+            return
+        except ConnectionResetError:
+            resume_attempts += 1
+            if not open_at or resume_attempts > MAX_RESUME_ATTEMPTS:
+                raise
+            logger.info(f"Connection reset while downloading, resuming at byte {position} (attempt {resume_attempts})")
+        finally:
+            fp.close()
+        fp = None
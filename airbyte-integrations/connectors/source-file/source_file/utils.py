@@ -2,7 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
+import json
 import logging
+import re
+import sys
+from typing import IO, Any, Iterator
 from urllib.parse import parse_qs, urlencode, urlparse
 
 # default logger
@@ -10,6 +15,12 @@ logger = logging.getLogger("airbyte")
 
 LOCAL_STORAGE_NAME = "local"
 
+# Size of the chunks read from JSON files, only one chunk and one record are held in memory at a time
+JSON_READ_CHUNK_SIZE = 1024 * 1024
+
+_NON_WHITESPACE = re.compile(r"\S")
+_ITEM_DELIMITERS = {",", "]", " ", "\t", "\n", "\r"}
+
 
 def dropbox_force_download(url):
     """
@@ -26,3 +37,79 @@ def dropbox_force_download(url):
 
 def backoff_handler(details):
     logger.info(f"Caught retryable error after {details['tries']} tries. Waiting {details['wait']} seconds then retrying...")
+
+
+def iter_json_items(fp: IO, encoding: str = None, chunk_size: int = JSON_READ_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Lazily parse a JSON document read from a text or binary file.
+    The items of a top-level array are yielded one at a time without loading the whole array,
+    any other document is yielded as a single item.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding or "utf-8")()
+    buffer, position, eof = "", 0, False
+
+    def read_more(min_length: int = 0):
+        """Read at least one chunk and until min_length characters are left to parse"""
+        nonlocal buffer, position, eof
+        # drop what was already parsed so that the buffer does not grow with the file
+        parts = [buffer[position:]]
+        length = len(parts[0])
+        while not eof:
+            chunk = fp.read(chunk_size)
+            eof = not chunk
+            if isinstance(chunk, bytes):
+                chunk = text_decoder.decode(chunk, final=eof)
+            parts.append(chunk)
+            length += len(chunk)
+            if length >= min_length:
+                break
+        buffer, position = "".join(parts), 0
+
+    def next_char() -> str:
+        nonlocal position
+        while True:
+            match = _NON_WHITESPACE.search(buffer, position)
+            if match:
+                position = match.start()
+                return buffer[position]
+            if eof:
+                return ""
+            position = len(buffer)
+            read_more()
+
+    def decode_item() -> Any:
+        nonlocal position
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                # an item not followed by a delimiter may be truncated, e.g. a number split between two chunks
+                if eof or buffer[end : end + 1] in _ITEM_DELIMITERS:
+                    position = end
+                    return item
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            # the text left to parse doubles so that an item spanning many chunks is only parsed a few times
+            read_more(2 * (len(buffer) - position))
+
+    if next_char() != "[":
+        read_more(sys.maxsize)
+        yield json.loads(buffer)
+        return
+
+    position += 1
+    if next_char() != "]":
+        while True:
+            next_char()
+            yield decode_item()
+            char = next_char()
+            if char == "]":
+                break
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+    position += 1
+    # like json.loads, only whitespace can follow the document
+    if next_char():
+        raise json.JSONDecodeError("Extra data", buffer, position)
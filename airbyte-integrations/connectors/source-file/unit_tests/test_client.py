@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-
+import io
+import json
 from unittest.mock import patch, sentinel
 
 import pytest
@@ -10,6 +11,7 @@ from airbyte_cdk.utils import AirbyteTracedException
 from pandas import read_csv, read_excel
 from paramiko import SSHException
 from source_file.client import Client, URLFile
+from source_file.utils import iter_json_items
 from urllib3.exceptions import ProtocolError
 
 
@@ -86,6 +88,85 @@ def test_load_nested_json(client, absolute_path, test_files):
         assert client.load_nested_json(fp=file)
 
 
+@pytest.mark.parametrize(
+    "document, expected_items",
+    [
+        pytest.param('[{"a": 1}, {"a": 2}]', [{"a": 1}, {"a": 2}], id="test_array"),
+        pytest.param('\n[\n  {"a": "é"} ,\n  {"b": [1.5e3, null, "]"]}\n]\n', [{"a": "é"}, {"b": [1.5e3, None, "]"]}], id="test_indented_array"),
+        pytest.param("[12345, -0.5e10]", [12345, -0.5e10], id="test_numbers_split_between_chunks"),
+        pytest.param("[]", [], id="test_empty_array"),
+        pytest.param('{"a": [1, 2]}', [{"a": [1, 2]}], id="test_object"),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_iter_json_items(document, expected_items, chunk_size):
+    assert list(iter_json_items(io.StringIO(document), chunk_size=chunk_size)) == expected_items
+    assert list(iter_json_items(io.BytesIO(document.encode()), chunk_size=chunk_size)) == expected_items
+
+
+@pytest.mark.parametrize("document", ["[1 2]", "[1,", '[{"a": 1},]', "[1, 2] 3", "[] []", '{"a": 1} {"b": 2}'])
+def test_iter_json_items_invalid_document(document):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(io.StringIO(document), chunk_size=2))
+
+
+def test_iter_json_items_reads_an_item_spanning_many_chunks_a_few_times():
+    item = {"text": "a" * 100_000}
+    raw_decode = json.JSONDecoder.raw_decode
+    with patch.object(json.JSONDecoder, "raw_decode", autospec=True, side_effect=raw_decode) as raw_decode_spy:
+        assert list(iter_json_items(io.StringIO(json.dumps([item, item])), chunk_size=10)) == [item, item]
+    # an incomplete item is parsed again once the text left to parse doubled instead of after every chunk
+    assert raw_decode_spy.call_count < 50
+
+
+def test_load_nested_json_is_lazy(config):
+    client = Client(**config)
+    fp = io.StringIO("[" + ", ".join(json.dumps({"id": i}) for i in range(100_000)) + "]")
+    records = client.load_nested_json(fp)
+    assert next(records) == {"id": 0}
+    assert fp.tell() < len(fp.getvalue())
+
+
+def test_load_nested_jsonl(config):
+    config["format"] = "jsonl"
+    client = Client(**config)
+    fp = io.StringIO('{"id": 1}\n\n{"id": 2}\n')
+    assert list(client.load_nested_json(fp)) == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize(
+    "file_format, file_name",
+    [
+        ("parquet", "parquet/demo.parquet"),
+        ("parquet", "parquet/demo1.parquet"),
+        ("feather", "feather/demo.feather"),
+        ("orc", "orc/demo1.orc"),
+    ],
+)
+def test_read_arrow_formats(absolute_path, test_files, file_format, file_name):
+    url = f"{absolute_path}/{test_files}/formats/{file_name}"
+    client = Client(dataset_name="test", url=url, provider={"storage": "local"}, format=file_format)
+    # reader options make the client read the file with pandas
+    pandas_client = Client(dataset_name="test", url=url, provider={"storage": "local"}, format=file_format, reader_options={"columns": None})
+
+    records = list(client.read())
+    assert records
+    assert [{key: str(value) for key, value in record.items()} for record in records] == [
+        {key: str(value) for key, value in record.items()} for record in pandas_client.read()
+    ]
+
+    with open(url, mode="rb") as fp:
+        properties = client._stream_properties(fp)
+    with open(url, mode="rb") as fp:
+        assert properties == pandas_client._stream_properties(fp)
+
+
+def test_read_arrow_formats_selected_fields(absolute_path, test_files):
+    url = f"{absolute_path}/{test_files}/formats/parquet/demo.parquet"
+    client = Client(dataset_name="test", url=url, provider={"storage": "local"}, format="parquet")
+    assert list(client.read(fields=["a", "b"])) == [{"a": "a", "b": 1}, {"a": "b", "b": 2}, {"a": "c", "b": 3}]
+
+
 @pytest.mark.parametrize(
     "current_type, dtype, expected",
     [
@@ -103,10 +184,30 @@ def test_dtype_to_json_type(client, current_type, dtype, expected):
     assert client.dtype_to_json_type(current_type, dtype) == expected
 
 
-def test_cache_stream(client, absolute_path, test_files):
+def test_cache_stream(absolute_path, test_files):
     f = f"{absolute_path}/{test_files}/test.csv"
+    client = Client(dataset_name="test_dataset", url=f, provider={"storage": "local"}, format="csv")
     with open(f, mode="rb") as file:
-        assert client._cache_stream(file)
+        content = file.read()
+        file.seek(0)
+        with client._cache_stream(file) as cached_file:
+            assert cached_file.read() == content
+
+
+@pytest.mark.parametrize(
+    "url, provider, expected",
+    [
+        ("s3://bucket/file.parquet", {"storage": "S3"}, True),
+        ("gs://bucket/file.xlsx", {"storage": "GCS"}, True),
+        ("https://example.com/file.orc", {"storage": "HTTPS"}, True),
+        ("https://example.com/file.pkl.gz", {"storage": "HTTPS"}, False),
+        ("/tmp/file.parquet", {"storage": "local"}, False),
+        ("sftp://host/file.parquet", {"storage": "SFTP"}, False),
+    ],
+)
+def test_urlfile_supports_range_requests(url, provider, expected):
+    assert URLFile(url=url, provider=provider, binary=True).supports_range_requests == expected
+    assert not URLFile(url=url, provider=provider, binary=False).supports_range_requests
 
 
 def test_open_aws_url():
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import os
+
+import pytest
+from source_file import download as download_module
+from source_file.download import download
+
+CONTENT = bytes(range(256)) * 4
+
+
+class ResettingFile(io.BytesIO):
+    """A remote file whose connection is reset after reading `reset_after` bytes"""
+
+    def __init__(self, content: bytes, reset_after: int = None):
+        super().__init__(content)
+        self._reset_after = reset_after
+
+    def read(self, size=-1):
+        if self._reset_after is not None and self.tell() >= self._reset_after:
+            raise ConnectionResetError("Connection reset by peer")
+        if self._reset_after is not None and size > 0:
+            size = min(size, self._reset_after - self.tell())
+        return super().read(size)
+
+
+@pytest.fixture
+def small_parts(monkeypatch, tmp_path):
+    monkeypatch.setattr(download_module, "DOWNLOAD_PART_SIZE", 100)
+    monkeypatch.setattr(download_module, "COPY_BUFFER_SIZE", 30)
+    monkeypatch.setattr(download_module, "_cache_directory", str(tmp_path))
+
+
+def test_download_in_parts(small_parts, tmp_path):
+    offsets = []
+
+    def open_at(offset):
+        offsets.append(offset)
+        fp = ResettingFile(CONTENT)
+        fp.seek(offset)
+        return fp
+
+    with download(io.BytesIO(CONTENT), "https://example.com/file.parquet", open_at) as fp:
+        assert fp.read() == CONTENT
+    assert sorted(offsets) == list(range(0, len(CONTENT), 100))
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+
+
+def test_download_reuses_the_cached_copy(small_parts):
+    with download(io.BytesIO(CONTENT), "https://example.com/file.parquet") as fp:
+        assert fp.read() == CONTENT
+
+    def open_at(offset):
+        raise AssertionError("the file should not be downloaded again")
+
+    with download(io.BytesIO(CONTENT), "https://example.com/file.parquet", open_at) as fp:
+        assert fp.read() == CONTENT
+
+
+def test_download_resumes_after_connection_reset(small_parts):
+    offsets = []
+
+    def open_at(offset):
+        offsets.append(offset)
+        # every connection is reset after 70 bytes
+        fp = ResettingFile(CONTENT, reset_after=offset + 70)
+        fp.seek(offset)
+        return fp
+
+    with download(ResettingFile(CONTENT, reset_after=70), "https://example.com/file.parquet", open_at) as fp:
+        assert fp.read() == CONTENT
+    assert 70 in offsets
+
+
+def test_download_gives_up_after_too_many_connection_resets(small_parts, tmp_path):
+    def open_at(offset):
+        fp = ResettingFile(CONTENT, reset_after=offset)
+        fp.seek(offset)
+        return fp
+
+    with pytest.raises(ConnectionResetError):
+        download(io.BytesIO(CONTENT), "https://example.com/file.parquet", open_at)
+    assert os.listdir(tmp_path) == []
+
+
+def test_download_not_seekable_file(small_parts):
+    fp = io.BytesIO(CONTENT)
+    fp.seekable = lambda: False
+
+    with download(fp, "https://example.com/file.parquet") as cached_fp:
+        assert cached_fp.read() == CONTENT
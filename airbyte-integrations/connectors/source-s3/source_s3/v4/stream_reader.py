@@ -3,9 +3,11 @@
 #
 
 import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from io import IOBase
-from typing import Iterable, List, Optional, Set
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import boto3.session
 import pytz
@@ -17,6 +19,12 @@ from botocore.client import BaseClient
 from botocore.client import Config as ClientConfig
 from source_s3.v4.config import Config
 
+# Maximum number of pages of objects requested from S3 at the same time.
+# It also bounds the listing's memory, since pages (of at most 1000 objects each) are only requested while fewer are pending.
+MAX_CONCURRENT_LIST_REQUESTS = 8
+# Common prefixes are the "directories" right under a listed prefix, each one is listed as a separate shard
+PREFIX_DELIMITER = "/"
+
 
 class SourceS3StreamReader(AbstractFileBasedStreamReader):
     def __init__(self):
@@ -59,25 +67,30 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
 
     def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
         """
-        Get all files matching the specified glob patterns.
+        Get all files matching the specified glob patterns and modified after the start date.
+
+        The files are listed concurrently: every prefix is split into shards by its common prefixes, and the
+        shards are listed in parallel. Files are filtered as their pages are received, then yielded sorted by key
+        once the listing is complete, so that the order does not depend on which shard was listed first.
         """
         s3 = self.s3_client
         prefixes = [prefix] if prefix else self.get_prefixes_from_globs(globs)
-        seen = set()
         total_n_keys = 0
 
+        def count_keys(remote_files: Iterable[RemoteFile]) -> Iterable[RemoteFile]:
+            nonlocal total_n_keys
+            for remote_file in remote_files:
+                total_n_keys += 1
+                yield remote_file
+
         try:
-            if prefixes:
-                for prefix in prefixes:
-                    for remote_file in self._page(s3, globs, self.config.bucket, prefix, seen, logger):
-                        total_n_keys += 1
-                        yield remote_file
-            else:
-                for remote_file in self._page(s3, globs, self.config.bucket, None, seen, logger):
-                    total_n_keys += 1
-                    yield remote_file
-
-            logger.info(f"Finished listing objects from S3. Found {total_n_keys} objects total ({len(seen)} unique objects).")
+            remote_files = count_keys(self._list_objects(s3, self.config.bucket, list(prefixes) or [None], logger))
+            matching_files = sorted(self.filter_files_by_globs_and_start_date(remote_files, globs), key=lambda remote_file: remote_file.uri)
+            yield from matching_files
+
+            logger.info(
+                f"Finished listing objects from S3. Found {total_n_keys} objects total ({len(matching_files)} unique matching objects)."
+            )
         except Exception as exc:
             raise ErrorListingFiles(
                 FileBasedSourceError.ERROR_LISTING_FILES,
@@ -112,36 +125,65 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
     def _is_folder(file) -> bool:
         return file["Key"].endswith("/")
 
-    def _page(
-        self, s3: BaseClient, globs: List[str], bucket: str, prefix: Optional[str], seen: Set[str], logger: logging.Logger
-    ) -> Iterable[RemoteFile]:
+    def _list_objects(self, s3: BaseClient, bucket: str, prefixes: List[Optional[str]], logger: logging.Logger) -> Iterable[RemoteFile]:
         """
-        Page through lists of S3 objects.
+        List the objects under the prefixes, with at most MAX_CONCURRENT_LIST_REQUESTS requests in flight.
+
+        The prefixes are listed with a delimiter: their pages hold the objects right under them and their common prefixes.
+        Each common prefix is a shard, listed in full without a delimiter alongside the other shards.
         """
-        total_n_keys_for_prefix = 0
+        shards: Deque[Tuple[Optional[str], Optional[str]]] = deque((prefix, PREFIX_DELIMITER) for prefix in prefixes)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LIST_REQUESTS, thread_name_prefix="s3_listing") as executor:
+            pending: Dict[Future, Tuple[Optional[str], Optional[str]]] = {}
+            try:
+                while shards or pending:
+                    while shards and len(pending) < MAX_CONCURRENT_LIST_REQUESTS:
+                        shard_prefix, delimiter = shards.popleft()
+                        pending[executor.submit(self._list_page, s3, bucket, shard_prefix, delimiter, None, logger)] = (shard_prefix, delimiter)
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        shard_prefix, delimiter = pending.pop(future)
+                        response = future.result()
+                        shards.extend((common_prefix["Prefix"], None) for common_prefix in response.get("CommonPrefixes", []))
+                        if next_token := response.get("NextContinuationToken"):
+                            next_page = executor.submit(self._list_page, s3, bucket, shard_prefix, delimiter, next_token, logger)
+                            pending[next_page] = (shard_prefix, delimiter)
+                        else:
+                            logger.info(f"Finished listing objects from S3 for prefix={shard_prefix}.")
+                        yield from self._get_remote_files(response)
+            finally:
+                # the listing may be stopped before the end, pages that were not requested yet are not needed anymore
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _list_page(
+        s3: BaseClient,
+        bucket: str,
+        prefix: Optional[str],
+        delimiter: Optional[str],
+        continuation_token: Optional[str],
+        logger: logging.Logger,
+    ) -> Mapping[str, Any]:
         kwargs = {"Bucket": bucket}
-        while True:
-            response = s3.list_objects_v2(Prefix=prefix, **kwargs) if prefix else s3.list_objects_v2(**kwargs)
-            key_count = response.get("KeyCount")
-            total_n_keys_for_prefix += key_count
-            logger.info(f"Received {key_count} objects from S3 for prefix '{prefix}'.")
-
-            if "Contents" in response:
-                for file in response["Contents"]:
-                    if self._is_folder(file):
-                        continue
-                    remote_file = RemoteFile(uri=file["Key"], last_modified=file["LastModified"].astimezone(pytz.utc).replace(tzinfo=None))
-                    if self.file_matches_globs(remote_file, globs) and remote_file.uri not in seen:
-                        seen.add(remote_file.uri)
-                        yield remote_file
-            else:
-                logger.warning(f"Invalid response from S3; missing 'Contents' key. kwargs={kwargs}.")
-
-            if next_token := response.get("NextContinuationToken"):
-                kwargs["ContinuationToken"] = next_token
-            else:
-                logger.info(f"Finished listing objects from S3 for prefix={prefix}. Found {total_n_keys_for_prefix} objects.")
-                break
+        if prefix:
+            kwargs["Prefix"] = prefix
+        if delimiter:
+            kwargs["Delimiter"] = delimiter
+        if continuation_token:
+            kwargs["ContinuationToken"] = continuation_token
+        response = s3.list_objects_v2(**kwargs)
+        logger.info(f"Received {response.get('KeyCount')} objects from S3 for prefix '{prefix}'.")
+        if "Contents" not in response and "CommonPrefixes" not in response:
+            logger.warning(f"Invalid response from S3; missing 'Contents' key. kwargs={kwargs}.")
+        return response
+
+    def _get_remote_files(self, response: Mapping[str, Any]) -> Iterable[RemoteFile]:
+        for file in response.get("Contents", []):
+            if self._is_folder(file):
+                continue
+            yield RemoteFile(uri=file["Key"], last_modified=file["LastModified"].astimezone(pytz.utc).replace(tzinfo=None))
 
 
 def _get_s3_compatible_client_args(config: Config) -> dict:
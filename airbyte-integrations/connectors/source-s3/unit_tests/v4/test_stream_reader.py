@@ -5,6 +5,8 @@
 
 import io
 import logging
+import threading
+import time
 from datetime import datetime
 from itertools import product
 from typing import Any, Dict, List, Optional, Set
@@ -18,7 +20,7 @@ from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from botocore.stub import Stubber
 from pydantic import AnyUrl
 from source_s3.v4.config import Config
-from source_s3.v4.stream_reader import SourceS3StreamReader
+from source_s3.v4.stream_reader import MAX_CONCURRENT_LIST_REQUESTS, SourceS3StreamReader
 
 logger = logging.Logger("")
 
@@ -152,6 +154,99 @@ def test_given_multiple_pages_when_get_matching_files_then_pass_continuation_tok
     assert "ContinuationToken" in boto3_client_mock.return_value.list_objects_v2.call_args_list[1].kwargs
 
 
+def _sharded_bucket_listing(**kwargs) -> Dict[str, Any]:
+    """A bucket with a top-level file and two "directories", the first one listed in two pages"""
+    prefix, token = kwargs.get("Prefix"), kwargs.get("ContinuationToken")
+    if kwargs.get("Delimiter"):
+        return {
+            "Contents": [{"Key": "file0.csv", "LastModified": datetime(2023, 1, 1)}],
+            "CommonPrefixes": [{"Prefix": "a/"}, {"Prefix": "b/"}],
+            "KeyCount": 3,
+        }
+    if prefix == "a/" and not token:
+        return {
+            "Contents": [{"Key": "a/", "LastModified": datetime(2023, 1, 1)}, {"Key": "a/file1.csv", "LastModified": datetime(2023, 1, 2)}],
+            "KeyCount": 2,
+            "NextContinuationToken": "a-token",
+        }
+    if prefix == "a/":
+        return {"Contents": [{"Key": "a/b/file2.jsonl", "LastModified": datetime(2023, 1, 3)}], "KeyCount": 1}
+    return {"Contents": [{"Key": "b/file3.csv", "LastModified": datetime(2023, 1, 4)}], "KeyCount": 1}
+
+
+def _get_reader(start_date: Optional[str] = None) -> SourceS3StreamReader:
+    reader = SourceS3StreamReader()
+    reader.config = Config(
+        bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[], endpoint=None, start_date=start_date
+    )
+    return reader
+
+
+@patch("boto3.client")
+def test_get_matching_files_lists_common_prefixes_as_shards(boto3_client_mock) -> None:
+    boto3_client_mock.return_value.list_objects_v2.side_effect = _sharded_bucket_listing
+
+    files = list(_get_reader().get_matching_files(["**/*.csv"], None, logger))
+
+    assert {f.uri for f in files} == {"file0.csv", "a/file1.csv", "b/file3.csv"}
+    calls = [call.kwargs for call in boto3_client_mock.return_value.list_objects_v2.call_args_list]
+    assert calls[0] == {"Bucket": "test", "Delimiter": "/"}
+    assert {"Bucket": "test", "Prefix": "a/"} in calls
+    assert {"Bucket": "test", "Prefix": "a/", "ContinuationToken": "a-token"} in calls
+    assert {"Bucket": "test", "Prefix": "b/"} in calls
+    assert len(calls) == 4
+
+
+@patch("boto3.client")
+def test_get_matching_files_yields_files_sorted_by_key(boto3_client_mock) -> None:
+    def list_objects_v2(**kwargs):
+        if kwargs.get("Prefix") == "a/":
+            # the first shard is listed last
+            time.sleep(0.05)
+        return _sharded_bucket_listing(**kwargs)
+
+    boto3_client_mock.return_value.list_objects_v2.side_effect = list_objects_v2
+
+    files = list(_get_reader().get_matching_files(["**"], None, logger))
+
+    assert [f.uri for f in files] == ["a/b/file2.jsonl", "a/file1.csv", "b/file3.csv", "file0.csv"]
+
+
+@patch("boto3.client")
+def test_get_matching_files_filters_by_start_date(boto3_client_mock) -> None:
+    boto3_client_mock.return_value.list_objects_v2.side_effect = _sharded_bucket_listing
+
+    files = list(_get_reader(start_date="2023-01-03T00:00:00.000000Z").get_matching_files(["**"], None, logger))
+
+    assert {f.uri for f in files} == {"a/b/file2.jsonl", "b/file3.csv"}
+
+
+@patch("boto3.client")
+def test_get_matching_files_bounds_concurrent_requests(boto3_client_mock) -> None:
+    n_shards = 3 * MAX_CONCURRENT_LIST_REQUESTS
+    lock = threading.Lock()
+    in_flight, max_in_flight = 0, 0
+
+    def list_objects_v2(**kwargs):
+        nonlocal in_flight, max_in_flight
+        if kwargs.get("Delimiter"):
+            return {"CommonPrefixes": [{"Prefix": f"{i}/"} for i in range(n_shards)], "KeyCount": n_shards}
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return {"Contents": [{"Key": f"{kwargs['Prefix']}file.csv", "LastModified": datetime(2023, 1, 1)}], "KeyCount": 1}
+
+    boto3_client_mock.return_value.list_objects_v2.side_effect = list_objects_v2
+
+    files = list(_get_reader().get_matching_files(["**"], None, logger))
+
+    assert len(files) == n_shards
+    assert 1 < max_in_flight <= MAX_CONCURRENT_LIST_REQUESTS
+
+
 def test_get_matching_files_exception():
     reader = SourceS3StreamReader()
     reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])